@@ -19,6 +19,7 @@ import torch
 from agr4bs.agents import ExternalAgent, ContextChange, AgentType
 from agr4bs.roles import Role, RoleType
 from agr4bs.models.eth2.blockchain import Attestation
+from agr4bs.models.eth2.constants import BEACON_ATTESTATION_TOPIC
 from agr4bs.common import export, on
 from agr4bs.network.messages import DiffuseBlockEndorsement
 from agr4bs.events import REQUEST_BLOCK_ENDORSEMENT, NEXT_SLOT
@@ -169,7 +170,6 @@ class MaliciousBlockEndorser(Role):
         target = blockchain.get_checkpoint_from_epoch(agent.context['epoch'], root)
 
         attestation = Attestation(agent.name, agent.context['epoch'], agent.context['slot'], agent.context['index'], root.hash, source.hash, target.hash)
-        validators = agent.context['beacon_states'][root.hash].validators
-        
-        agent.send_system_message(DiffuseBlockEndorsement(agent.name, attestation), validators)
+
+        agent.publish(DiffuseBlockEndorsement(agent.name, attestation), BEACON_ATTESTATION_TOPIC)
  
\ No newline at end of file
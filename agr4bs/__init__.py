@@ -10,9 +10,9 @@ from .blockchain.transaction import ITransaction
 from .common.investment import Investment
 from .blockchain.payload import Payload
 from .blockchain.blockchain import IBlockchain
-from .state import State
+from .state import State, ColumnarState, SnapshotState
 from .state import StateChange
-from .state import Account
+from .state import Account, AccountView
 from .state import Receipt
 from .vm import IVM
 from .environment.environment import Environment
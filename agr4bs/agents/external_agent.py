@@ -6,11 +6,12 @@ import datetime
 import pickle
 
 from collections import defaultdict
+from types import MethodType
 from typing import Union
 from ..events.events import RUN_SCHEDULABLE
-from ..network.messages import RunSchedulable
-from ..events import INIT, STOP_SIMULATION, RECEIVE_MESSAGE, SEND_MESSAGE, CLEANUP
-from ..network import Message
+from ..events import INIT, STOP_SIMULATION, RECEIVE_MESSAGE, SEND_MESSAGE, CLEANUP, RECEIVE_BUNDLE, FLUSH_OUTBOUND
+from ..network import Message, Envelope, Broadcast, Publication
+from ..network.messages import Bundle, FlushOutbound
 from .agent import Agent, AgentType
 from ..blockchain import IBlock
 from .schedulable import Schedulable
@@ -23,6 +24,11 @@ class ExternalAgent(Agent):
 
         An ExternalAgent is a participant in the Blockchain (i.e., EOA).
         It may contribute to the system or simply interact with it autonomously.
+
+        If coalescing_window is set (e.g., to a zero timedelta), the messages
+        sent to the same recipient are buffered for coalescing_window and sent
+        as a single Bundle, which the recipient unpacks in order. A zero
+        window coalesces the messages sent at the same date.
     """
 
     def __init__(self, name: str, genesis: IBlock, factory: 'IFactory'):
@@ -35,16 +41,26 @@ class ExternalAgent(Agent):
         self.drop_time = 2
         self.max_inbound_peers = 20
         self.max_outbound_peers = 5
+        self.coalescing_window = None
 
         self._network = factory.build_network()
+        self._seen = self._network.build_seen_set()
+        self._duplicates_suppressed = 0
         self._event_handlers = defaultdict(list)
+        self._dispatch_table = {}
+        self._batch_table = {}
         self._schedulables = {}
+        self._timers = {}
+        self._outbound = {}
+        self._flush_scheduled = False
         self._exit = False
         self._date = None
         self._initial_date = None
 
         self._add_event_handler(STOP_SIMULATION, self.stop_simulation_handler)
         self._add_event_handler(RUN_SCHEDULABLE, self.run_schedulable_handler)
+        self._add_event_handler(RECEIVE_BUNDLE, self.bundle_handler)
+        self._add_event_handler(FLUSH_OUTBOUND, self.flush_outbound_handler)
 
     @property
     def date(self):
@@ -60,6 +76,35 @@ class ExternalAgent(Agent):
         """
         self._date = new_date
 
+    @property
+    def network(self) -> 'Network':
+        """
+            Get the Network the agent is connected to
+        """
+        return self._network
+
+    @property
+    def duplicates_suppressed(self) -> int:
+        """
+            Get the number of duplicate gossip deliveries dropped by the agent
+        """
+        return self._duplicates_suppressed
+
+    @property
+    def clock(self) -> 'Clock':
+        """
+            Get the Clock in which the agent dates are expressed
+        """
+        return self._network.clock
+
+    @property
+    def current_datetime(self) -> datetime.datetime:
+        """
+            Get the current date from the agent point of vue as a datetime,
+            regardless of the Clock in use
+        """
+        return self._network.clock.to_datetime(self._date)
+
     def add_role(self, role: 'Role') -> bool:
         super().add_role(role)
 
@@ -87,17 +132,77 @@ class ExternalAgent(Agent):
 
         if handler not in self._event_handlers[event]:
             self._event_handlers[event].append(handler)
+            self._compile_dispatch_table()
 
     def _remove_event_handler(self, event, handler):
         self._event_handlers[event].remove(handler)
+        self._compile_dispatch_table()
 
-    def _add_schedulable(self, name: str, frequency: int, handler: callable):
+    def _compile_dispatch_table(self):
+        """
+            Compile the registered event handlers into the dispatch table :
+            every event maps to the tuple of its handlers, pre-bound to the agent.
+            Events without any handler are left out of the table, which makes
+            observer events (RECEIVE_MESSAGE, SEND_MESSAGE) free unless a Role
+            subscribes to them.
+
+            Batch handlers (see on_batch) are called with a batch of a single
+            occurrence when fired individually. Events with batch handlers are
+            also compiled in the batch table as a (handlers, batch_handlers) pair.
+        """
+        self._dispatch_table = {}
+        self._batch_table = {}
+
+        for event, handlers in self._event_handlers.items():
+
+            if len(handlers) == 0:
+                continue
+
+            single = []
+            plain = []
+            batch = []
+
+            for handler in handlers:
+                bound = MethodType(handler, self)
+
+                if hasattr(handler, 'on_batch'):
+                    batch.append(bound)
+                    single.append(self._single_occurrence(bound))
+                else:
+                    plain.append(bound)
+                    single.append(bound)
+
+            self._dispatch_table[event] = tuple(single)
+
+            if len(batch) > 0:
+                self._batch_table[event] = (tuple(plain), tuple(batch))
+
+    @staticmethod
+    def _single_occurrence(batch_handler):
+        """
+            Adapt a bound batch handler to a single occurrence of its event
+        """
+        def handler(*args):
+            accepted = batch_handler([args])
+
+            if isinstance(accepted, list):
+                return accepted[0]
+
+            return accepted
+
+        return handler
+
+    def _add_schedulable(self, name: str, frequency: datetime.timedelta, handler: callable):
+        frequency = self._network.clock.duration(frequency)
         self._schedulables[name] = Schedulable(frequency, handler)
 
     def _remove_schedulable(self, name):
         if name in self._schedulables:
             del self._schedulables[name]
 
+        if name in self._timers:
+            self._network.cancel_timer(self._timers.pop(name))
+
     @staticmethod
     def stop_simulation_handler(agent: 'ExternalAgent'):
         """
@@ -115,62 +220,342 @@ class ExternalAgent(Agent):
         if behavior_name in agent._schedulables:
             schedulable = agent._schedulables[behavior_name]
             schedulable.handler(agent)
-            agent.schedule_behavior(behavior_name, schedulable.frequency)
+
+            if behavior_name in agent._schedulables:
+                agent._timers[behavior_name] = agent.schedule_behavior(behavior_name, schedulable.frequency)
+
+    @staticmethod
+    def bundle_handler(agent: 'ExternalAgent', messages: list[Message]):
+        """
+            Core event handler : RECEIVE_BUNDLE
+            Handle the messages of a Bundle in order
+        """
+        for message in messages:
+            agent.handle_message(Envelope(message, agent.name, agent.date))
+
+    @staticmethod
+    def flush_outbound_handler(agent: 'ExternalAgent'):
+        """
+            Core event handler : FLUSH_OUTBOUND
+            Send the buffered outbound messages
+        """
+        agent.flush_outbound()
 
     def fire_event(self, event, *args, **kwargs):
         """
             Fire a specific event and wait for the handler(s) to finish
         """
-        if event in self._event_handlers:
-            for event_handler in self._event_handlers[event]:
-                event_handler(self, *args, **kwargs)
+        handlers = self._dispatch_table.get(event)
+
+        if handlers is not None:
+            for handler in handlers:
+                handler(*args, **kwargs)
 
     def send_message(self, message: Message, to: Union[str, list[str]], no_drop=False):
         """
             Send a Message to one or many agents
+
+            The Message is frozen (copied) once and shared by all the recipients,
+            each of them receiving a lightweight Envelope pointing to it.
         """
         if not isinstance(to, list):
             to = [to]
 
+        serialized = pickle.dumps(message, -1)
+        payload = pickle.loads(serialized)
+        size = len(serialized)
+
+        if self.coalescing_window is not None:
+            self._buffer(payload, to, no_drop, size)
+        else:
+            for recipient in to:
+                self._network.send_message(Envelope(payload, recipient, self._date), no_drop=no_drop, size=size)
+
+        if SEND_MESSAGE in self._dispatch_table:
+            self.fire_event(SEND_MESSAGE, to)
+
+    def _buffer(self, payload: Message, to: list[str], no_drop: bool, size: int):
+        """
+            Buffer a frozen Message in the outbound queues of its recipients
+            and schedule the flush of the queues
+        """
+        outbound = self._outbound
+
         for recipient in to:
-            _message = pickle.loads(pickle.dumps(message, -1))
-            _message.recipient = recipient
-            _message.date = self._date
-            self._network.send_message(_message, no_drop=no_drop)
+            buffered = outbound.get(recipient)
+
+            if buffered is None:
+                outbound[recipient] = [(payload, no_drop, size)]
+            else:
+                buffered.append((payload, no_drop, size))
+
+        if self._flush_scheduled is False:
+            self._flush_scheduled = True
+            self.send_system_message(FlushOutbound(self.name), self.name, delay=self.coalescing_window)
+
+    def flush_outbound(self):
+        """
+            Send the buffered outbound messages : a single message is sent
+            as is, several messages to the same recipient as a Bundle
+        """
+        outbound = self._outbound
+        self._outbound = {}
+        self._flush_scheduled = False
+
+        for recipient, buffered in outbound.items():
+
+            if len(buffered) == 1:
+                payload, no_drop, size = buffered[0]
+            else:
+                payload = Bundle(self.name, [message for message, _, _ in buffered])
+                no_drop = any(no_drop for _, no_drop, _ in buffered)
+                size = sum(size for _, _, size in buffered)
+
+            self._network.send_message(Envelope(payload, recipient, self._date), no_drop=no_drop, size=size)
+
+    def diffuse(self, message: Message, to: Union[str, list[str]], no_drop=False):
+        """
+            Start the gossip of a Message through the given peers
+
+            In oracle gossip mode, the Network delivers the Message to every
+            agent reachable through the static topology at once, otherwise
+            the Message is sent to the peers, which relay it.
+        """
+        if not self._network.can_oracle_gossip():
+            self.send_message(message, to, no_drop=no_drop)
+            return
+
+        if not isinstance(to, list):
+            to = [to]
 
-        self.fire_event(SEND_MESSAGE, to)
+        payload = pickle.loads(pickle.dumps(message, -1))
+        self._network.send_gossip(payload, self.name, self._date, no_drop=no_drop)
+
+        if SEND_MESSAGE in self._dispatch_table:
+            self.fire_event(SEND_MESSAGE, to)
+
+    def relay(self, message: Message, to: Union[str, list[str]], no_drop=False):
+        """
+            Relay a gossiped Message to the given peers
+
+            In oracle gossip mode, the Network already delivered the Message
+            to every reachable agent and nothing is sent.
+        """
+        if not self._network.can_oracle_gossip():
+            self.send_message(message, to, no_drop=no_drop)
+            return
+
+        if SEND_MESSAGE in self._dispatch_table:
+            self.fire_event(SEND_MESSAGE, to if isinstance(to, list) else [to])
 
     def send_system_message(self, message: Message, to: Union[str, list[str]], delay=None):
         """
             Send a Message to one or many agents
+
+            Sending to several agents posts a single Broadcast entry which
+            the Network expands to each recipient on delivery.
         """
         if not isinstance(to, list):
             to = [to]
 
+        if len(to) > 1:
+            date = self._date
+
+            if delay is not None:
+                date = date + self._network.clock.duration(delay)
+
+            self._network.send_system_broadcast(Broadcast(message, list(to), date))
+            return
+
         for recipient in to:
             _message = copy.copy(message)
             _message.recipient = recipient
             _message.date = self._date
 
             if delay is not None:
-                _message.date = _message.date + delay
+                _message.date = _message.date + self._network.clock.duration(delay)
 
             self._network.send_system_message(_message)
 
+    def subscribe(self, topic) -> bool:
+        """
+            Subscribe the agent to a topic (see PubSubRouter)
+
+            :param topic: the topic to subscribe to (e.g., a Group topic)
+            :returns: wether the agent was not already subscribed
+            :rtype: bool
+        """
+        return self._network.router.subscribe(topic, self.name)
+
+    def unsubscribe(self, topic) -> bool:
+        """
+            Unsubscribe the agent from a topic
+
+            :param topic: the topic to unsubscribe from
+            :returns: wether the agent was subscribed
+            :rtype: bool
+        """
+        return self._network.router.unsubscribe(topic, self.name)
+
+    def publish(self, message: Message, topic, delay=None, direct: bool = False):
+        """
+            Publish a Message to every agent subscribed to a topic
+
+            The Message is shared by all the subscribers and posted as a
+            single Publication entry, which the Network expands to the
+            subscribers of the topic on delivery. A direct Publication
+            reaches every subscriber at once, outside of the mesh.
+        """
+        date = self._date
+
+        if delay is not None:
+            date = date + self._network.clock.duration(delay)
+
+        self._network.publish(Publication(message, topic, date, direct))
+
+    def _is_duplicate(self, content_id) -> bool:
+        """
+            Check if a gossiped content was already accepted
+        """
+        if content_id is None or content_id not in self._seen:
+            return False
+
+        # Refresh the content in the LRU order of the SeenSet
+        self._seen.add(content_id)
+        self._duplicates_suppressed = self._duplicates_suppressed + 1
+        self._network.record_duplicate()
+
+        return True
+
     def handle_message(self, message: Message):
         """
             Handle a given message by firing the associated events
+
+            If the Network enables duplicate suppression, duplicate gossip
+            is dropped before the handlers of its event run. The RECEIVE_MESSAGE
+            observers still see it, so that peer activity accounts for relays.
+
+            A gossiped content is only recorded once its handlers accepted it :
+            a handler returning False rejects the content (e.g., a block whose
+            parent is unknown), which is handled again if delivered later.
+        """
+        dispatch_table = self._dispatch_table
+
+        if RECEIVE_MESSAGE in dispatch_table:
+            for handler in dispatch_table[RECEIVE_MESSAGE]:
+                handler(message.origin)
+
+        content_id = None
+
+        if self._seen is not None:
+            content_id = message.content_id
+
+            if self._is_duplicate(content_id):
+                return
+
+        handlers = dispatch_table.get(message.event)
+        accepted = True
+
+        if handlers is not None:
+            for handler in handlers:
+                if handler(*message.data) is False:
+                    accepted = False
+
+        if content_id is not None and accepted:
+            self._seen.add(content_id)
+
+    def handle_messages(self, messages: list[Message]):
+        """
+            Handle a batch of messages carrying the same event and delivered
+            at the same date.
+
+            Batch handlers are called once with the data of every message,
+            after the regular handlers were called for each message. Duplicate
+            gossip is left out of the batch (see handle_message), and a batch
+            handler returning a list of booleans rejects the contents of the
+            batch marked False.
+        """
+        event = messages[0].event
+
+        if event not in self._batch_table:
+            for message in messages:
+                self.handle_message(message)
+            return
+
+        handlers, batch_handlers = self._batch_table[event]
+        observers = self._dispatch_table.get(RECEIVE_MESSAGE, ())
+        batch = []
+        content_ids = []
+        batched = set()
+
+        for message in messages:
+            for observer in observers:
+                observer(message.origin)
+
+            content_id = None
+
+            if self._seen is not None:
+                content_id = message.content_id
+
+                if self._is_duplicate(content_id):
+                    continue
+
+                if content_id in batched:
+                    self._duplicates_suppressed = self._duplicates_suppressed + 1
+                    self._network.record_duplicate()
+                    continue
+
+                if content_id is not None:
+                    batched.add(content_id)
+
+            accepted = True
+
+            for handler in handlers:
+                if handler(*message.data) is False:
+                    accepted = False
+
+            batch.append(message.data)
+            content_ids.append(content_id if accepted else None)
+
+        if len(batch) == 0:
+            return
+
+        for batch_handler in batch_handlers:
+            accepted = batch_handler(batch)
+
+            if isinstance(accepted, list):
+                content_ids = [content_id if ok is not False else None for content_id, ok in zip(content_ids, accepted)]
+
+        if self._seen is not None:
+            for content_id in content_ids:
+                if content_id is not None:
+                    self._seen.add(content_id)
+
+    def schedule_behavior(self, behavior_name: str, frequency: datetime.timedelta) -> int:
         """
-        self.fire_event(RECEIVE_MESSAGE, message.origin)
-        self.fire_event(message.event, *message.data)
+            Schedule the execution of one of the agent behaviors after a given delay
 
-    def schedule_behavior(self, behavior_name: str, frequency: datetime.timedelta):
-        message = RunSchedulable(self.name, behavior_name)
-        self.send_system_message(message, self.name, delay=frequency)
+            :returns: the handle of the timer, which can be cancelled with cancel_behavior
+            :rtype: int
+        """
+        date = self._date + self._network.clock.duration(frequency)
+
+        return self._network.schedule_timer(self.name, behavior_name, date)
+
+    def cancel_behavior(self, handle: int) -> bool:
+        """
+            Cancel the scheduled execution of a behavior
+
+            :param handle: the handle returned by schedule_behavior
+            :type handle: int
+            :returns: wether the execution was still pending
+            :rtype: bool
+        """
+        return self._network.cancel_timer(handle)
 
     def _init_schedulables(self):
         for behavior_name, schedulable in self._schedulables.items():
-            self.schedule_behavior(behavior_name, schedulable.frequency)
+            self._timers[behavior_name] = self.schedule_behavior(behavior_name, schedulable.frequency)
 
     def init(self, date):
         """
@@ -186,3 +571,14 @@ class ExternalAgent(Agent):
             Cleanup the agent
         """
         self.fire_event(CLEANUP)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['_dispatch_table']
+        del state['_batch_table']
+
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._compile_dispatch_table()
@@ -2,9 +2,8 @@
     InternalAgent file class implementation
 """
 from typing import Callable
-from deepdiff import DeepDiff, Delta
-from agr4bs.state.account import Account
 from agr4bs.state.state_change import UpdateAccountStorage
+from agr4bs.state.storage import TrackedStorage
 from ..common import Serializable
 from .agent import Agent, AgentType
 import inspect
@@ -129,7 +128,7 @@ class InternalAgent(Agent):
         super().__init__(name, AgentType.INTERNAL_AGENT)
         self._deployed = False
         self.ctx = None
-        self.account = None
+        self.storage = None
 
     @property
     def deployed(self):
@@ -199,19 +198,19 @@ class InternalAgent(Agent):
         return hasattr(function, 'payable')
 
     def get_storage_at(self, key: str) -> any:
-        return self.ctx.state.get_account_storage_at(self.ctx.to, key)
+        return self.storage.get(key)
 
     def set_storage_at(self, key: str, value: any):
-        self.account.set_storage_at(key, value)
+        self.storage[key] = value
 
     def call(self, to: str, calldata: InternalAgentCalldata, value: int = 0) -> InternalAgentResponse:
 
-        account = self.ctx.state.get_account(self.ctx.to)
         new_context = self.ctx.vm.get_next_context(
-            self.ctx, account.name, to, value)
+            self.ctx, self.ctx.to, to, value)
 
-        if account.storage != self.account.storage:
-            change = self._get_account_changes(account, self.account)
+        change = self._get_account_changes()
+
+        if change is not None:
             new_context.state.apply_state_change(change)
 
         response = self.ctx.vm.call(calldata, new_context)
@@ -223,12 +222,12 @@ class InternalAgent(Agent):
         return response
 
     def deploy(self, deployement: InternalAgentDeployement, value: int = 0) -> InternalAgentResponse:
-        account = self.ctx.state.get_account(self.ctx.to)
         new_context = self.ctx.vm.get_next_context(
-            self.ctx, account.name, None, value)
+            self.ctx, self.ctx.to, None, value)
 
-        if account.storage != self.account.storage:
-            change = self._get_account_changes(account, self.account)
+        change = self._get_account_changes()
+
+        if change is not None:
             new_context.state.apply_state_change(change)
 
         response = self.ctx.vm.deploy(deployement, new_context)
@@ -242,7 +241,7 @@ class InternalAgent(Agent):
     def transfer(self, to: str, value: int) -> InternalAgentResponse:
 
         new_context = self.ctx.vm.get_next_context(
-            self.ctx, self.account.name, to, value)
+            self.ctx, self.ctx.to, to, value)
 
         response = self.ctx.vm.transfer(new_context)
 
@@ -261,12 +260,15 @@ class InternalAgent(Agent):
     def value(self) -> str:
         return self.ctx.value
 
-    def _get_account_changes(self, previous: Account, current: Account):
+    def _get_account_changes(self) -> UpdateAccountStorage:
+        """
+            Get the storage writes made since the InternalAgent was entered
+            (None if there is none)
+        """
+        writes = self.storage.freeze()
 
-        if previous.storage != current.storage:
-            delta_apply = Delta(DeepDiff(previous.storage, current.storage))
-            delta_revert = Delta(DeepDiff(current.storage, previous.storage))
-            return UpdateAccountStorage(self.name, delta_apply, delta_revert)
+        if len(writes) > 0:
+            return UpdateAccountStorage(self.name, writes=writes)
 
         return None
 
@@ -283,10 +285,9 @@ class InternalAgent(Agent):
             return error_response
 
         previous_ctx = self.ctx
+        previous_storage = self.storage
         self.ctx = ctx
-
-        previous_account = ctx.state.get_account(ctx.to)
-        self.account = ctx.state.get_account(ctx.to)
+        self.storage = ctx.state.get_tracked_storage(ctx.to)
 
         if calldata.function == "constructor":
             if self._deployed is False:
@@ -295,12 +296,12 @@ class InternalAgent(Agent):
                 raise ValueError("Constructor already called")
 
         response = getattr(self, calldata.function)(**calldata.parameters)
-        change = self._get_account_changes(previous_account, self.account)
+        change = self._get_account_changes()
 
         if change is not None:
             self.ctx.changes.append(change)
 
         self.ctx = previous_ctx
-        self.account = previous_account
+        self.storage = previous_storage
 
         return response
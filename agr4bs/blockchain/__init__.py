@@ -2,7 +2,7 @@
     agr4bs.blockchain submodule
 """
 
-from .block import IBlock, IBlockHeader
+from .block import IBlock, IBlockHeader, CompactBlock
 from .blockchain import IBlockchain
-from .transaction import ITransaction
+from .transaction import ITransaction, lookup_transaction
 from .payload import Payload
@@ -3,6 +3,7 @@
     Block file class implementation
 """
 
+import copy
 import hashlib
 import pickle
 from ..common import Serializable
@@ -19,6 +20,66 @@ class IBlockHeader(Serializable):
         self._parent_hash = parent_hash
         self._hash = hash
 
+
+class CompactBlock(IBlockHeader):
+
+    """
+        Compact Block class implementation :
+
+        A CompactBlock carries everything a Block holds but its Transactions,
+        which are replaced by their (origin, nonce, hash) identifiers. A
+        receiver rebuilds the Block from the Transactions it already knows
+        and only needs to fetch the missing ones.
+    """
+
+    def __init__(self, block: 'IBlock') -> None:
+        super().__init__(block.parent_hash, block.creator, block.hash)
+        self._transaction_ids = [(tx.origin, tx.nonce, tx.hash) for tx in block.transactions]
+        self._block = copy.copy(block)
+        self._block._transactions = []  # pylint: disable=protected-access
+
+    @property
+    def hash(self) -> str:
+        """
+            Get the hash of the compacted Block
+        """
+        return self._hash
+
+    @property
+    def parent_hash(self) -> str:
+        """
+            Get the hash of the parent of the compacted Block
+        """
+        return self._parent_hash
+
+    @property
+    def creator(self) -> str:
+        """
+            Get the creator of the compacted Block
+        """
+        return self._creator
+
+    @property
+    def transaction_ids(self) -> list[tuple[str, int, str]]:
+        """
+            Get the (origin, nonce, hash) identifiers of the Transactions
+            of the compacted Block, in Block order
+        """
+        return self._transaction_ids
+
+    def rebuild(self, transactions: list[ITransaction]) -> 'IBlock':
+        """ Rebuild the full Block from its Transactions
+
+            :param transactions: the Transactions matching transaction_ids
+            :type transactions: list[ITransaction]
+            :returns: the rebuilt Block
+            :rtype: IBlock
+        """
+        block = copy.copy(self._block)
+        block._transactions = list(transactions)  # pylint: disable=protected-access
+
+        return block
+
 class IBlock(Serializable):
 
     """
@@ -55,6 +116,12 @@ class IBlock(Serializable):
         """
         return IBlockHeader(self._parent_hash, self._creator, self._hash)
         
+    def compact(self) -> CompactBlock:
+        """
+            Get the CompactBlock of the block
+        """
+        return CompactBlock(self)
+
     @property
     def parent_hash(self) -> "str":
         """ Get the hash of the parent Block
@@ -120,3 +120,16 @@ class ITransaction(Serializable):
             return False
 
         return self._hash == __o.compute_hash()
+
+
+def lookup_transaction(tx_pool: dict[str, dict[int, ITransaction]], origin: str, nonce: int, tx_hash: str) -> ITransaction:
+    """
+        Find a transaction in a tx_pool, indexed by origin and nonce,
+        from its (origin, nonce, hash) identifier (None if unknown)
+    """
+    tx = tx_pool.get(origin, {}).get(nonce)
+
+    if tx is None or tx.hash != tx_hash:
+        return None
+
+    return tx
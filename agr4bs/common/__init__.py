@@ -5,4 +5,5 @@
 from .investment import Investment
 from .serializable import Serializable
 from .iterable_enum_meta import IterableEnumMeta
-from .decorators import export, on, every, payable
+from .decorators import export, on, on_batch, every, payable
+from .clock import Clock, TickClock
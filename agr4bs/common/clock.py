@@ -0,0 +1,134 @@
+"""
+    Clock file class implementation
+"""
+
+import datetime
+
+
+class Clock:
+
+    """
+        Clock class implementation :
+
+        A Clock defines how simulation dates and durations are represented.
+        The default Clock uses datetime dates and timedelta durations, which
+        is what roles and end conditions historically expect.
+
+        Every component that performs time arithmetic (Network, ExternalAgent,
+        Scheduler) goes through the Clock of the Network so that the
+        representation can be swapped for a faster one (see TickClock).
+    """
+
+    def __init__(self):
+        self._origin = None
+
+    @property
+    def origin(self) -> datetime.datetime:
+        """
+            Get the datetime at which the simulation started
+        """
+        return self._origin
+
+    def start(self, origin: datetime.datetime):
+        """
+            Bind the Clock to the simulation start and return
+            the initial simulation date.
+
+            :param origin: the datetime at which the simulation starts
+            :type origin: datetime.datetime
+        """
+        self._origin = origin
+
+        return origin
+
+    def duration(self, duration: datetime.timedelta):
+        """
+            Convert a timedelta (or an already converted duration)
+            to a Clock duration
+        """
+        return duration
+
+    def milliseconds(self, milliseconds: int):
+        """
+            Get the Clock duration of a given number of milliseconds
+        """
+        return datetime.timedelta(milliseconds=milliseconds)
+
+    def to_seconds(self, duration) -> float:
+        """
+            Convert a Clock duration to a number of seconds
+        """
+        return duration.total_seconds()
+
+    def to_timedelta(self, duration) -> datetime.timedelta:
+        """
+            Convert a Clock duration to a timedelta
+        """
+        return duration
+
+    def to_datetime(self, date) -> datetime.datetime:
+        """
+            Convert a Clock date to a datetime
+        """
+        return date
+
+    def from_datetime(self, date: datetime.datetime):
+        """
+            Convert a datetime to a Clock date
+        """
+        return date
+
+
+class TickClock(Clock):
+
+    """
+        TickClock class implementation :
+
+        Opt-in Clock where dates are integer ticks elapsed since the
+        simulation start and durations are integer numbers of ticks.
+
+        Integer comparisons and additions are much cheaper than their
+        datetime / timedelta counterparts, which matters in the event loop.
+
+        :param resolution: the duration of a single tick (1 microsecond by default)
+        :type resolution: datetime.timedelta
+    """
+
+    def __init__(self, resolution: datetime.timedelta = datetime.timedelta(microseconds=1)):
+        super().__init__()
+        self._resolution = resolution
+        self._ticks_per_millisecond = datetime.timedelta(milliseconds=1) / resolution
+        self._ticks_per_second = datetime.timedelta(seconds=1) / resolution
+
+    @property
+    def resolution(self) -> datetime.timedelta:
+        """
+            Get the duration of a single tick
+        """
+        return self._resolution
+
+    def start(self, origin: datetime.datetime) -> int:
+        self._origin = origin
+
+        return 0
+
+    def duration(self, duration) -> int:
+        if isinstance(duration, datetime.timedelta):
+            return duration // self._resolution
+
+        return duration
+
+    def milliseconds(self, milliseconds: int) -> int:
+        return int(milliseconds * self._ticks_per_millisecond)
+
+    def to_seconds(self, duration: int) -> float:
+        return duration / self._ticks_per_second
+
+    def to_timedelta(self, duration: int) -> datetime.timedelta:
+        return duration * self._resolution
+
+    def to_datetime(self, date: int) -> datetime.datetime:
+        return self._origin + date * self._resolution
+
+    def from_datetime(self, date: datetime.datetime) -> int:
+        return (date - self._origin) // self._resolution
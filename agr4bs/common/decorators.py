@@ -36,6 +36,37 @@ class on:
         return function
 
 
+class on_batch:
+
+    """
+        The on_batch decorator binds the execution of the decorated function
+        to the given event, like the on decorator, but the function is
+        called once for all the occurrences of the event delivered to the
+        agent at the same date, when the Scheduler batches deliveries.
+
+        The decorated function receives the list of the arguments tuples of
+        every occurrence (a single one when the event is not batched).
+    """
+
+    def __init__(self, event_name):
+        self._event_name = event_name
+
+    def __call__(self, function):
+
+        if hasattr(function, 'on'):
+            raise ValueError(
+                "Behaviors cannot be bound to more than one event")
+
+        if hasattr(function, 'every'):
+            raise ValueError(
+                "Behaviors can only be bound to `on` or `every` but not both")
+
+        function.on = self._event_name
+        function.on_batch = True
+
+        return function
+
+
 class every:
 
     """
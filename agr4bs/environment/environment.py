@@ -20,16 +20,30 @@ class Environment(ExternalAgent):
     def __init__(self, factory: IFactory):
         super().__init__("environment", None, factory)
         self._agents = {}
+        self._agents_names = None
         self._network.register_agent(self)
         self._agent_tasks = []
         self._running = False
 
     @property
-    def agents_names(self):
+    def agents_names(self) -> list[str]:
         """
             Get the list of agent names
+
+            The list is cached until the next addition or removal of an
+            agent and is shared between callers : it MUST NOT be mutated.
         """
-        return list(self._agents.keys())
+        if self._agents_names is None:
+            self._agents_names = list(self._agents.keys())
+
+        return self._agents_names
+
+    @property
+    def agents_count(self) -> int:
+        """
+            Get the number of agents in the Environment
+        """
+        return len(self._agents)
 
     @property
     def running(self):
@@ -50,11 +64,38 @@ class Environment(ExternalAgent):
                 "Attempting to add an already existing agent to the environment")
 
         self._agents[agent.name] = agent
+        self._agents_names = None
         self._network.register_agent(agent)
 
         if self._running is True:
             agent.init(self._date)
 
+    def add_agents(self, agents: list[ExternalAgent]):
+        """ Add several Agents to the Environment at once
+
+            Agents added while the Environment is running are initialized
+            at the current date.
+
+            :param agents: the Agents to add to the Environment
+            :type agents: list[ExternalAgent]
+            :raises ValueError: If an agent is added twice to the Environment
+        """
+        for agent in agents:
+            self.add_agent(agent)
+
+    def remove_agents(self, agents: list[ExternalAgent]):
+        """ Remove several Agents from the Environment at once
+
+            The messages and timers still queued for the removed Agents
+            are discarded lazily by the Network.
+
+            :param agents: the Agents to remove from the Environment
+            :type agents: list[ExternalAgent]
+            :raises ValueError: If an agent is not present in the Environment.
+        """
+        for agent in agents:
+            self.remove_agent(agent)
+
     def remove_agent(self, agent: ExternalAgent):
         """ Remove an Agent from the Environment
 
@@ -70,6 +111,7 @@ class Environment(ExternalAgent):
         agent.cleanup()
 
         del self._agents[agent.name]
+        self._agents_names = None
 
     def has_agent(self, agent: ExternalAgent) -> bool:
         """ Check if an agent is part of the Environment
@@ -101,29 +143,29 @@ class Environment(ExternalAgent):
             :param agent_name: the Agent to retrieve
             :type agent_name: str
         """
-        if self.has_agent_by_name(agent_name) is False:
-            return None
-
-        return self._agents[agent_name]
+        return self._agents.get(agent_name)
 
     def init(self, date):
 
         super().init(date)
 
-        agents_names = self.agents_names
-        random.shuffle(agents_names)
+        agents = list(self._agents.values())
+        random.shuffle(agents)
 
-        for agent_name in agents_names:
-            self._agents[agent_name].init(date)
+        for agent in agents:
+            agent.init(date)
+
+        self._running = True
 
     def cleanup(self):
+        self._running = False
         super().cleanup()
 
-        agents_names = self.agents_names
-        random.shuffle(agents_names)
+        agents = list(self._agents.values())
+        random.shuffle(agents)
 
-        for agent_name in agents_names:
-            self._agents[agent_name].cleanup()
+        for agent in agents:
+            agent.cleanup()
 
     def stop(self):
         """
@@ -138,5 +180,4 @@ class Environment(ExternalAgent):
         """
 
         message = StopSimulation(self._name)
-        to = list(self._agents.keys())
-        self.send_system_message(message, to)
+        self.send_system_message(message, self.agents_names)
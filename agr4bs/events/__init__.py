@@ -31,13 +31,20 @@ from .events import REQUEST_PEER_DISCOVERY
 from .events import PEER_DISCOVERY
 from .events import RECEIVE_MESSAGE
 from .events import SEND_MESSAGE
+from .events import RECEIVE_BUNDLE
+from .events import FLUSH_OUTBOUND
 from .events import RECEIVE_BLOCK
 from .events import RECEIVE_TRANSACTION
+from .events import RECEIVE_TRANSACTIONS
+from .events import RECEIVE_TRANSACTION_ANNOUNCEMENT
+from .events import REQUEST_TRANSACTIONS
+from .events import FLUSH_TRANSACTION_ANNOUNCEMENTS
 from .events import CREATE_BLOCK
 from .events import CREATE_TRANSACTION
 from .events import RUN_SCHEDULABLE
 from .events import REQUEST_BLOCK_HEADER
 from .events import RECEIVE_BLOCK_HEADER
+from .events import RECEIVE_BLOCK_TRANSACTIONS
 from .events import RECEIVE_BLOCK_ENDORSEMENT
 from .events import RECEIVE_TRANSACTION_ENDORSEMENT
 from .events import NEXT_EPOCH
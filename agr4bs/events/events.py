@@ -6,6 +6,8 @@
 # Messages events
 SEND_MESSAGE = "send_message"
 RECEIVE_MESSAGE = "receive_message"
+RECEIVE_BUNDLE = "receive_bundle"
+FLUSH_OUTBOUND = "flush_outbound"
 
 # Seed nodes events
 REQUEST_BOOTSTRAP_PEERS = "request_bootstrap_peers"
@@ -36,6 +38,7 @@ RECEIVE_BLOCK = "receive_block"
 RECEIVE_BLOCK_HEADER = "receive_block_header"
 REQUEST_BLOCK = "request_block"
 REQUEST_BLOCK_HEADER = "request_block_header"
+RECEIVE_BLOCK_TRANSACTIONS = "receive_block_transactions"
 RECEIVE_REQUEST_BLOCKS = "receive_request_blocks"
 RECEIVE_REQUEST_BLOCKS_HEADERS = "receive_request_blocks_header"
 
@@ -48,6 +51,10 @@ RECEIVE_BLOCK_ENDORSEMENT = "receive_block_endorsement"
 # Transaction diffusion events
 CREATE_TRANSACTION = "create_transaction"
 RECEIVE_TRANSACTION = "receive_transaction"
+RECEIVE_TRANSACTIONS = "receive_transactions"
+RECEIVE_TRANSACTION_ANNOUNCEMENT = "receive_transaction_announcement"
+REQUEST_TRANSACTIONS = "request_transactions"
+FLUSH_TRANSACTION_ANNOUNCEMENTS = "flush_transaction_announcements"
 
 # Transaction endorsement events
 REQUEST_TRANSACTION_ENDORSEMENT = "request_transaction_endorsement"
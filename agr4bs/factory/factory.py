@@ -2,7 +2,9 @@
     Agr4bsFactory file class implementation
 """
 
-from ..network import Network
+from typing import Callable
+from ..network import Network, EventQueue, LatencyModel
+from ..common import Clock
 from ..blockchain import IBlockchain, IBlock, ITransaction, Payload
 from ..state import State
 from ..vm import IVM
@@ -64,12 +66,19 @@ class IFactory:
         return State()
 
     @staticmethod
-    def build_network(reset=False) -> Network:
+    def build_network(reset=False, event_queue: Callable[[], EventQueue] = None, clock: Clock = None, broadcast_seed: int = None,
+                      oracle_gossip: bool = False, latency_model: LatencyModel = None,
+                      duplicate_capacity: int = None, mesh_degree: int = None) -> Network:
         """
             Builds a black box Network implementation
+
+            Options other than reset only apply to a newly built Network
+            (see Network.__init__)
         """
         if IFactory.__network is None or reset is True:
-            IFactory.__network = Network(delay=200, drop_rate=0.005)
+            IFactory.__network = Network(delay=200, drop_rate=0.005, event_queue=event_queue, clock=clock, broadcast_seed=broadcast_seed,
+                                         oracle_gossip=oracle_gossip, latency_model=latency_model,
+                                         duplicate_capacity=duplicate_capacity, mesh_degree=mesh_degree)
 
         return IFactory.__network
 
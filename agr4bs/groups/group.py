@@ -4,7 +4,7 @@
 """
 
 from enum import Enum
-from ..agents import Agent
+from ..agents import Agent, ExternalAgent
 
 
 class GroupType(Enum):
@@ -27,6 +27,9 @@ class Group:
 
         A Group is a collection of Agents working together towards
         a common goal.
+
+        ExternalAgent members are subscribed to the topic of the Group,
+        so that a Message can be published to every member at once.
     """
 
     def __init__(self, name: str, _type: GroupType) -> None:
@@ -41,6 +44,13 @@ class Group:
         self.type = _type
         self.members = {}
 
+    @property
+    def topic(self) -> str:
+        """
+            Get the topic the members of the group are subscribed to
+        """
+        return f"group/{self.name}"
+
     def has_member(self, agent: Agent) -> bool:
         """ Check whether a specific agent is part of the group
 
@@ -61,6 +71,10 @@ class Group:
         """
         if not self.has_member(agent):
             self.members[agent] = agent
+
+            if isinstance(agent, ExternalAgent):
+                agent.subscribe(self.topic)
+
             return True
 
         return False
@@ -75,5 +89,9 @@ class Group:
         """
         if self.has_member(agent):
             self.members[agent] = None
+
+            if isinstance(agent, ExternalAgent):
+                agent.unsubscribe(self.topic)
+
             return True
         return False
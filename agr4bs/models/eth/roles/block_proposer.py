@@ -138,4 +138,4 @@ class BlockProposer(Role):
             :type block: Block
         """
         outbound_peers = list(agent.context['outbound_peers'])
-        agent.send_message(DiffuseBlock(agent.name, block), outbound_peers)
+        agent.diffuse(DiffuseBlock(agent.name, block), outbound_peers)
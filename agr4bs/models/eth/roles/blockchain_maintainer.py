@@ -150,7 +150,7 @@ class BlockchainMaintainer(Role):
 
         # Diffuse the transaction to the outbound peers
         outbound_peers = list(agent.context['outbound_peers'])
-        agent.send_message(DiffuseTransaction(agent.name, tx), outbound_peers)
+        agent.relay(DiffuseTransaction(agent.name, tx), outbound_peers)
 
         return True
 
@@ -172,13 +172,16 @@ class BlockchainMaintainer(Role):
 
         # Skip invalid blocks
         if agent.validate_block(block) is False:
-            return
+            return False
+
+        # The received block is shared with the other recipients : copy it before it gets mutated
+        block = block.from_serialized(block.serialize())
 
         agent.append_block(block)
 
         # Diffuse the block to the outbound peers
         outbound_peers = list(agent.context['outbound_peers'])
-        agent.send_message(DiffuseBlock(agent.name, block), outbound_peers)
+        agent.relay(DiffuseBlock(agent.name, block), outbound_peers)
 
     @staticmethod
     @export
@@ -193,7 +196,7 @@ class BlockchainMaintainer(Role):
             :rtype: bool
         """
 
-        sender_account = agent.context['state'].get_account(tx.origin)
+        sender_account = agent.context['state'].view_account(tx.origin)
 
         if tx.hash in agent.context['receipts']:
             return False
@@ -225,7 +228,7 @@ class BlockchainMaintainer(Role):
         if tx.hash in agent.context['receipts']:
             return False
 
-        sender_account = agent.context['state'].get_account(tx.origin)
+        sender_account = agent.context['state'].view_account(tx.origin)
 
         if sender_account is None:
             return False
@@ -405,7 +408,7 @@ class BlockchainMaintainer(Role):
             agent.execute_transaction(tx)
             agent.discard_transaction(tx)
 
-        if agent.context['state'].get_account(block.creator) is None:
+        if not agent.context['state'].has_account(block.creator):
             change = CreateAccount(Account(block.creator, 10))
         else:
             change = AddBalance(block.creator, 10)
@@ -34,7 +34,7 @@ class VM:
         if tx.to is None and len(tx.payload.data) > 0:
             return TransactionType.DEPLOYEMENT
 
-        if state.get_account_internal_agent(tx.to) is None and tx.value > 0:
+        if not state.has_account_internal_agent(tx.to) and tx.value > 0:
             return TransactionType.TRANSFER
 
         if len(tx.payload.data) > 0:
@@ -52,7 +52,6 @@ class VM:
 
     @staticmethod
     def transfer(ctx: ExecutionContext) -> InternalAgentResponse:
-        recipient = ctx.state.get_account(ctx.to)
         changes = []
 
         if ctx.depth > DEPTH_LIMIT:
@@ -61,7 +60,7 @@ class VM:
         if ctx.state.get_account_balance(ctx.caller) < ctx.value:
             return Revert("VM: Invalid balance for transfer")
 
-        if recipient is None:
+        if not ctx.state.has_account(ctx.to):
             changes.append(CreateAccount(Account(ctx.to)))
 
         if ctx.value > 0:
@@ -75,17 +74,16 @@ class VM:
 
     @staticmethod
     def deploy(deployement: InternalAgentDeployement, ctx: ExecutionContext) -> InternalAgentResponse:
-        recipient = ctx.state.get_account(ctx.to)
         changes = []
 
         if ctx.depth > DEPTH_LIMIT:
             return Revert("VM : Max call dapth exceeded")
 
-        if recipient is None and ctx.state.has_account(deployement.agent.name) is False:
+        if not ctx.state.has_account(ctx.to) and ctx.state.has_account(deployement.agent.name) is False:
             changes.append(CreateAccount(
                 Account(deployement.agent.name, internal_agent=deployement.agent)))
 
-            if ctx.state.get_account_internal_agent(ctx.caller) is not None:
+            if ctx.state.has_account_internal_agent(ctx.caller):
                 changes.append(IncrementAccountNonce(ctx.caller))
 
             ctx.state.apply_batch_state_change(changes)
@@ -15,7 +15,6 @@ The BlockProposer implementation which MUST contain the following behaviors :
 
 from ....agents import ExternalAgent, ContextChange, AgentType
 from ....events import CREATE_BLOCK
-from ....network.messages import DiffuseBlock
 from ....roles import Role, RoleType
 from ..blockchain import Block, Transaction
 from ....common import on, export
@@ -138,4 +137,4 @@ class BlockProposer(Role):
             :type block: Block
         """
         outbound_peers = list(agent.context['outbound_peers'])
-        agent.send_message(DiffuseBlock(agent.name, block), outbound_peers)
+        agent.diffuse(agent.block_announcement(block), outbound_peers)
@@ -21,7 +21,7 @@ from ....state.state_change import AddBalance, CreateAccount, RemoveBalance
 from ....agents import ExternalAgent, Context, ContextChange, AgentType
 from ....events import RECEIVE_BLOCK, RECEIVE_TRANSACTION
 from ....state import State, Receipt
-from ....network.messages import DiffuseBlock, DiffuseTransaction
+from ....network.messages import Message, DiffuseBlock, DiffuseTransaction
 from ....roles import Role, RoleType
 from ....common import on, export
 from ..blockchain import Block, Transaction
@@ -148,9 +148,13 @@ class BlockchainMaintainer(Role):
         # Record transactions in the mempool
         agent.store_transaction(tx)
 
-        # Diffuse the transaction to the outbound peers
+        # Announce or diffuse the transaction to the outbound peers
+        if agent.has_role(RoleType.TRANSACTION_ANNOUNCER):
+            agent.announce_transaction(tx)
+            return True
+
         outbound_peers = list(agent.context['outbound_peers'])
-        agent.send_message(DiffuseTransaction(agent.name, tx), outbound_peers)
+        agent.relay(DiffuseTransaction(agent.name, tx), outbound_peers)
 
         return True
 
@@ -172,13 +176,29 @@ class BlockchainMaintainer(Role):
 
         # Skip invalid blocks
         if agent.validate_block(block) is False:
-            return
+            return False
+
+        # The received block is shared with the other recipients : copy it before it gets mutated
+        block = block.from_serialized(block.serialize())
 
         agent.append_block(block)
 
         # Diffuse the block to the outbound peers
         outbound_peers = list(agent.context['outbound_peers'])
-        agent.send_message(DiffuseBlock(agent.name, block), outbound_peers)
+        agent.relay(agent.block_announcement(block), outbound_peers)
+
+    @staticmethod
+    @export
+    def block_announcement(agent: ExternalAgent, block: Block) -> Message:
+        """
+            Build the Message relaying a block to the peers : the full block,
+            or its header and transaction identifiers if the agent has the
+            CompactBlockRelay Role
+        """
+        if agent.has_role(RoleType.COMPACT_BLOCK_RELAY):
+            return agent.announce_block(block)
+
+        return DiffuseBlock(agent.name, block)
 
     @staticmethod
     @export
@@ -193,7 +213,7 @@ class BlockchainMaintainer(Role):
             :rtype: bool
         """
 
-        sender_account = agent.context['state'].get_account(tx.origin)
+        sender_account = agent.context['state'].view_account(tx.origin)
 
         if tx.hash in agent.context['receipts']:
             return False
@@ -225,7 +245,7 @@ class BlockchainMaintainer(Role):
         if tx.hash in agent.context['receipts']:
             return False
 
-        sender_account = agent.context['state'].get_account(tx.origin)
+        sender_account = agent.context['state'].view_account(tx.origin)
 
         if sender_account is None:
             return False
@@ -405,7 +425,7 @@ class BlockchainMaintainer(Role):
             agent.execute_transaction(tx)
             agent.discard_transaction(tx)
 
-        if agent.context['state'].get_account(block.creator) is None:
+        if not agent.context['state'].has_account(block.creator):
             change = CreateAccount(Account(block.creator, 10))
         else:
             change = AddBalance(block.creator, 10)
@@ -3,4 +3,4 @@ from . import blockchain
 from . import factory
 from . import roles
 
-from .factory import Factory, RLFactory
+from .factory import Factory, SnapshotFactory, RLFactory
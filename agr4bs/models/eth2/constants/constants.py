@@ -60,3 +60,9 @@ INACTIVITY_PENALTY_QUOTIENT_BELLATRIX = 2 ** 24
 
 INACTIVITY_SCORE_BIAS = 4
 INACTIVITY_SCORE_RECOVERY_RATE = 16
+
+# Pubsub topic every BlockchainMaintainer subscribes to
+BEACON_SLOT_TOPIC = "beacon_slot"
+
+# Pubsub topic every validator subscribes to once its deposit is executed
+BEACON_ATTESTATION_TOPIC = "beacon_attestation"
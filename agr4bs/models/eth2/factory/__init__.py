@@ -1,2 +1,3 @@
 from .factory import Eth2Factory as Factory
+from .factory import SnapshotEth2Factory as SnapshotFactory
 from .rl_factory import RLEth2Factory as RLFactory
@@ -2,10 +2,12 @@
     Ethereum 2.0 Factory file class implementation
 """
 
+from typing import Callable
 from ....blockchain import Payload
-from ....network import Network
+from ....network import Network, EventQueue, LatencyModel
+from ....common import Clock
 from ..blockchain import Blockchain, Block, Transaction
-from ....state import State
+from ....state import State, SnapshotState
 from ...eth import VM
 
 
@@ -68,12 +70,19 @@ class Eth2Factory:
         return State()
 
     @staticmethod
-    def build_network(reset=False) -> Network:
+    def build_network(reset=False, event_queue: Callable[[], EventQueue] = None, clock: Clock = None, broadcast_seed: int = None,
+                      oracle_gossip: bool = False, latency_model: LatencyModel = None,
+                      duplicate_capacity: int = None, mesh_degree: int = None) -> Network:
         """
             Builds a black box Network implementation
+
+            Options other than reset only apply to a newly built Network
+            (see Network.__init__)
         """
         if Eth2Factory.__network is None or reset is True:
-            Eth2Factory.__network = Network(delay=200, drop_rate=0.02)
+            Eth2Factory.__network = Network(delay=200, drop_rate=0.02, event_queue=event_queue, clock=clock, broadcast_seed=broadcast_seed,
+                                            oracle_gossip=oracle_gossip, latency_model=latency_model,
+                                            duplicate_capacity=duplicate_capacity, mesh_degree=mesh_degree)
 
         return Eth2Factory.__network
 
@@ -96,3 +105,20 @@ class Eth2Factory:
             Eth2Factory.__tx_pool = {}
 
         return Eth2Factory.__tx_pool
+
+
+class SnapshotEth2Factory(Eth2Factory):
+
+    """
+        Ethereum 2.0 factory building SnapshotStates, snapshotted after
+        every Block so that reorgs restore the State of the common ancestor
+        instead of reverting the transactions of the abandoned branch.
+        Each StateChange is slower to apply than on the default State.
+    """
+
+    @staticmethod
+    def build_state() -> State:
+        """
+            Builds a black box SnapshotState implementation
+        """
+        return SnapshotState()
@@ -10,6 +10,7 @@ from ....network.messages import CreateBlock, NextEpoch, NextSlot
 from ....roles import Role, RoleType
 from ....common import export, every, on
 from ....events.events import INIT
+from ..constants import BEACON_SLOT_TOPIC
 
 
 class BlockCreatorElectorContextChange(ContextChange):
@@ -75,7 +76,7 @@ class BlockCreatorElector(Role):
 
         agent.context['block_proposers'] = proposers
 
-        agent.send_system_message(NextEpoch(agent.name, agent.context['epoch']), agent.agents_names)
+        agent.publish(NextEpoch(agent.name, agent.context['epoch']), BEACON_SLOT_TOPIC, direct=True)
 
     @staticmethod
     @export
@@ -93,5 +94,5 @@ class BlockCreatorElector(Role):
             agent.next_epoch()
 
         proposer = agent.context['block_proposers'][slot % 32]
-        agent.send_system_message(NextSlot(agent.name, slot, agent.context['block_attesters'][slot % 32]), agent.agents_names)
+        agent.publish(NextSlot(agent.name, slot, agent.context['block_attesters'][slot % 32]), BEACON_SLOT_TOPIC, direct=True)
         agent.send_system_message(CreateBlock(agent.name), proposer)
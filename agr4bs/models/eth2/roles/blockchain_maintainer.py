@@ -17,13 +17,14 @@ from ....state.account import Account
 from ....state.state_change import AddBalance, CreateAccount, RemoveBalance
 from ....agents import ExternalAgent, Context, ContextChange, AgentType
 from ....events import RECEIVE_BLOCK, RECEIVE_TRANSACTION, RECEIVE_BLOCK_ENDORSEMENT, NEXT_SLOT, NEXT_EPOCH
-from ....state import State, Receipt
-from ....network.messages import DiffuseBlock, DiffuseTransaction, RequestBlockEndorsement, DiffuseBlockEndorsement
+from ....state import State, SnapshotState, Receipt
+from ....network.messages import Message, DiffuseBlock, DiffuseTransaction, RequestBlockEndorsement, DiffuseBlockEndorsement
 from ....roles import Role, RoleType
-from ....common import on, export
+from ....common import on, on_batch, export
 from ..blockchain import Block, Transaction, Attestation, Blockchain
 from ..factory import Factory
 from ..consensus import BeaconState
+from ..constants import BEACON_SLOT_TOPIC, BEACON_ATTESTATION_TOPIC
 from ..constants import PROPOSER_SCORE_BOOST, INTERVAL_PER_SLOT, SLOT_TIME, GENESIS_EPOCH, SLOTS_PER_EPOCH, INACTIVITY_SCORE_BIAS, INACTIVITY_SCORE_RECOVERY_RATE, INACTIVITY_PENALTY_QUOTIENT_BELLATRIX, EFFECTIVE_BALANCE_INCREMENT, PARTICIPATION_FLAG_WEIGHTS, WEIGHT_DENOMINATOR, PROPOSER_WEIGHT, TIMELY_TARGET_FLAG_INDEX, TIMELY_HEAD_FLAG_INDEX, TIMELY_SOURCE_FLAG_INDEX, JUSTIFICATION_BITS_LENGTH, MIN_ATTESTATION_INCLUSION_DELAY
 
 class BlockchainMaintainerContextChange(ContextChange):
@@ -64,6 +65,10 @@ class BlockchainMaintainerContextChange(ContextChange):
         self.pending_attestations = []
 
         self.unrealized_justifications = {}
+
+        # Snapshots of the state after every executed block, indexed by block
+        # hash (only when the state is a SnapshotState)
+        self.state_snapshots = {}
         self.unrealized_justified_checkpoint = None
         self.unrealized_finalized_checkpoint = None
         self.justified_checkpoint = None
@@ -124,6 +129,37 @@ class BlockchainMaintainerContextChange(ContextChange):
         return tx_pool
 
 
+def _unwind_block(agent: ExternalAgent, block: Block) -> None:
+    """
+        Forget the receipts and the attestations of a reverted Block,
+        and move the head to its parent
+    """
+    for tx in block.transactions:
+        del agent.context['receipts'][tx.hash]
+
+    for attestation in block.attestations:
+        # agent.context['included_attestations_per_epoch'][attestation.epoch].remove(attestation)
+        agent.context['pending_attestations'].append(attestation)
+
+    new_head = agent.context['blockchain'].get_block(block.parent_hash)
+    agent.context["blockchain"].head = new_head
+
+
+def _release_state_snapshots(agent: ExternalAgent, finalized: Block) -> None:
+    """
+        Forget the state snapshots of the Blocks older than the finalized
+        checkpoint, which can no longer be reorged to
+    """
+    snapshots = agent.context['state_snapshots']
+    blockchain = agent.context['blockchain']
+
+    for block_hash in list(snapshots):
+        block = blockchain.get_block(block_hash)
+
+        if block is None or block.slot < finalized.slot:
+            del snapshots[block_hash]
+
+
 class BlockchainMaintainer(Role):
 
     """
@@ -158,8 +194,9 @@ class BlockchainMaintainer(Role):
     def process_genesis(agent: ExternalAgent):
         """
             Initialize the blockchain by executing all the transactions
-            in the genesis block.
+            in the genesis block, and subscribe to the slot notifications.
         """
+        agent.subscribe(BEACON_SLOT_TOPIC)
 
         genesis = agent.context['blockchain'].genesis
         agent.context['beacon_states'][genesis.hash] = BeaconState(genesis)
@@ -170,32 +207,65 @@ class BlockchainMaintainer(Role):
 
     @staticmethod
     @export
-    @on(RECEIVE_TRANSACTION)
     def receive_transaction(agent: ExternalAgent, tx: Transaction):
+        """
+            Validate a single transaction and store it in the memory pool
+            if it passes the checks (see receive_transactions).
+
+            :returns: wether the transaction was accepted
+            :rtype: bool
+        """
+        return agent.receive_transactions([(tx,)])[0]
+
+    @staticmethod
+    @export
+    @on_batch(RECEIVE_TRANSACTION)
+    def receive_transactions(agent: ExternalAgent, batch: list[tuple[Transaction]]):
         """
             Behavior called on a RECEIVE_TRANSACTIOn event
-            It is responsible for validating the transaction and storing it
-            in the memory pool if it passes the checks.
+            It is responsible for validating the transactions and storing them
+            in the memory pool if they pass the checks.
+
+            Every transaction received at the same date is processed in a
+            single call, the outbound peers being resolved once per batch.
+
+            :returns: wether each transaction was accepted
+            :rtype: list[bool]
         """
+        outbound_peers = None
+        announce = agent.has_role(RoleType.TRANSACTION_ANNOUNCER)
+        accepted = []
 
-        tx_hash = tx.compute_hash()
+        for (tx,) in batch:
 
-        # Invalid tx hashes are not added nor propagated
-        if tx.hash != tx_hash:
-            return False
+            tx_hash = tx.compute_hash()
 
-        # Skip invalid transactions
-        if agent.validate_new_transaction(tx) is False:
-            return False
+            # Invalid tx hashes are not added nor propagated
+            if tx.hash != tx_hash:
+                accepted.append(False)
+                continue
 
-        # Record transactions in the mempool
-        agent.store_transaction(tx)
+            # Skip invalid transactions
+            if agent.validate_new_transaction(tx) is False:
+                accepted.append(False)
+                continue
 
-        # Diffuse the transaction to the outbound peers
-        outbound_peers = list(agent.context['outbound_peers'])
-        agent.send_message(DiffuseTransaction(agent.name, tx), outbound_peers)
+            # Record transactions in the mempool
+            agent.store_transaction(tx)
 
-        return True
+            accepted.append(True)
+
+            # Announce or diffuse the transaction to the outbound peers
+            if announce:
+                agent.announce_transaction(tx)
+                continue
+
+            if outbound_peers is None:
+                outbound_peers = list(agent.context['outbound_peers'])
+
+            agent.relay(DiffuseTransaction(agent.name, tx), outbound_peers)
+
+        return accepted
 
     @staticmethod
     @export
@@ -207,7 +277,6 @@ class BlockchainMaintainer(Role):
             triggering it's addition to the blockchain.
         """
 
-        block = block.from_serialized(block.serialize())
         block_hash = block.compute_hash()
 
         # Block is already known￼
@@ -215,10 +284,13 @@ class BlockchainMaintainer(Role):
             #print("Agent ", agent.name, "received a known block : ", block_hash)
             return
 
+        # The received block is shared with the other recipients : copy it before it gets mutated
+        block = block.from_serialized(block.serialize())
+
         # Block is invalid
         if agent.validate_block(block) is False:
             print("Agent ", agent.name, "received an invalid block : ", block_hash)
-            return
+            return False
 
         # Create a new beacon state from the parent state
         state: BeaconState = agent.context['beacon_states'][block.parent_hash].copy()
@@ -230,13 +302,13 @@ class BlockchainMaintainer(Role):
 
         # Diffuse the block to the outbound peers
         outbound_peers = list(agent.context['outbound_peers'])
-        agent.send_message(DiffuseBlock(agent.name, block), outbound_peers)
+        agent.relay(agent.block_announcement(block), outbound_peers)
         
         # Store the new beacon state
         agent.context['beacon_states'][block_hash] = state
 
         # Add proposer score boost if the block is timely
-        time_into_slot = (agent.date - agent.context["genesis_time"]).seconds % SLOT_TIME
+        time_into_slot = int(agent.clock.to_seconds(agent.date - agent.context["genesis_time"])) % SLOT_TIME
         is_before_attesting_interval = time_into_slot < SLOT_TIME // INTERVAL_PER_SLOT
         
         if agent.context["slot"] == block.slot and is_before_attesting_interval:
@@ -287,6 +359,7 @@ class BlockchainMaintainer(Role):
         # Update finalized checkpoint
         if finalized_checkpoint and finalized_checkpoint.epoch > agent.context["finalized_checkpoint"].epoch:
             agent.context["finalized_checkpoint"] = finalized_checkpoint
+            _release_state_snapshots(agent, finalized_checkpoint)
 
     @staticmethod
     @export
@@ -779,43 +852,62 @@ class BlockchainMaintainer(Role):
                 
     @staticmethod
     @export
-    @on(RECEIVE_BLOCK_ENDORSEMENT)
     def receive_attestation(agent: ExternalAgent, attestation: Attestation):
+        """
+            Validate a single attestation and trigger its addition to the
+            local state (see receive_attestations).
+        """
+        agent.receive_attestations([(attestation,)])
+
+    @staticmethod
+    @export
+    @on_batch(RECEIVE_BLOCK_ENDORSEMENT)
+    def receive_attestations(agent: ExternalAgent, batch: list[tuple[Attestation]]):
         """
             Behavior called on RECEIVE_ATTESTATION event.
-            It is responsible for validating the attestation and appending and
-            triggering it's addition to the local state.
+            It is responsible for validating the attestations and appending and
+            triggering their addition to the local state.
 
             Attestations are only valid if they are included in a block
+
+            Every attestation received at the same date is processed in a
+            single call, the latest messages being swept once per batch.
         """
+        accepted = False
 
-        # This may be an issue if we receive an attestation AFTER it has been included in a block
-        # by another agent (i.e. we receive the block before the attestation)
-        # In this case we should validate if the attestation is known or not
-        if attestation in agent.context['attestations'] or attestation in agent.context['pending_attestations']:
-            #print("Agent ", agent.name, "received a known attestation")
-            return
-        
-        # Use the gossip validation rules
-        if not agent.validate_attestation(attestation, gossip=True):
-            #print("Agent ", agent.name, "received an invalid attestation")
+        for (attestation,) in batch:
+
+            # This may be an issue if we receive an attestation AFTER it has been included in a block
+            # by another agent (i.e. we receive the block before the attestation)
+            # In this case we should validate if the attestation is known or not
+            if attestation in agent.context['attestations'] or attestation in agent.context['pending_attestations']:
+                #print("Agent ", agent.name, "received a known attestation")
+                continue
+
+            # Use the gossip validation rules
+            if not agent.validate_attestation(attestation, gossip=True):
+                #print("Agent ", agent.name, "received an invalid attestation")
+                continue
+
+            # Overwrite the latest attestation from the same agent
+            # LMD GHOST rule for head selection
+            agent.context['latest_messages'][attestation.agent_name] = attestation
+
+            # The attestation is not pending, it is already included in the local chain
+            # if attestation in agent.context['included_attestations_per_epoch'][attestation.epoch]:
+                #print("Agent ", agent.name, "received an attestation that is already included in the chain")
+            #    return
+
+            agent.context['pending_attestations'].append(attestation)
+            accepted = True
+
+        if not accepted:
             return
-    
-        # Overwrite the latest attestation from the same agent
-        # LMD GHOST rule for head selection 
-        agent.context['latest_messages'][attestation.agent_name] = attestation
-        
+
         # Clear the latest messages that are too old
         for key in list(agent.context['latest_messages'].keys()):
-                if agent.context['latest_messages'][key].slot < agent.context['slot'] - SLOTS_PER_EPOCH:
-                    del agent.context['latest_messages'][key]
-        
-        # The attestation is not pending, it is already included in the local chain
-        # if attestation in agent.context['included_attestations_per_epoch'][attestation.epoch]:
-            #print("Agent ", agent.name, "received an attestation that is already included in the chain")
-        #    return
-
-        agent.context['pending_attestations'].append(attestation)
+            if agent.context['latest_messages'][key].slot < agent.context['slot'] - SLOTS_PER_EPOCH:
+                del agent.context['latest_messages'][key]
 
         
 
@@ -926,6 +1018,19 @@ class BlockchainMaintainer(Role):
 
         agent.update_checkpoints(agent.context["unrealized_justified_checkpoint"], agent.context["unrealized_finalized_checkpoint"])
         
+    @staticmethod
+    @export
+    def block_announcement(agent: ExternalAgent, block: Block) -> Message:
+        """
+            Build the Message relaying a block to the peers : the full block,
+            or its header and transaction identifiers if the agent has the
+            CompactBlockRelay Role
+        """
+        if agent.has_role(RoleType.COMPACT_BLOCK_RELAY):
+            return agent.announce_block(block)
+
+        return DiffuseBlock(agent.name, block)
+
     @staticmethod
     @export
     def validate_transaction(agent: ExternalAgent, tx: Transaction) -> bool:
@@ -939,7 +1044,7 @@ class BlockchainMaintainer(Role):
             :rtype: bool
         """
 
-        sender_account = agent.context['state'].get_account(tx.origin)
+        sender_account = agent.context['state'].view_account(tx.origin)
 
         if tx.hash in agent.context['receipts']:
             return False
@@ -971,7 +1076,7 @@ class BlockchainMaintainer(Role):
         if tx.hash in agent.context['receipts']:
             return False
 
-        sender_account = agent.context['state'].get_account(tx.origin)
+        sender_account = agent.context['state'].view_account(tx.origin)
 
         if sender_account is None:
             return False
@@ -1106,10 +1211,24 @@ class BlockchainMaintainer(Role):
     def reorg(agent: ExternalAgent, reverted_blocks: list[Block], added_blocks: list[Block]):
         """
             Process a chain reorg by doing the adequate revert / execute
+
+            When the state snapshot of the common ancestor is known, the
+            state is restored to it instead of reverting the transactions
+            of the reverted blocks one by one.
         """
+        reverted_hashes = {block.hash for block in reverted_blocks}
+        ancestor = next((block.parent_hash for block in reverted_blocks
+                         if block.parent_hash not in reverted_hashes), None)
+
+        if ancestor in agent.context['state_snapshots']:
+            for reverted_block in reverted_blocks:
+                _unwind_block(agent, reverted_block)
+
+            agent.context['state'].restore(agent.context['state_snapshots'][ancestor])
 
-        for reverted_block in reverted_blocks:
-            agent.reverse_block(reverted_block)
+        else:
+            for reverted_block in reverted_blocks:
+                agent.reverse_block(reverted_block)
 
         for added_block in added_blocks:
 
@@ -1165,10 +1284,17 @@ class BlockchainMaintainer(Role):
             if tx.to == "deposit_contract" and agent.context['receipts'][tx.hash].reverted is False:
                 agent.context['beacon_states'][block.hash].add_validator(tx.origin)
 
-        if agent.context['state'].get_account(block.creator) is None:
+                # Validators receive the attestations
+                if tx.origin == agent.name:
+                    agent.subscribe(BEACON_ATTESTATION_TOPIC)
+
+        if not agent.context['state'].has_account(block.creator):
             change = CreateAccount(Account(block.creator, 0))
             agent.context["state"].apply_state_change(change)
-        
+
+        if isinstance(agent.context['state'], SnapshotState):
+            agent.context['state_snapshots'][block.hash] = agent.context['state'].snapshot()
+
         agent.context["blockchain"].head = block
 
         return True
@@ -1188,15 +1314,7 @@ class BlockchainMaintainer(Role):
             # Reverse the transaction
             agent.reverse_transaction(tx)
 
-            # Delete the Receipt entry
-            del agent.context['receipts'][tx.hash]
-
-        for attestation in block.attestations:
-            # agent.context['included_attestations_per_epoch'][attestation.epoch].remove(attestation)
-            agent.context['pending_attestations'].append(attestation)
-
-        new_head = agent.context['blockchain'].get_block(block.parent_hash)
-        agent.context["blockchain"].head = new_head
+        _unwind_block(agent, block)
 
     @staticmethod
     @export
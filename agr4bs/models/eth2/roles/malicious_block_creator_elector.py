@@ -10,7 +10,7 @@ from ....network.messages import CreateBlock, NextEpoch, NextSlot
 from ....roles import Role, RoleType
 from ....common import export, every, on
 from ....events.events import INIT
-from ..constants import SLOTS_PER_EPOCH
+from ..constants import SLOTS_PER_EPOCH, BEACON_SLOT_TOPIC
 
 
 class MaliciousBlockCreatorElectorContextChange(ContextChange):
@@ -128,7 +128,7 @@ class MaliciousBlockCreatorElector(Role):
                     honest_attester_index += 1
 
         agent.context['block_proposers'] = proposers
-        agent.send_system_message(NextEpoch(agent.name, agent.context['epoch']), agent.agents_names)
+        agent.publish(NextEpoch(agent.name, agent.context['epoch']), BEACON_SLOT_TOPIC, direct=True)
 
         for i in range(32):
             print("Slot ", i, " : ", agent.context['block_proposers'][i], " / ", agent.context['block_attesters'][i])
@@ -156,7 +156,7 @@ class MaliciousBlockCreatorElector(Role):
             has_malicious_attester_before_slot = agent.get_agent_by_name(agent.context['block_attesters'][(slot - 1) % 32][0]).context['malicious_attester']
             _proposer.context['has_malicious_attester'] = has_malicious_attester_at_same_slot or has_malicious_attester_before_slot
 
-        agent.send_system_message(NextSlot(agent.name, slot, agent.context['block_attesters'][slot % 32]), agent.agents_names)
+        agent.publish(NextSlot(agent.name, slot, agent.context['block_attesters'][slot % 32]), BEACON_SLOT_TOPIC, direct=True)
         agent.send_system_message(CreateBlock(agent.name), proposer)
 
         same_time_as_malicious_proposer = agent.get_agent_by_name(proposer).context['malicious_proposer'] is True
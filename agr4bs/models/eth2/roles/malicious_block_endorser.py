@@ -17,6 +17,7 @@ import datetime
 from ....agents import ExternalAgent, ContextChange, AgentType
 from ....roles import Role, RoleType
 from ..blockchain import Attestation
+from ..constants import BEACON_ATTESTATION_TOPIC
 from ....common import export, on
 from ....network.messages import RequestBlockEndorsement, DiffuseBlockEndorsement
 from ....events import REQUEST_BLOCK_ENDORSEMENT, NEXT_SLOT
@@ -135,7 +136,6 @@ class MaliciousBlockEndorser(Role):
         target = blockchain.get_checkpoint_from_epoch(agent.context['epoch'], root)
 
         attestation = Attestation(agent.name, agent.context['epoch'], agent.context['slot'], agent.context['index'], root.hash, source.hash, target.hash)
-        validators = agent.context['beacon_states'][root.hash].validators
-        
-        agent.send_system_message(DiffuseBlockEndorsement(agent.name, attestation), validators)
+
+        agent.publish(DiffuseBlockEndorsement(agent.name, attestation), BEACON_ATTESTATION_TOPIC)
  
\ No newline at end of file
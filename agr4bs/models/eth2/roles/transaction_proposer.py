@@ -89,7 +89,7 @@ class TransactionProposer(Role):
         """
         outbound_peers = list(agent.context['outbound_peers'])
         agent.receive_transaction(transaction)
-        agent.send_message(DiffuseTransaction(
+        agent.diffuse(DiffuseTransaction(
             agent.name, transaction), outbound_peers)
 
     @staticmethod
@@ -3,4 +3,12 @@
 """
 
 from .network import Network
-from .messages import Message
+from .messages import Message, Envelope, Broadcast, Publication
+from .event_queue import EventQueue, LockedEventQueue, HeapEventQueue, BucketHeapEventQueue
+from .timer_wheel import TimerWheel, TimerSlot
+from .latency import LatencyModel, RegionalLatencyModel
+from .latency import Distribution, UniformDistribution, LogNormalDistribution, EmpiricalDistribution
+from .seen_set import SeenSet
+from .pubsub import PubSubRouter
+from .topology import Topology
+from .peer_registry import PeerRegistry
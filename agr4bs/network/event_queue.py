@@ -0,0 +1,175 @@
+"""
+    EventQueue file class implementation
+"""
+
+import heapq
+import queue
+
+from .messages import Message
+
+
+class EventQueue:
+
+    """
+        EventQueue class implementation :
+
+        An EventQueue stores the in-flight Messages of a Network and
+        delivers them by increasing (date, nonce) order.
+
+        Concrete backends MUST implement put, get, peek, empty and __len__.
+    """
+
+    def put(self, message: Message) -> None:
+        """
+            Insert a Message in the queue
+        """
+        raise NotImplementedError
+
+    def get(self) -> Message:
+        """
+            Pop and return the Message with the lowest (date, nonce)
+        """
+        raise NotImplementedError
+
+    def peek(self) -> Message:
+        """
+            Return the Message with the lowest (date, nonce) without popping it
+        """
+        raise NotImplementedError
+
+    def empty(self) -> bool:
+        """
+            Check if the queue holds no Message
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class LockedEventQueue(EventQueue):
+
+    """
+        LockedEventQueue class implementation :
+
+        Thread safe backend relying on queue.PriorityQueue and Message.__lt__.
+        Every put / get takes a lock, it is kept for reference and benchmarks.
+    """
+
+    def __init__(self):
+        self._queue = queue.PriorityQueue()
+
+    def put(self, message: Message) -> None:
+        self._queue.put(message)
+
+    def get(self) -> Message:
+        return self._queue.get()
+
+    def peek(self) -> Message:
+        with self._queue.mutex:
+            return self._queue.queue[0]
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+
+class HeapEventQueue(EventQueue):
+
+    """
+        HeapEventQueue class implementation :
+
+        Lock free binary heap of precomputed (date, nonce, message) keys.
+        The nonce is unique, so the Message itself is never compared.
+    """
+
+    def __init__(self):
+        self._heap = []
+
+    def put(self, message: Message) -> None:
+        heapq.heappush(self._heap, (message.date, message.nonce, message))
+
+    def get(self) -> Message:
+        return heapq.heappop(self._heap)[2]
+
+    def peek(self) -> Message:
+        return self._heap[0][2]
+
+    def empty(self) -> bool:
+        return not self._heap
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class BucketHeapEventQueue(EventQueue):
+
+    """
+        BucketHeapEventQueue class implementation :
+
+        Two level heap where Messages are grouped into buckets of
+        bucket_width according to their date. Each bucket is a small heap
+        of (date, nonce, message) keys and the non empty buckets are kept
+        in a heap of bucket indices.
+
+        Unlike a calendar queue, buckets are never wrapped nor resized :
+        an insertion pays for the size of its bucket, plus the heap of
+        indices when it opens a new bucket.
+
+        :param bucket_width: the time span covered by a bucket, expressed in
+        the same unit as the Messages durations (i.e., timedelta or ticks)
+    """
+
+    def __init__(self, bucket_width):
+        self._bucket_width = bucket_width
+        self._origin = None
+        self._buckets = {}
+        self._indices = []
+        self._size = 0
+
+    @property
+    def bucket_width(self):
+        """
+            Get the time span covered by a bucket
+        """
+        return self._bucket_width
+
+    def put(self, message: Message) -> None:
+        date = message.date
+
+        if self._origin is None:
+            self._origin = date
+
+        index = (date - self._origin) // self._bucket_width
+        bucket = self._buckets.get(index)
+
+        if bucket is None:
+            bucket = self._buckets[index] = []
+            heapq.heappush(self._indices, index)
+
+        heapq.heappush(bucket, (date, message.nonce, message))
+        self._size = self._size + 1
+
+    def get(self) -> Message:
+        index = self._indices[0]
+        bucket = self._buckets[index]
+        message = heapq.heappop(bucket)[2]
+
+        if not bucket:
+            del self._buckets[index]
+            heapq.heappop(self._indices)
+
+        self._size = self._size - 1
+
+        return message
+
+    def peek(self) -> Message:
+        return self._buckets[self._indices[0]][0][2]
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def __len__(self) -> int:
+        return self._size
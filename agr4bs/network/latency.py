@@ -0,0 +1,286 @@
+"""
+    Latency models file class implementation
+"""
+
+import random
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class Distribution:
+
+    """
+        Distribution class implementation :
+
+        A Distribution draws link delays (in milliseconds) from blocks of
+        pre-sampled values, so that the cost of the random generator is
+        amortized over block_size messages.
+
+        Blocks are sampled with NumPy when it is installed and with the
+        random module otherwise : the same seed yields different (but equally
+        distributed) delays depending on the backend.
+
+        Concrete distributions MUST implement minimum and _draw.
+
+        :param block_size: the number of values sampled at once
+        :type block_size: int
+        :param seed: the seed of the random generator of the Distribution
+        :type seed: int
+    """
+
+    def __init__(self, block_size: int = 4096, seed: int = None):
+        self._block_size = block_size
+        self._block = []
+        self._index = 0
+
+        if numpy is not None:
+            self._rng = numpy.random.default_rng(seed)
+        else:
+            self._rng = random.Random(seed)
+
+    @property
+    def minimum(self) -> float:
+        """
+            Get the lowest delay the Distribution can draw
+        """
+        raise NotImplementedError
+
+    def sample(self) -> float:
+        """
+            Draw a single delay
+        """
+        if self._index == len(self._block):
+            self._block = self._draw(self._block_size)
+            self._index = 0
+
+        value = self._block[self._index]
+        self._index = self._index + 1
+
+        return value
+
+    def _draw(self, size: int) -> list[float]:
+        """
+            Sample a new block of values
+        """
+        raise NotImplementedError
+
+
+class UniformDistribution(Distribution):
+
+    """
+        Uniform delays in [low, high)
+    """
+
+    def __init__(self, low: float, high: float, block_size: int = 4096, seed: int = None):
+        super().__init__(block_size, seed)
+        self._low = low
+        self._high = high
+
+    @property
+    def minimum(self) -> float:
+        return self._low
+
+    def _draw(self, size: int) -> list[float]:
+        if numpy is not None:
+            return self._rng.uniform(self._low, self._high, size).tolist()
+
+        span = self._high - self._low
+
+        return [self._low + span * self._rng.random() for _ in range(size)]
+
+
+class LogNormalDistribution(Distribution):
+
+    """
+        Log-normal delays : shift + exp(N(mu, sigma))
+
+        :param mu: the mean of the underlying normal distribution
+        :type mu: float
+        :param sigma: the standard deviation of the underlying normal distribution
+        :type sigma: float
+        :param shift: the incompressible delay added to every draw (i.e., the propagation delay)
+        :type shift: float
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, mu: float, sigma: float, shift: float = 0, block_size: int = 4096, seed: int = None):
+        super().__init__(block_size, seed)
+        self._mu = mu
+        self._sigma = sigma
+        self._shift = shift
+
+    @property
+    def minimum(self) -> float:
+        return self._shift
+
+    def _draw(self, size: int) -> list[float]:
+        if numpy is not None:
+            return (self._rng.lognormal(self._mu, self._sigma, size) + self._shift).tolist()
+
+        return [self._shift + self._rng.lognormvariate(self._mu, self._sigma) for _ in range(size)]
+
+
+class EmpiricalDistribution(Distribution):
+
+    """
+        Delays drawn from the empirical CDF of observed delays, linearly
+        interpolated between the observations.
+
+        :param observations: the observed delays in milliseconds
+        :type observations: list[float]
+    """
+
+    def __init__(self, observations: list[float], block_size: int = 4096, seed: int = None):
+
+        if len(observations) == 0:
+            raise ValueError("EmpiricalDistribution requires at least one observation")
+
+        super().__init__(block_size, seed)
+        self._observations = sorted(observations)
+        self._quantiles = [i / max(1, len(observations) - 1) for i in range(len(observations))]
+
+    @staticmethod
+    def from_file(path: str, block_size: int = 4096, seed: int = None) -> 'EmpiricalDistribution':
+        """
+            Build an EmpiricalDistribution from a file holding one observed
+            delay (in milliseconds) per line. Empty lines and lines starting
+            with # are ignored.
+        """
+        with open(path, 'r', encoding='utf-8') as file:
+            lines = [line.strip() for line in file]
+
+        observations = [float(line) for line in lines if line and not line.startswith('#')]
+
+        return EmpiricalDistribution(observations, block_size, seed)
+
+    @property
+    def minimum(self) -> float:
+        return self._observations[0]
+
+    def _draw(self, size: int) -> list[float]:
+        if numpy is not None:
+            return numpy.interp(self._rng.random(size), self._quantiles, self._observations).tolist()
+
+        return [self._inverse_cdf(self._rng.random()) for _ in range(size)]
+
+    def _inverse_cdf(self, quantile: float) -> float:
+        """
+            Get the interpolated delay at a given quantile
+        """
+        observations = self._observations
+
+        if len(observations) == 1:
+            return observations[0]
+
+        position = quantile * (len(observations) - 1)
+        index = min(int(position), len(observations) - 2)
+        weight = position - index
+
+        return observations[index] + weight * (observations[index + 1] - observations[index])
+
+
+class LatencyModel:
+
+    """
+        LatencyModel class implementation :
+
+        Defines the delay and bandwidth of every link of the Network.
+        The base model applies the same delay Distribution and bandwidth
+        to every link.
+
+        :param distribution: the Distribution of the link delays
+        :type distribution: Distribution
+        :param bandwidth: the bandwidth of every link in bytes per second (unlimited if None)
+        :type bandwidth: float
+        :param seed: the seed of the message drops
+        :type seed: int
+    """
+
+    def __init__(self, distribution: Distribution, bandwidth: float = None, seed: int = None):
+        self._distribution = distribution
+        self._bandwidth = bandwidth
+        self._drops = UniformDistribution(0, 1, seed=seed)
+
+    @property
+    def min_delay(self) -> float:
+        """
+            Get the lowest delay of any link, in milliseconds
+        """
+        return self._distribution.minimum
+
+    def delay(self, origin: str, recipient: str) -> float:
+        """
+            Draw the delay of a message on the link from origin to recipient
+        """
+        return self._distribution.sample()
+
+    def bandwidth(self, origin: str, recipient: str) -> float:
+        """
+            Get the bandwidth of the link from origin to recipient in bytes per second
+            (None if unlimited)
+        """
+        return self._bandwidth
+
+    def drop(self, drop_rate: float) -> bool:
+        """
+            Draw wether a message should be dropped
+        """
+        return self._drops.sample() <= drop_rate
+
+
+class RegionalLatencyModel(LatencyModel):
+
+    """
+        RegionalLatencyModel class implementation :
+
+        Every agent belongs to a region and every pair of regions has its
+        own delay Distribution (and optionally bandwidth), links being
+        symmetric. Unknown agents, regions or pairs fall back to the default
+        Distribution and bandwidth. Assigning each agent to its own region
+        gives a full latency matrix.
+
+        :param regions: the region of every agent
+        :type regions: dict[str, str]
+        :param latencies: the delay Distribution of every pair of regions
+        :type latencies: dict[tuple[str, str], Distribution]
+        :param default: the delay Distribution of any other link
+        :type default: Distribution
+        :param bandwidths: the bandwidth of every pair of regions in bytes per second
+        :type bandwidths: dict[tuple[str, str], float]
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, regions: dict[str, str], latencies: dict[tuple[str, str], Distribution], default: Distribution,
+                 bandwidths: dict[tuple[str, str], float] = None, default_bandwidth: float = None, seed: int = None):
+        super().__init__(default, default_bandwidth, seed)
+        self._regions = regions
+        self._latencies = self._symmetric(latencies)
+        self._bandwidths = self._symmetric(bandwidths or {})
+
+    @staticmethod
+    def _symmetric(table: dict[tuple[str, str], object]) -> dict[tuple[str, str], object]:
+        """
+            Complete a table of region pairs with the reversed pairs
+        """
+        symmetric = {(second, first): value for (first, second), value in table.items()}
+        symmetric.update(table)
+
+        return symmetric
+
+    @property
+    def min_delay(self) -> float:
+        return min([self._distribution.minimum] + [distribution.minimum for distribution in self._latencies.values()])
+
+    def delay(self, origin: str, recipient: str) -> float:
+        link = (self._regions.get(origin), self._regions.get(recipient))
+
+        return self._latencies.get(link, self._distribution).sample()
+
+    def bandwidth(self, origin: str, recipient: str) -> float:
+        link = (self._regions.get(origin), self._regions.get(recipient))
+
+        return self._bandwidths.get(link, self._bandwidth)
+
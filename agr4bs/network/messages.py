@@ -2,14 +2,15 @@
     Core and Custom messages types definitions
 """
 
-from ..blockchain.block import IBlockHeader
-from ..events import CREATE_TRANSACTION, RECEIVE_TRANSACTION
+from ..blockchain.block import IBlockHeader, CompactBlock
+from ..events import CREATE_TRANSACTION, RECEIVE_TRANSACTION, RECEIVE_TRANSACTIONS
+from ..events import RECEIVE_TRANSACTION_ANNOUNCEMENT, REQUEST_TRANSACTIONS, FLUSH_TRANSACTION_ANNOUNCEMENTS
 from ..events import REQUEST_BOOTSTRAP_STATIC_PEERS, BOOTSTRAP_STATIC_PEERS
 from ..events import REQUEST_PEER_DISCOVERY, PEER_DISCOVERY
 from ..events import REQUEST_BOOTSTRAP_PEERS, BOOTSTRAP_PEERS
 from ..events import REQUEST_INBOUND_PEER, ACCEPT_INBOUND_PEER, DENY_INBOUND_PEER, DROP_INBOUND_PEER
-from ..events import STOP_SIMULATION
-from ..events import CREATE_BLOCK, RECEIVE_BLOCK, REQUEST_BLOCK, RECEIVE_BLOCK_HEADER
+from ..events import STOP_SIMULATION, RECEIVE_BUNDLE, FLUSH_OUTBOUND
+from ..events import CREATE_BLOCK, RECEIVE_BLOCK, REQUEST_BLOCK, RECEIVE_BLOCK_HEADER, RECEIVE_BLOCK_TRANSACTIONS
 from ..events import RUN_SCHEDULABLE
 from ..events import REQUEST_BLOCK_ENDORSEMENT, RECEIVE_BLOCK_ENDORSEMENT
 from ..events import NEXT_EPOCH, NEXT_SLOT
@@ -31,6 +32,7 @@ class Message:
         self._date = None
         self._nonce = 0
         self._recipient = None
+        self._generation = None
 
     @property
     def origin(self) -> str:
@@ -71,6 +73,26 @@ class Message:
     def nonce(self, value: int):
         self._nonce = value
 
+    @property
+    def generation(self) -> int:
+        """
+            Get the generation of the recipient when the message was queued
+        """
+        return self._generation
+
+    @generation.setter
+    def generation(self, value: int):
+        self._generation = value
+
+    @property
+    def content_id(self):
+        """
+            Get the identifier of the gossiped content carried by the message,
+            used to suppress duplicate deliveries (None if the message does
+            not carry gossiped content)
+        """
+        return None
+
     @property
     def recipient(self) -> str:
         """
@@ -93,6 +115,238 @@ class Message:
         return self._date < other.date
 
 
+class Envelope:
+
+    """
+        An Envelope delivers a shared Message to a single recipient.
+
+        The Message (and therefore its data) is frozen once per send and shared
+        by every recipient, the Envelope only owns the routing informations
+        (recipient, date and nonce). Handlers MUST NOT mutate the received data
+        in place and should copy it first whenever they need to (copy-on-write).
+    """
+
+    __slots__ = ('_message', '_recipient', '_date', '_nonce', '_origin', '_generation')
+
+    def __init__(self, message: Message, recipient: str, date, origin: str = None):
+        self._message = message
+        self._recipient = recipient
+        self._date = date
+        self._nonce = 0
+        self._origin = origin
+        self._generation = None
+
+    @property
+    def message(self) -> Message:
+        """
+            Get the shared Message carried by the Envelope
+        """
+        return self._message
+
+    @property
+    def origin(self) -> str:
+        """
+            Get the origin of the message : the sender of the shared Message,
+            unless the Envelope was routed through another agent
+        """
+        if self._origin is None:
+            return self._message.origin
+
+        return self._origin
+
+    @property
+    def event(self) -> str:
+        """
+            Get the event that should be fired on reception of the Message
+        """
+        return self._message.event
+
+    @property
+    def data(self) -> tuple:
+        """
+            Get the data contained in the shared Message
+        """
+        return self._message.data
+
+    @property
+    def date(self):
+        """
+            Get the date at which the message should be received
+        """
+        return self._date
+
+    @date.setter
+    def date(self, date):
+        self._date = date
+
+    @property
+    def nonce(self) -> int:
+        """
+            Get the nonce of the message
+        """
+        return self._nonce
+
+    @nonce.setter
+    def nonce(self, value: int):
+        self._nonce = value
+
+    @property
+    def generation(self) -> int:
+        """
+            Get the generation of the recipient when the message was queued
+        """
+        return self._generation
+
+    @generation.setter
+    def generation(self, value: int):
+        self._generation = value
+
+    @property
+    def content_id(self):
+        """
+            Get the identifier of the gossiped content carried by the Message
+        """
+        return self._message.content_id
+
+    @property
+    def recipient(self) -> str:
+        """
+            Get the recipient of the message
+        """
+        return self._recipient
+
+    @recipient.setter
+    def recipient(self, recipient: str):
+        self._recipient = recipient
+
+    def __lt__(self, other: 'Message') -> bool:
+        if self._date == other.date:
+            return self._nonce < other.nonce
+
+        return self._date < other.date
+
+
+class Broadcast:
+
+    """
+        A Broadcast is a single queue entry standing for the delivery of the
+        same Message to many recipients at the same date.
+
+        It is only expanded to one Envelope per recipient when the Network
+        dequeues it, so a broadcast costs a single queue insertion.
+    """
+
+    __slots__ = ('_message', '_recipients', '_date', '_nonce')
+
+    def __init__(self, message: Message, recipients: list[str], date):
+        self._message = message
+        self._recipients = recipients
+        self._date = date
+        self._nonce = 0
+
+    @property
+    def message(self) -> Message:
+        """
+            Get the shared Message carried by the Broadcast
+        """
+        return self._message
+
+    @property
+    def recipients(self) -> list[str]:
+        """
+            Get the recipients of the Broadcast
+        """
+        return self._recipients
+
+    @property
+    def date(self):
+        """
+            Get the date at which the message should be received
+        """
+        return self._date
+
+    @date.setter
+    def date(self, date):
+        self._date = date
+
+    @property
+    def nonce(self) -> int:
+        """
+            Get the nonce of the Broadcast
+        """
+        return self._nonce
+
+    @nonce.setter
+    def nonce(self, value: int):
+        self._nonce = value
+
+    def __lt__(self, other: 'Message') -> bool:
+        if self._date == other.date:
+            return self._nonce < other.nonce
+
+        return self._date < other.date
+
+
+class Publication(Broadcast):
+
+    """
+        A Publication is a Broadcast addressed to the subscribers of a topic
+        instead of an explicit list of recipients.
+
+        Its recipients are resolved by the PubSubRouter of the Network when
+        the Publication is dequeued, so agents subscribing before its date
+        receive it too.
+
+        A direct Publication reaches all the subscribers at its date,
+        bypassing the hops of the mesh (e.g., a clock notification).
+    """
+
+    __slots__ = ('_topic', '_direct')
+
+    def __init__(self, message: Message, topic, date, direct: bool = False):
+        super().__init__(message, None, date)
+        self._topic = topic
+        self._direct = direct
+
+    @property
+    def topic(self):
+        """
+            Get the topic the Message is published to
+        """
+        return self._topic
+
+    @property
+    def direct(self) -> bool:
+        """
+            Check if the Publication bypasses the hops of the mesh
+        """
+        return self._direct
+
+
+class Bundle(Message):
+
+    """
+        Message carrying several Messages sent to the same recipient,
+        which unpacks and handles them in order.
+    """
+
+    def __init__(self, origin: str, messages: list[Message]):
+        _event = RECEIVE_BUNDLE
+        super().__init__(origin, _event, messages)
+
+
+class FlushOutbound(Message):
+
+    """
+        System Message sent by an agent to itself at the end of
+        an outbound coalescing window
+    """
+
+    def __init__(self, origin: str):
+        _event = FLUSH_OUTBOUND
+        super().__init__(origin, _event)
+
+
 class RunSchedulable(Message):
     """
         Message sent when a agent whishes to schedule the execution of one
@@ -273,11 +527,22 @@ class ProposeBlockHeader(Message):
 
     """
         Message sent to propose a newly created block header to other participants
+
+        A CompactBlock header lets the receivers rebuild the block from their
+        own transaction pool. The origin is carried along so that receivers
+        know whom to request the missing transactions from.
     """
 
     def __init__(self, origin: str, header: IBlockHeader):
         _event = RECEIVE_BLOCK_HEADER
-        super().__init__(origin, _event, header.from_serialized(header.serialize))
+        super().__init__(origin, _event, header, origin)
+
+    @property
+    def content_id(self):
+        if isinstance(self._data[0], CompactBlock):
+            return (RECEIVE_BLOCK_HEADER, self._data[0].hash)
+
+        return None
 
 
 class ProposeBlock(Message):
@@ -295,11 +560,26 @@ class RequestBlock(Message):
 
     """ 
         Message sent to request a specific block to one or several peer
+
+        If missing is given, only the transactions of the block at the given
+        indices are requested (see ProposeBlockHeader).
     """
 
-    def __init__(self, origin: str, hash: str):
+    def __init__(self, origin: str, hash: str, missing: list[int] = None):
         _event = REQUEST_BLOCK
-        super().__init__(origin, _event, hash)
+        super().__init__(origin, _event, hash, missing, origin)
+
+
+class BlockTransactions(Message):
+
+    """
+        Message sent in response to a RequestBlock for some of the
+        transactions of a block
+    """
+
+    def __init__(self, origin: str, hash: str, transactions: list['Transaction']):
+        _event = RECEIVE_BLOCK_TRANSACTIONS
+        super().__init__(origin, _event, hash, transactions)
 
 
 class DiffuseBlock(Message):
@@ -312,6 +592,10 @@ class DiffuseBlock(Message):
         _event = RECEIVE_BLOCK
         super().__init__(origin, _event, block.from_serialized(block.serialize()))
 
+    @property
+    def content_id(self):
+        return (RECEIVE_BLOCK, self._data[0].hash)
+
 
 class CreateTransaction(Message):
 
@@ -335,6 +619,57 @@ class DiffuseTransaction(Message):
         _event = RECEIVE_TRANSACTION
         super().__init__(origin, _event, tx.from_serialized(tx.serialize()))
 
+    @property
+    def content_id(self):
+        return (RECEIVE_TRANSACTION, self._data[0].hash)
+
+
+class AnnounceTransactions(Message):
+
+    """
+        Message sent to announce the (origin, nonce, hash) identifiers
+        of newly received transactions to a peer
+    """
+
+    def __init__(self, origin: str, tx_ids: list[tuple[str, int, str]]):
+        _event = RECEIVE_TRANSACTION_ANNOUNCEMENT
+        super().__init__(origin, _event, tx_ids, origin)
+
+
+class RequestTransactions(Message):
+
+    """
+        Message sent to request announced transactions from a peer
+    """
+
+    def __init__(self, origin: str, tx_ids: list[tuple[str, int, str]]):
+        _event = REQUEST_TRANSACTIONS
+        super().__init__(origin, _event, tx_ids, origin)
+
+
+class DiffuseTransactions(Message):
+
+    """
+        Message sent in response to a RequestTransactions with the requested
+        transactions still known, along with the requested identifiers
+    """
+
+    def __init__(self, origin: str, transactions: list['Transaction'], tx_ids: list[tuple[str, int, str]]):
+        _event = RECEIVE_TRANSACTIONS
+        super().__init__(origin, _event, transactions, tx_ids)
+
+
+class FlushTransactionAnnouncements(Message):
+
+    """
+        System Message sent by an agent to itself at the end of
+        a transaction announcement window
+    """
+
+    def __init__(self, origin: str):
+        _event = FLUSH_TRANSACTION_ANNOUNCEMENTS
+        super().__init__(origin, _event)
+
 class RequestBlockEndorsement(Message):
     """
         Message sent to request a block endorsement to one or several peer
@@ -2,11 +2,17 @@
     Network file class implementation
 """
 
-import queue
+import heapq
 import random
-import datetime
+from typing import Callable
 
-from agr4bs.network.messages import Message
+from agr4bs.network.messages import Message, Envelope, Broadcast, Publication, RunSchedulable
+from ..common import Clock
+from .event_queue import EventQueue, HeapEventQueue
+from .timer_wheel import TimerWheel, TimerSlot
+from .latency import LatencyModel
+from .seen_set import SeenSet
+from .pubsub import PubSubRouter
 from ..agents.agent import AgentType
 
 
@@ -17,13 +23,80 @@ class Network():
 
         Simulates a network, where messages can be sent (broadcast)
         with a configurable delay and message drop probability.
+
+        In-flight messages are stored in an EventQueue. Broadcasts, topic
+        publications (see PubSubRouter) and due timers take a single queue
+        entry, expanded to their recipients when dequeued, and messages
+        towards flushed agents are discarded lazily using generation counters.
     """
 
-    def __init__(self, delay: int = 0, drop_rate: float = 0):
+    # pylint: disable=too-many-arguments
+    def __init__(self, delay: int = 0, drop_rate: float = 0, event_queue: Callable[[], EventQueue] = None, clock: Clock = None,
+                 broadcast_seed: int = None, min_delay: int = 0, oracle_gossip: bool = False,
+                 latency_model: LatencyModel = None, duplicate_capacity: int = None, mesh_degree: int = None):
+        """
+            :param delay: the upper bound of the uniform message delays, in milliseconds
+            :type delay: int
+            :param drop_rate: the probability for a message to be dropped
+            :type drop_rate: float
+            :param event_queue: the EventQueue backend constructor (HeapEventQueue by default)
+            :type event_queue: Callable[[], EventQueue]
+            :param clock: the Clock expressing dates and delays (datetime based by default)
+            :type clock: Clock
+            :param broadcast_seed: seed of the order in which broadcast recipients are served and publication
+            subscribers split into mesh hops (given order if None)
+            :type broadcast_seed: int
+            :param min_delay: the lower bound of the uniform message delays, in milliseconds
+            :type min_delay: int
+            :param oracle_gossip: wether gossip reaches every agent of the static topology at once, at its
+            shortest path date, instead of hop by hop
+            :type oracle_gossip: bool
+            :param latency_model: the LatencyModel drawing the delay of each link, min_delay being its lowest
+            delay, and holding messages for their transmission time on links with a bandwidth (uniform delays if None)
+            :type latency_model: LatencyModel
+            :param duplicate_capacity: the number of gossiped contents each agent remembers to drop
+            duplicate deliveries (disabled if None)
+            :type duplicate_capacity: int
+            :param mesh_degree: the number of subscribers each subscriber forwards a publication to, each hop
+            of the mesh adding a network delay (all subscribers at once if None)
+            :type mesh_degree: int
+        """
+
+        if min_delay < 0 or min_delay > delay:
+            raise ValueError("Network min_delay must be positive and lower than delay")
+
         self._delay = delay
+        self._min_delay = min_delay
         self._drop_rate = drop_rate
         self._message_count = 0
-        self._message_queue = queue.PriorityQueue()
+        self._fanout = None
+        self._fanout_remaining = 0
+        self._fanout_date = None
+        self._broadcast_random = None
+        self._timers = TimerWheel()
+        self._oracle_gossip = oracle_gossip
+        self._latency_model = latency_model
+        self._links = {}
+        self._duplicate_capacity = duplicate_capacity
+        self._generations = {}
+        self._flushed_agents = 0
+        self._tombstoned_messages = 0
+        self._duplicates_suppressed = 0
+        self._topology = None
+        self._router = PubSubRouter(mesh_degree)
+
+        if broadcast_seed is not None:
+            self._broadcast_random = random.Random(broadcast_seed)
+
+        if clock is None:
+            clock = Clock()
+
+        self._clock = clock
+
+        if event_queue is None:
+            event_queue = HeapEventQueue
+
+        self._message_queue: EventQueue = event_queue()
 
     @property
     def delay(self):
@@ -32,6 +105,69 @@ class Network():
         """
         return self._delay
 
+    @property
+    def min_delay(self):
+        """
+            Get the minimum network delay
+        """
+        if self._latency_model is not None:
+            return self._latency_model.min_delay
+
+        return self._min_delay
+
+    @property
+    def latency_model(self) -> LatencyModel:
+        """
+            Get the LatencyModel of the links (None if delays are uniform)
+        """
+        return self._latency_model
+
+    @property
+    def tombstoned_messages(self) -> int:
+        """
+            Get the number of messages and timers discarded because
+            their recipient was flushed out of the Network
+        """
+        return self._tombstoned_messages
+
+    def generation(self, agent_name: str) -> int:
+        """
+            Get the current generation of an agent : positive while the agent
+            is registered, negative once it was flushed out of the Network
+            and None if it was never registered.
+        """
+        return self._generations.get(agent_name)
+
+    @property
+    def duplicate_capacity(self) -> int:
+        """
+            Get the number of gossiped contents remembered by each agent
+            to suppress duplicates (None if duplicates are delivered)
+        """
+        return self._duplicate_capacity
+
+    @property
+    def duplicates_suppressed(self) -> int:
+        """
+            Get the number of duplicate deliveries suppressed accross all agents
+        """
+        return self._duplicates_suppressed
+
+    def build_seen_set(self) -> SeenSet:
+        """
+            Build the SeenSet of an agent (None if duplicates are delivered)
+        """
+        if self._duplicate_capacity is None:
+            return None
+
+        return SeenSet(self._duplicate_capacity)
+
+    def record_duplicate(self) -> None:
+        """
+            Record the suppression of a duplicate delivery
+        """
+        self._duplicates_suppressed = self._duplicates_suppressed + 1
+
     @property
     def drop_rate(self):
         """
@@ -39,47 +175,422 @@ class Network():
         """
         return self._drop_rate
 
+    @property
+    def clock(self) -> Clock:
+        """
+            Get the Clock used to express dates and delays
+        """
+        return self._clock
+
+    @property
+    def event_queue(self) -> EventQueue:
+        """
+            Get the EventQueue backend holding the in-flight messages
+        """
+        return self._message_queue
+
+    @property
+    def oracle_gossip(self) -> bool:
+        """
+            Get the indicator about the oracle gossip mode
+        """
+        return self._oracle_gossip
+
+    @property
+    def topology(self) -> dict[str, tuple[str]]:
+        """
+            Get the static topology used by the oracle gossip mode,
+            mapping each agent to its outbound peers (None if unknown)
+        """
+        return self._topology
+
+    def set_topology(self, outbound_table: dict[str, list[str]]) -> None:
+        """
+            Set the static topology used by the oracle gossip mode
+
+            :param outbound_table: the outbound peers of every agent
+            :type outbound_table: dict[str, list[str]]
+        """
+        self._topology = {agent: tuple(peers) for agent, peers in outbound_table.items()}
+
+    def can_oracle_gossip(self) -> bool:
+        """
+            Check if gossip should be delivered analytically
+        """
+        return self._oracle_gossip is True and self._topology is not None
+
+    @property
+    def router(self) -> PubSubRouter:
+        """
+            Get the PubSubRouter holding the topic subscriptions
+        """
+        return self._router
+
+    @property
+    def timers(self) -> TimerWheel:
+        """
+            Get the TimerWheel holding the pending behavior timers
+        """
+        return self._timers
+
     def send_system_message(self, message: Message) -> None:
         """
             Send a system message to the network.
             System messages are not subject to delay or drops.
         """
+        self._enqueue(message)
+
+    def _enqueue(self, message: Message) -> None:
+        """
+            Stamp a message with its nonce and the generation of its
+            recipient and queue it. Messages towards flushed agents are
+            discarded right away.
+        """
+        generation = self._generations.get(message.recipient)
+
+        if generation is not None and generation < 0:
+            self._tombstoned_messages = self._tombstoned_messages + 1
+            return
+
+        message.generation = generation
         message.nonce = self._message_count
         self._message_count = self._message_count + 1
+        self._timers.close(message.date)
         self._message_queue.put(message)
 
-    def send_message(self, message: Message, no_drop=False) -> None:
+    def send_system_broadcast(self, broadcast: Broadcast) -> None:
+        """
+            Send a system Broadcast to the network.
+            The Broadcast takes a single slot in the queue and is
+            expanded to its recipients when dequeued.
+        """
+        broadcast.nonce = self._message_count
+        self._message_count = self._message_count + 1
+        self._timers.close(broadcast.date)
+        self._message_queue.put(broadcast)
+
+    def publish(self, publication: Publication) -> None:
+        """
+            Publish a Message to the subscribers of a topic.
+            Publications are system messages : they are not subject to drops
+            and are only delayed by the hops of the mesh (if any), which
+            direct Publications bypass.
+        """
+        self.send_system_broadcast(publication)
+
+    def schedule_timer(self, recipient: str, behavior_name: str, date) -> int:
+        """
+            Schedule the execution of a behavior of an agent at a given date.
+            Timers are system events : they are not subject to delay or drops.
+
+            :returns: the handle of the timer, to be used with cancel_timer
+            :rtype: int
+        """
+        nonce = self._message_count
+        self._message_count = self._message_count + 1
+        generation = self._generations.get(recipient)
+
+        if generation is not None and generation < 0:
+            self._tombstoned_messages = self._tombstoned_messages + 1
+            return nonce
+
+        if self._timers.schedule(recipient, behavior_name, date, nonce, generation):
+            self._message_queue.put(TimerSlot(date, nonce))
+
+        return nonce
+
+    def cancel_timer(self, handle: int) -> bool:
+        """
+            Cancel a pending timer
+
+            :param handle: the handle returned by schedule_timer
+            :type handle: int
+            :returns: wether the timer was pending
+            :rtype: bool
+        """
+        return self._timers.cancel(handle)
+
+    def send_message(self, message: Message, no_drop=False, size: int = 0) -> None:
         """
             Send a message to the network.
+
+            :param size: the serialized size of the message in bytes,
+            only used by links with a limited bandwidth
+            :type size: int
         """
+        if self._latency_model is not None:
+            self._send_link_message(message, no_drop, size)
+            return
+
         drop_probability = random.random()
 
         if drop_probability > self.drop_rate or no_drop is True:
-            delta = datetime.timedelta(
-                milliseconds=int(random.random() * self.delay))
+            delta = self._clock.milliseconds(self._sample_delay())
             message.date = message.date + delta
-            message.nonce = self._message_count
-            self._message_count = self._message_count + 1
-            self._message_queue.put(message)
+            self._enqueue(message)
+
+    def _send_link_message(self, message: Message, no_drop: bool, size: int) -> None:
+        """
+            Send a message through the link model
+        """
+        model = self._latency_model
+
+        if no_drop is False and model.drop(self._drop_rate):
+            return
+
+        origin = message.origin
+        recipient = message.recipient
+        date = message.date
+        bandwidth = model.bandwidth(origin, recipient)
+
+        if bandwidth is not None and size > 0:
+            link = (origin, recipient)
+            departure = self._links.get(link, date)
+
+            if departure < date:
+                departure = date
+
+            date = departure + self._clock.milliseconds(1000 * size / bandwidth)
+            self._links[link] = date
+
+        message.date = date + self._clock.milliseconds(model.delay(origin, recipient))
+        self._enqueue(message)
+
+    def _sample_delay(self, origin: str = None, recipient: str = None):
+        """
+            Draw the delay of a single message, in milliseconds
+        """
+        if self._latency_model is not None:
+            return self._latency_model.delay(origin, recipient)
+
+        return self._min_delay + int(random.random() * (self._delay - self._min_delay))
+
+    def _dropped(self) -> bool:
+        """
+            Draw wether a single message is dropped
+        """
+        if self._latency_model is not None:
+            return self._latency_model.drop(self._drop_rate)
+
+        return random.random() <= self._drop_rate
+
+    def send_gossip(self, message: Message, source: str, date, no_drop=False) -> int:
+        """
+            Deliver a gossiped Message to every agent reachable from source
+            through the static topology (oracle gossip mode).
+
+            Each link draws its own delay and drop, as a relayed message would
+            (link bandwidths are not accounted for),
+            and every agent receives a single Envelope at the date of the
+            shortest path, originating from its predecessor on that path.
+
+            :param message: the (frozen) Message to gossip
+            :type message: Message
+            :param source: the name of the agent originating the gossip
+            :type source: str
+            :param date: the date at which the gossip starts
+            :returns: the number of agents the Message was delivered to
+            :rtype: int
+        """
+        topology = self._topology
+        arrivals = {source: 0}
+        predecessors = {}
+        settled = set()
+        heap = [(0, source)]
+
+        while heap:
+            arrival, agent = heapq.heappop(heap)
+
+            if agent in settled:
+                continue
+
+            settled.add(agent)
+
+            for peer in topology.get(agent, ()):
+
+                if peer in settled:
+                    continue
+
+                if no_drop is False and self._dropped():
+                    continue
+
+                peer_arrival = arrival + self._sample_delay(agent, peer)
+
+                if peer_arrival < arrivals.get(peer, peer_arrival + 1):
+                    arrivals[peer] = peer_arrival
+                    predecessors[peer] = agent
+                    heapq.heappush(heap, (peer_arrival, peer))
+
+        for peer, predecessor in predecessors.items():
+            self._enqueue(Envelope(message, peer, date + self._clock.milliseconds(arrivals[peer]), predecessor))
+
+        return len(predecessors)
 
     def has_message(self):
         """
             Check if the network has a message to deliver
         """
-        return not self._message_queue.empty()
+        return self._fanout is not None or not self._message_queue.empty()
+
+    def next_date(self):
+        """
+            Get the date of the next entry to deliver without popping it,
+            or None if the network has no message to deliver
+
+            The entry may turn out to hold no message (e.g., a discarded
+            message or the slot of cancelled timers).
+        """
+        if self._fanout is not None:
+            return self._fanout_date
+
+        if self._message_queue.empty():
+            return None
+
+        return self._message_queue.peek().date
 
     def get_next_message(self):
         """
             Pop and return the next message from the message priority queue
+
+            A Broadcast or TimerSlot being expanded is always drained first : its
+            messages share its date and precede any other queued entry.
+
+            Messages whose recipient was flushed since they were queued are
+            discarded. Returns None if the queue only held discarded messages
+            or the slots of cancelled timers.
+        """
+        while self._fanout is None:
+
+            if self._message_queue.empty():
+                return None
+
+            message = self._message_queue.get()
+
+            if isinstance(message, Publication):
+                self._expand_publication(message)
+            elif isinstance(message, Broadcast):
+                self._expand(message)
+            elif isinstance(message, TimerSlot):
+                self._expand_timers(message)
+            elif message.generation is None or message.generation == self._generations[message.recipient]:
+                return message
+            else:
+                self._tombstoned_messages = self._tombstoned_messages + 1
+
+        message = next(self._fanout)
+        self._fanout_remaining = self._fanout_remaining - 1
+
+        if self._fanout_remaining == 0:
+            self._fanout = None
+
+        return message
+
+    def _expand_publication(self, publication: Publication) -> None:
+        """
+            Resolve the subscribers of a Publication and start the expansion
+            of its first hop, later hops being queued as Broadcasts
+        """
+        recipients = self._router.subscribers(publication.topic)
+
+        if self._router.mesh_degree is None or publication.direct is True:
+            self._expand(publication, recipients)
+            return
+
+        if self._broadcast_random is not None:
+            recipients = self._broadcast_random.sample(recipients, len(recipients))
+
+        hops = self._router.hops(recipients)
+        date = publication.date
+
+        for hop in hops[1:]:
+            date = date + self._clock.milliseconds(self._sample_delay())
+            self.send_system_broadcast(Broadcast(publication.message, hop, date))
+
+        if len(hops) > 0:
+            self._expand(publication, hops[0])
+
+    def _expand(self, broadcast: Broadcast, recipients: list[str] = None) -> None:
         """
-        return self._message_queue.get()
+            Start the lazy expansion of a Broadcast, to its own recipients
+            unless others are given
+        """
+        if recipients is None:
+            recipients = broadcast.recipients
+
+        if self._flushed_agents > 0:
+            generations = self._generations
+            alive = [recipient for recipient in recipients if generations.get(recipient, 0) >= 0]
+            self._tombstoned_messages = self._tombstoned_messages + len(recipients) - len(alive)
+            recipients = alive
+
+        if len(recipients) == 0:
+            return
+
+        if self._broadcast_random is not None:
+            recipients = self._broadcast_random.sample(recipients, len(recipients))
+
+        self._fanout = self._envelopes(broadcast, recipients)
+        self._fanout_remaining = len(recipients)
+        self._fanout_date = broadcast.date
+
+    @staticmethod
+    def _envelopes(broadcast: Broadcast, recipients: list[str]):
+        """
+            Lazily build the Envelopes of a Broadcast
+        """
+        for recipient in recipients:
+            envelope = Envelope(broadcast.message, recipient, broadcast.date)
+            envelope.nonce = broadcast.nonce
+            yield envelope
+
+    def _expand_timers(self, slot: TimerSlot) -> None:
+        """
+            Start the expansion of the timers due in a TimerSlot
+        """
+        timers = self._timers.pop(slot)
+
+        generations = self._generations
+        alive = [timer for timer in timers if timer[3] is None or timer[3] == generations[timer[1]]]
+
+        if len(alive) < len(timers):
+            self._tombstoned_messages = self._tombstoned_messages + len(timers) - len(alive)
+            timers = alive
+
+        if len(timers) > 0:
+            self._fanout = self._run_schedulables(slot.date, timers)
+            self._fanout_remaining = len(timers)
+            self._fanout_date = slot.date
+
+    @staticmethod
+    def _run_schedulables(date, timers: list[tuple[int, str, str, int]]):
+        """
+            Lazily build the RunSchedulable messages of due timers
+        """
+        for nonce, recipient, behavior_name, generation in timers:
+            message = RunSchedulable(recipient, behavior_name)
+            message.recipient = recipient
+            message.date = date
+            message.nonce = nonce
+            message.generation = generation
+            yield message
 
     def flush_agent(self, agent: 'ExternalAgent') -> None:
         """ Flush an ExternalAgent out of the Network
 
+        Every message or timer queued for the agent is discarded when
+        dequeued and every later message is discarded right away. The agent
+        is unsubscribed from every topic.
+
         :param agent: The ExternalAgent to flush out
         :type agent: ExternalAgent
         """
+        generation = self._generations.get(agent.name)
+
+        if generation is not None and generation >= 0:
+            self._generations[agent.name] = -(generation + 1)
+            self._flushed_agents = self._flushed_agents + 1
+
+        self._router.unsubscribe_agent(agent.name)
 
     def register_agent(self, agent: 'ExternalAgent') -> None:
         """
@@ -90,3 +601,11 @@ class Network():
         """
         if agent.type != AgentType.EXTERNAL_AGENT:
             raise ValueError("Network only allow EXTERNAL_AGENT")
+
+        generation = self._generations.get(agent.name)
+
+        if generation is None:
+            self._generations[agent.name] = 0
+        elif generation < 0:
+            self._generations[agent.name] = -generation
+            self._flushed_agents = self._flushed_agents - 1
@@ -0,0 +1,169 @@
+"""
+    PeerRegistry file class implementation
+"""
+
+import hashlib
+import random
+
+from .topology import _Pool
+
+
+def _node_id(name: str) -> int:
+    """
+        Get the 64 bits identifier of an agent name
+    """
+    return int.from_bytes(hashlib.sha256(name.encode('utf-8')).digest()[:8], 'big')
+
+
+class PeerRegistry:
+
+    """
+        PeerRegistry class implementation :
+
+        Bounded registry of the peers known by an agent, organized in
+        Kademlia-like buckets : a peer falls in the bucket of its log
+        distance (XOR metric) to the owner of the registry, and a full
+        bucket ignores newcomers. The registry thus holds at most
+        bucket_size peers per distance, about bucket_size * log2(n) peers
+        for n agents, biased towards the closest ones.
+
+        The candidates, i.e., the known peers the owner is not connected
+        to, are indexed incrementally so that they are sampled in O(1).
+
+        :param owner: the name of the agent owning the registry
+        :type owner: str
+        :param bucket_size: the maximum number of peers per bucket
+        :type bucket_size: int
+    """
+
+    def __init__(self, owner: str = None, bucket_size: int = 16):
+
+        if bucket_size <= 0:
+            raise ValueError("PeerRegistry bucket_size must be strictly positive")
+
+        self._owner = None
+        self._owner_id = None
+        self._bucket_size = bucket_size
+        self._buckets = {}
+        self._peers = _Pool([])
+        self._candidates = _Pool([])
+        self._connected = set()
+
+        if owner is not None:
+            self.bind(owner)
+
+    @property
+    def owner(self) -> str:
+        """
+            Get the name of the agent owning the registry
+        """
+        return self._owner
+
+    @property
+    def bucket_size(self) -> int:
+        """
+            Get the maximum number of peers per bucket
+        """
+        return self._bucket_size
+
+    @property
+    def candidates(self) -> int:
+        """
+            Get the number of known peers the owner is not connected to
+        """
+        return len(self._candidates)
+
+    def bind(self, owner: str) -> None:
+        """
+            Set the agent owning the registry, once before any peer is added
+        """
+        if self._owner is not None and self._owner != owner:
+            raise ValueError("PeerRegistry is already bound to another agent")
+
+        self._owner = owner
+        self._owner_id = _node_id(owner)
+
+    def bucket(self, peer: str) -> int:
+        """
+            Get the bucket of a peer, i.e., its log distance to the owner
+        """
+        return (_node_id(peer) ^ self._owner_id).bit_length()
+
+    def add(self, peer: str) -> bool:
+        """
+            Register a peer, unless it is the owner or its bucket is full
+
+            :returns: wether the peer is registered
+            :rtype: bool
+        """
+        if peer in self._peers:
+            return True
+
+        if peer == self._owner:
+            return False
+
+        bucket = self._buckets.setdefault(self.bucket(peer), set())
+
+        if len(bucket) >= self._bucket_size:
+            return False
+
+        bucket.add(peer)
+        self._peers.add(peer)
+
+        if peer not in self._connected:
+            self._candidates.add(peer)
+
+        return True
+
+    def remove(self, peer: str) -> None:
+        """
+            Forget a peer, freeing a slot in its bucket
+        """
+        if peer not in self._peers:
+            return
+
+        self._buckets[self.bucket(peer)].discard(peer)
+        self._peers.remove(peer)
+        self._candidates.remove(peer)
+
+    def connect(self, peer: str) -> None:
+        """
+            Record that the owner is connected to a peer, which
+            is no longer a candidate
+        """
+        self._connected.add(peer)
+        self._candidates.remove(peer)
+
+    def disconnect(self, peer: str) -> None:
+        """
+            Record that the owner is no longer connected to a peer,
+            which is a candidate again if it is registered
+        """
+        self._connected.discard(peer)
+
+        if peer in self._peers:
+            self._candidates.add(peer)
+
+    def choice(self, rng: random.Random = random) -> str:
+        """
+            Draw a candidate uniformly (None if there is none)
+        """
+        if len(self._candidates) == 0:
+            return None
+
+        return self._candidates.choice(rng)
+
+    def sample(self, count: int, rng: random.Random = random) -> list[str]:
+        """
+            Draw at most count distinct registered peers uniformly
+        """
+        return self._peers.sample(count, rng)
+
+    def __contains__(self, peer: str) -> bool:
+        return peer in self._peers
+
+    def __len__(self) -> int:
+        return len(self._peers)
+
+    def __iter__(self):
+        return iter(self._peers)
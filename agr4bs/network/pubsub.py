@@ -0,0 +1,154 @@
+"""
+    PubSubRouter file class implementation
+"""
+
+from typing import Hashable
+
+
+class PubSubRouter:
+
+    """
+        PubSubRouter class implementation :
+
+        Keeps track of the agents subscribed to each topic (i.e., a Group,
+        an attestation subnet or a block topic) so that a Message can be
+        published once to a topic instead of being sent to an explicit
+        list of recipients.
+
+        Subscribers are kept in subscription order and the tuple of the
+        subscribers of a topic is cached until the topic membership changes.
+
+        If mesh_degree is set, a publication is relayed through a mesh where
+        every agent forwards it to at most mesh_degree subscribers : the
+        subscribers are split in successive hops of mesh_degree, mesh_degree²,
+        ... agents, each hop being delivered one network delay after the
+        previous one.
+
+        :param mesh_degree: the maximum number of agents a publication is forwarded to by each agent (unbounded if None)
+        :type mesh_degree: int
+    """
+
+    def __init__(self, mesh_degree: int = None):
+
+        if mesh_degree is not None and mesh_degree < 1:
+            raise ValueError("PubSubRouter mesh_degree must be strictly positive")
+
+        self._mesh_degree = mesh_degree
+        self._topics = {}
+        self._subscriptions = {}
+        self._snapshots = {}
+
+    @property
+    def mesh_degree(self) -> int:
+        """
+            Get the maximum number of agents a publication is forwarded
+            to by each agent (None if unbounded)
+        """
+        return self._mesh_degree
+
+    @property
+    def topics(self) -> list[Hashable]:
+        """
+            Get the topics having at least one subscriber
+        """
+        return [topic for topic, subscribers in self._topics.items() if len(subscribers) > 0]
+
+    def subscribe(self, topic: Hashable, agent_name: str) -> bool:
+        """
+            Subscribe an agent to a topic
+
+            :param topic: the topic to subscribe to
+            :type topic: Hashable
+            :param agent_name: the name of the subscribing agent
+            :type agent_name: str
+            :returns: wether the agent was not already subscribed
+            :rtype: bool
+        """
+        subscribers = self._topics.setdefault(topic, {})
+
+        if agent_name in subscribers:
+            return False
+
+        subscribers[agent_name] = None
+        self._subscriptions.setdefault(agent_name, {})[topic] = None
+        self._snapshots.pop(topic, None)
+
+        return True
+
+    def unsubscribe(self, topic: Hashable, agent_name: str) -> bool:
+        """
+            Unsubscribe an agent from a topic
+
+            :param topic: the topic to unsubscribe from
+            :type topic: Hashable
+            :param agent_name: the name of the unsubscribing agent
+            :type agent_name: str
+            :returns: wether the agent was subscribed
+            :rtype: bool
+        """
+        subscribers = self._topics.get(topic)
+
+        if subscribers is None or agent_name not in subscribers:
+            return False
+
+        del subscribers[agent_name]
+        del self._subscriptions[agent_name][topic]
+        self._snapshots.pop(topic, None)
+
+        return True
+
+    def unsubscribe_agent(self, agent_name: str) -> int:
+        """
+            Unsubscribe an agent from every topic
+
+            :param agent_name: the name of the agent
+            :type agent_name: str
+            :returns: the number of topics the agent was subscribed to
+            :rtype: int
+        """
+        topics = list(self._subscriptions.pop(agent_name, {}))
+
+        for topic in topics:
+            del self._topics[topic][agent_name]
+            self._snapshots.pop(topic, None)
+
+        return len(topics)
+
+    def is_subscribed(self, topic: Hashable, agent_name: str) -> bool:
+        """
+            Check if an agent is subscribed to a topic
+        """
+        return agent_name in self._topics.get(topic, {})
+
+    def subscribers(self, topic: Hashable) -> tuple[str]:
+        """
+            Get the subscribers of a topic, in subscription order
+        """
+        snapshot = self._snapshots.get(topic)
+
+        if snapshot is None:
+            snapshot = self._snapshots[topic] = tuple(self._topics.get(topic, {}))
+
+        return snapshot
+
+    def hops(self, recipients: list[str]) -> list[list[str]]:
+        """
+            Split the recipients of a publication in the successive hops of
+            the mesh : mesh_degree agents are reached directly, each of them
+            forwarding to mesh_degree other agents at the next hop, and so on.
+        """
+        degree = self._mesh_degree
+
+        if degree is None:
+            return [recipients]
+
+        hops = []
+        start = 0
+        width = degree
+
+        while start < len(recipients):
+            hops.append(recipients[start:start + width])
+            start = start + width
+            width = width * degree
+
+        return hops
@@ -0,0 +1,61 @@
+"""
+    SeenSet file class implementation
+"""
+
+from collections import OrderedDict
+
+
+class SeenSet:
+
+    """
+        SeenSet class implementation :
+
+        Bounded set of the content identifiers recently seen by an agent.
+        Once full, the least recently seen identifier is evicted (LRU), so
+        a duplicate older than capacity distinct contents is let through.
+
+        :param capacity: the maximum number of identifiers remembered
+        :type capacity: int
+    """
+
+    def __init__(self, capacity: int):
+
+        if capacity <= 0:
+            raise ValueError("SeenSet capacity must be strictly positive")
+
+        self._capacity = capacity
+        self._entries = OrderedDict()
+
+    @property
+    def capacity(self) -> int:
+        """
+            Get the maximum number of identifiers remembered
+        """
+        return self._capacity
+
+    def add(self, content_id) -> bool:
+        """
+            Record a content identifier
+
+            :param content_id: the identifier of the content
+            :returns: wether the identifier was unseen
+            :rtype: bool
+        """
+        entries = self._entries
+
+        if content_id in entries:
+            entries.move_to_end(content_id)
+            return False
+
+        entries[content_id] = None
+
+        if len(entries) > self._capacity:
+            entries.popitem(last=False)
+
+        return True
+
+    def __contains__(self, content_id) -> bool:
+        return content_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,150 @@
+"""
+    TimerWheel file class implementation
+"""
+
+
+class TimerSlot:
+
+    """
+        A TimerSlot is the single queue entry standing for all the timers
+        due at the same date. It is expanded to the due timers when the
+        Network dequeues it.
+    """
+
+    __slots__ = ('_date', '_nonce')
+
+    def __init__(self, date, nonce: int):
+        self._date = date
+        self._nonce = nonce
+
+    @property
+    def date(self):
+        """
+            Get the date at which the timers of the slot are due
+        """
+        return self._date
+
+    @property
+    def nonce(self) -> int:
+        """
+            Get the nonce of the first timer of the slot
+        """
+        return self._nonce
+
+    def __lt__(self, other) -> bool:
+        if self._date == other.date:
+            return self._nonce < other.nonce
+
+        return self._date < other.date
+
+
+class TimerWheel:
+
+    """
+        TimerWheel class implementation :
+
+        Stores the pending behavior timers of the agents, grouped in slots
+        of timers due at the same date. Only the first timer of a slot
+        requires an entry (TimerSlot) in the main EventQueue, every other
+        timer of the slot is fired in the same batch.
+
+        A slot stays open, i.e., later timers due at its date join it, until
+        another entry is queued at that date (see close) : a timer scheduled
+        afterwards opens a new slot, so that timers and other messages of the
+        same date are still delivered in scheduling order.
+
+        Timers are identified by a handle (their nonce) and can be cancelled
+        in O(1) : a cancelled timer is simply removed from its slot and never
+        reaches the main EventQueue. A slot whose timers were all cancelled
+        is dropped, its queue entry being skipped when dequeued.
+    """
+
+    def __init__(self):
+        self._slots = {}
+        self._open = {}
+        self._timers = {}
+
+    # pylint: disable=too-many-arguments
+    def schedule(self, recipient: str, behavior_name: str, date, nonce: int, generation: int = None) -> bool:
+        """
+            Schedule the execution of a behavior of an agent at a given date
+
+            :param recipient: the name of the agent running the behavior
+            :type recipient: str
+            :param behavior_name: the name of the behavior to run
+            :type behavior_name: str
+            :param date: the date at which the behavior should run
+            :param nonce: the handle of the timer, ordering timers of the same slot
+            :type nonce: int
+            :param generation: the generation of the recipient in the Network
+            :type generation: int
+            :returns: wether a new slot was opened, its nonce being the one of the timer
+            :rtype: bool
+        """
+        slot_nonce = self._open.get(date)
+        opened = slot_nonce is None
+
+        if opened:
+            slot_nonce = self._open[date] = nonce
+            self._slots[slot_nonce] = {}
+
+        self._slots[slot_nonce][nonce] = (recipient, behavior_name, generation)
+        self._timers[nonce] = (date, slot_nonce)
+
+        return opened
+
+    def close(self, date) -> None:
+        """
+            Close the open slot of a date (if any) : an entry other
+            than a timer was queued at this date
+        """
+        self._open.pop(date, None)
+
+    def cancel(self, nonce: int) -> bool:
+        """
+            Cancel a pending timer
+
+            :param nonce: the handle of the timer to cancel
+            :type nonce: int
+            :returns: wether the timer was pending
+            :rtype: bool
+        """
+        timer = self._timers.pop(nonce, None)
+
+        if timer is None:
+            return False
+
+        date, slot_nonce = timer
+        slot = self._slots[slot_nonce]
+        del slot[nonce]
+
+        if len(slot) == 0:
+            del self._slots[slot_nonce]
+
+            if self._open.get(date) == slot_nonce:
+                del self._open[date]
+
+        return True
+
+    def pop(self, slot: TimerSlot) -> list[tuple[int, str, str, int]]:
+        """
+            Pop every timer of a slot
+
+            :returns: the list of (nonce, recipient, behavior_name, generation) in scheduling order
+            :rtype: list[tuple[int, str, str, int]]
+        """
+        if self._open.get(slot.date) == slot.nonce:
+            del self._open[slot.date]
+
+        timers = self._slots.pop(slot.nonce, None)
+
+        if timers is None:
+            return []
+
+        for nonce in timers:
+            del self._timers[nonce]
+
+        return [(nonce, *timer) for nonce, timer in timers.items()]
+
+    def __len__(self) -> int:
+        return len(self._timers)
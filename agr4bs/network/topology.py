@@ -0,0 +1,403 @@
+"""
+    Topology file class implementation
+"""
+
+import random
+from typing import Union
+
+
+class _Pool:
+
+    """
+        Set of agent names supporting O(1) uniform sampling and removal
+    """
+
+    def __init__(self, names: list[str]):
+        self._names = list(names)
+        self._positions = {name: i for i, name in enumerate(self._names)}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def choice(self, rng: random.Random) -> str:
+        """
+            Draw a name uniformly
+        """
+        return self._names[int(rng.random() * len(self._names))]
+
+    def add(self, name: str) -> None:
+        """
+            Add a name if it is not in the pool yet
+        """
+        if name in self._positions:
+            return
+
+        self._positions[name] = len(self._names)
+        self._names.append(name)
+
+    def sample(self, count: int, rng: random.Random) -> list[str]:
+        """
+            Draw at most count distinct names uniformly
+        """
+        return rng.sample(self._names, min(count, len(self._names)))
+
+    def remove(self, name: str) -> None:
+        """
+            Remove a name by swapping it with the last one
+        """
+        position = self._positions.pop(name, None)
+
+        if position is None:
+            return
+
+        last = self._names.pop()
+
+        if last != name:
+            self._names[position] = last
+            self._positions[last] = position
+
+
+class _TopologyBuilder:
+
+    """
+        Incrementally builds a Topology while enforcing the outbound and
+        inbound limits of every agent. Agents whose inbound slots are all
+        taken are removed from every candidate pool in O(1).
+    """
+
+    # Number of random draws before falling back to a scan of the pool
+    ATTEMPTS = 16
+
+    def __init__(self, names: list[str], max_outbound: Union[int, dict[str, int]],
+                 max_inbound: Union[int, dict[str, int]], rng: random.Random):
+        self.names = names
+        self.rng = rng
+        self.outbound_table = {name: [] for name in names}
+        self.inbound_table = {name: [] for name in names}
+        self._outbounds = {name: set() for name in names}
+        self._max_outbound = max_outbound
+        self._max_inbound = max_inbound
+        self.available = _Pool(name for name in names if self.max_inbound(name) > 0)
+        self._pools = [self.available]
+
+    def max_outbound(self, name: str) -> int:
+        """
+            Get the maximum number of outbound peers of an agent
+        """
+        if isinstance(self._max_outbound, dict):
+            return self._max_outbound[name]
+
+        return self._max_outbound
+
+    def max_inbound(self, name: str) -> int:
+        """
+            Get the maximum number of inbound peers of an agent
+        """
+        if isinstance(self._max_inbound, dict):
+            return self._max_inbound[name]
+
+        return self._max_inbound
+
+    def pool(self, names: list[str]) -> _Pool:
+        """
+            Build a candidate pool kept in sync with the inbound limits
+        """
+        pool = _Pool(name for name in names if name in self.available)
+        self._pools.append(pool)
+
+        return pool
+
+    def missing(self, origin: str) -> int:
+        """
+            Get the number of outbound peers an agent still lacks
+        """
+        return self.max_outbound(origin) - len(self.outbound_table[origin])
+
+    def can_link(self, origin: str, target: str) -> bool:
+        """
+            Check if target can be added to the outbound peers of origin
+        """
+        return origin != target and target not in self._outbounds[origin] and target in self.available
+
+    def link(self, origin: str, target: str) -> None:
+        """
+            Add target to the outbound peers of origin
+        """
+        self.outbound_table[origin].append(target)
+        self._outbounds[origin].add(target)
+        self.inbound_table[target].append(origin)
+
+        if len(self.inbound_table[target]) >= self.max_inbound(target):
+            for pool in self._pools:
+                pool.remove(target)
+
+    def pick(self, origin: str, pool: _Pool) -> str:
+        """
+            Draw a valid outbound candidate of origin from a pool
+            (None if the pool holds none)
+        """
+        if len(pool) == 0:
+            return None
+
+        for _ in range(self.ATTEMPTS):
+            candidate = pool.choice(self.rng)
+
+            if self.can_link(origin, candidate):
+                return candidate
+
+        for candidate in pool:
+            if self.can_link(origin, candidate):
+                return candidate
+
+        return None
+
+    def fill(self, origin: str, pool: _Pool = None) -> None:
+        """
+            Complete the outbound peers of origin with uniform candidates
+        """
+        if pool is None:
+            pool = self.available
+
+        while self.missing(origin) > 0:
+            candidate = self.pick(origin, pool)
+
+            if candidate is None:
+                return
+
+            self.link(origin, candidate)
+
+    def build(self) -> 'Topology':
+        """
+            Get the built Topology
+        """
+        return Topology(self.outbound_table, self.inbound_table)
+
+
+class Topology:
+
+    """
+        Topology class implementation :
+
+        A static peer-to-peer topology, holding the outbound and inbound
+        peers of every agent.
+
+        The generators build topologies where every agent has at most
+        max_outbound outbound peers and max_inbound inbound peers (either
+        a single value or a value per agent). They run in near-linear time
+        and are seeded, so that a topology can be rebuilt, or saved to and
+        loaded from an edge list file and reused across runs.
+    """
+
+    def __init__(self, outbound_table: dict[str, list[str]], inbound_table: dict[str, list[str]] = None):
+        self._outbound_table = outbound_table
+
+        if inbound_table is None:
+            inbound_table = {name: [] for name in outbound_table}
+
+            for origin, targets in outbound_table.items():
+                for target in targets:
+                    inbound_table.setdefault(target, []).append(origin)
+
+        self._inbound_table = inbound_table
+
+    @property
+    def outbound_table(self) -> dict[str, list[str]]:
+        """
+            Get the outbound peers of every agent
+        """
+        return self._outbound_table
+
+    @property
+    def inbound_table(self) -> dict[str, list[str]]:
+        """
+            Get the inbound peers of every agent
+        """
+        return self._inbound_table
+
+    @property
+    def edges(self) -> list[tuple[str, str]]:
+        """
+            Get the (origin, target) outbound links of the topology
+        """
+        return [(origin, target) for origin, targets in self._outbound_table.items() for target in targets]
+
+    @staticmethod
+    def random_regular(names: list[str], max_outbound: Union[int, dict[str, int]] = 5,
+                       max_inbound: Union[int, dict[str, int]] = 20, seed: int = None) -> 'Topology':
+        """
+            Build a random topology where every agent picks its outbound
+            peers uniformly among the agents with free inbound slots
+
+            :param names: the names of the agents
+            :type names: list[str]
+            :param max_outbound: the maximum number of outbound peers of the agents
+            :type max_outbound: Union[int, dict[str, int]]
+            :param max_inbound: the maximum number of inbound peers of the agents
+            :type max_inbound: Union[int, dict[str, int]]
+            :param seed: the seed of the generator
+            :type seed: int
+        """
+        rng = random.Random(seed)
+        builder = _TopologyBuilder(names, max_outbound, max_inbound, rng)
+
+        for origin in rng.sample(names, len(names)):
+            builder.fill(origin)
+
+        return builder.build()
+
+    # pylint: disable=too-many-arguments
+    @staticmethod
+    def small_world(names: list[str], max_outbound: Union[int, dict[str, int]] = 5,
+                    max_inbound: Union[int, dict[str, int]] = 20, rewiring: float = 0.1, seed: int = None) -> 'Topology':
+        """
+            Build a Watts-Strogatz small-world topology : agents are laid on
+            a ring and linked to their successors, each link being rewired
+            to a uniform agent with a given probability
+
+            :param rewiring: the probability to rewire each link of the ring
+            :type rewiring: float
+        """
+        rng = random.Random(seed)
+        builder = _TopologyBuilder(names, max_outbound, max_inbound, rng)
+        count = len(names)
+
+        for index, origin in enumerate(names):
+            for offset in range(1, min(builder.max_outbound(origin), count - 1) + 1):
+                target = names[(index + offset) % count]
+
+                if rng.random() < rewiring:
+                    target = builder.pick(origin, builder.available)
+
+                if target is not None and builder.can_link(origin, target):
+                    builder.link(origin, target)
+
+        for origin in names:
+            builder.fill(origin)
+
+        return builder.build()
+
+    @staticmethod
+    def scale_free(names: list[str], max_outbound: Union[int, dict[str, int]] = 5,
+                   max_inbound: Union[int, dict[str, int]] = 20, seed: int = None) -> 'Topology':
+        """
+            Build a Barabasi-Albert scale-free topology : agents join one
+            after the other and pick their outbound peers among the previous
+            agents with a probability proportional to their inbound degree
+            (plus one), until their inbound slots are taken
+        """
+        rng = random.Random(seed)
+        builder = _TopologyBuilder(names, max_outbound, max_inbound, rng)
+
+        # Every agent appears once, plus once per inbound peer
+        weighted = []
+
+        for origin in names:
+            for _ in range(builder.max_outbound(origin)):
+                target = None
+
+                for _ in range(_TopologyBuilder.ATTEMPTS):
+                    if len(weighted) == 0:
+                        break
+
+                    candidate = weighted[int(rng.random() * len(weighted))]
+
+                    if builder.can_link(origin, candidate):
+                        target = candidate
+                        break
+
+                if target is None:
+                    break
+
+                builder.link(origin, target)
+                weighted.append(target)
+
+            weighted.append(origin)
+
+        # The first agents could not find enough peers when joining
+        for origin in names:
+            builder.fill(origin)
+
+        return builder.build()
+
+    # pylint: disable=too-many-arguments
+    @staticmethod
+    def region_clustered(names: list[str], regions: dict[str, str], max_outbound: Union[int, dict[str, int]] = 5,
+                         max_inbound: Union[int, dict[str, int]] = 20, inter_region: float = 0.1,
+                         seed: int = None) -> 'Topology':
+        """
+            Build a topology clustered by region : each outbound peer is drawn
+            among the agents of the same region, or among all the agents with a
+            given probability
+
+            :param regions: the region of every agent
+            :type regions: dict[str, str]
+            :param inter_region: the probability of an outbound peer to be drawn outside the region
+            :type inter_region: float
+        """
+        rng = random.Random(seed)
+        builder = _TopologyBuilder(names, max_outbound, max_inbound, rng)
+
+        members = {}
+
+        for name in names:
+            members.setdefault(regions.get(name), []).append(name)
+
+        pools = {region: builder.pool(region_names) for region, region_names in members.items()}
+
+        for origin in rng.sample(names, len(names)):
+            pool = pools[regions.get(origin)]
+
+            while builder.missing(origin) > 0:
+                target = None
+
+                if rng.random() >= inter_region:
+                    target = builder.pick(origin, pool)
+
+                if target is None:
+                    target = builder.pick(origin, builder.available)
+
+                if target is None:
+                    break
+
+                builder.link(origin, target)
+
+        return builder.build()
+
+    def save(self, path: str) -> None:
+        """
+            Save the topology as an edge list file : one "origin target"
+            outbound link per line
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            for origin, target in self.edges:
+                file.write(f"{origin} {target}\n")
+
+    @staticmethod
+    def load(path: str, names: list[str] = None) -> 'Topology':
+        """
+            Load a topology from an edge list file. Empty lines and lines
+            starting with # are ignored.
+
+            :param names: the names of the agents, to include the agents without any link
+            :type names: list[str]
+        """
+        outbound_table = {name: [] for name in names or []}
+
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+
+                if not line or line.startswith('#'):
+                    continue
+
+                origin, target = line.split()
+                outbound_table.setdefault(origin, []).append(target)
+                outbound_table.setdefault(target, [])
+
+        return Topology(outbound_table)
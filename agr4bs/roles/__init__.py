@@ -6,3 +6,6 @@ from .peer import Peer
 from .static_peer import StaticPeer
 from .bootstrap import Bootstrap
 from .static_bootstrap import StaticBootstrap
+from .churn import Churn
+from .compact_block_relay import CompactBlockRelay
+from .transaction_announcer import TransactionAnnouncer
@@ -0,0 +1,120 @@
+"""
+Implementation of the Churn role
+
+ChurnContextChange:
+
+The ChurnContextChange exposes changes that need to be made to the
+Environment context when the Role is mounted and unmounted.
+
+Churn:
+
+Workload generator making agents join and leave the Environment
+at given rates while the simulation runs.
+"""
+
+import math
+import random
+from typing import Callable
+
+from ..environment import Environment
+from ..agents import AgentType, ContextChange, ExternalAgent
+from .role import Role, RoleType
+from ..common import every, export
+
+
+class ChurnContextChange(ContextChange):
+    """
+        Context changes that need to be made to the Environment when
+        the associated Role (Churn) is either
+        mounted or unmounted.
+    """
+
+    def __init__(self, join_rate: float, leave_rate: float, agent_builder: Callable[[int], ExternalAgent], seed: int) -> None:
+        super().__init__()
+
+        self.churn_join_rate = join_rate
+        self.churn_leave_rate = leave_rate
+        self.churn_agent_builder = agent_builder
+        self.churn_random = random.Random(seed)
+        self.churn_joined = 0
+        self.churn_left = 0
+
+
+def _poisson(rng: random.Random, rate: float) -> int:
+    """
+        Draw a Poisson distributed number of events (Knuth's algorithm,
+        large rates being split to avoid underflows)
+    """
+    count = 0
+
+    while rate > 0:
+        step = min(rate, 30)
+        rate = rate - step
+        limit = math.exp(-step)
+        product = rng.random()
+
+        while product > limit:
+            count = count + 1
+            product = product * rng.random()
+
+    return count
+
+
+class Churn(Role):
+    """
+        Implementation of the Churn Role, mounted on the Environment.
+
+        Every second, a Poisson distributed number of agents (of mean
+        leave_rate) leaves the Environment, then a Poisson distributed
+        number of agents (of mean join_rate) built by agent_builder joins it.
+
+        :param join_rate: the average number of agents joining per second
+        :type join_rate: float
+        :param leave_rate: the average number of agents leaving per second
+        :type leave_rate: float
+        :param agent_builder: builds the n-th joining agent (no agent joins if None)
+        :type agent_builder: Callable[[int], ExternalAgent]
+        :param seed: the seed of the churn random generator
+        :type seed: int
+    """
+
+    def __init__(self, join_rate: float = 0, leave_rate: float = 0,
+                 agent_builder: Callable[[int], ExternalAgent] = None, seed: int = None) -> None:
+        super().__init__(RoleType.CHURN, AgentType.EXTERNAL_AGENT)
+        self._join_rate = join_rate
+        self._leave_rate = leave_rate
+        self._agent_builder = agent_builder
+        self._seed = seed
+
+    def context_change(self) -> ContextChange:
+        """
+            Returns the ContextChange required when mounting / unmounting the Role
+        """
+        return ChurnContextChange(self._join_rate, self._leave_rate, self._agent_builder, self._seed)
+
+    @staticmethod
+    @export
+    @every(seconds=1)
+    def churn(agent: Environment):
+        """
+            Make agents leave and join the Environment
+        """
+        rng = agent.context['churn_random']
+        leaves = min(_poisson(rng, agent.context['churn_leave_rate']), agent.agents_count)
+
+        if leaves > 0:
+            leaving = rng.sample(agent.agents_names, leaves)
+            agent.remove_agents([agent.get_agent_by_name(name) for name in leaving])
+            agent.context['churn_left'] = agent.context['churn_left'] + leaves
+
+        builder = agent.context['churn_agent_builder']
+
+        if builder is None:
+            return
+
+        joins = _poisson(rng, agent.context['churn_join_rate'])
+
+        if joins > 0:
+            joined = agent.context['churn_joined']
+            agent.add_agents([builder(joined + i) for i in range(joins)])
+            agent.context['churn_joined'] = joined + joins
@@ -0,0 +1,208 @@
+"""
+Implementation of the CompactBlockRelay role
+
+CompactBlockRelayContextChange:
+
+The CompactBlockRelayContextChange exposes changes that need to be made to the
+Agent context when the Role is mounted and unmounted.
+
+CompactBlockRelay:
+
+Header-first block relay : blocks are announced as CompactBlocks and
+receivers only request the transactions missing from their tx_pool.
+"""
+
+import datetime
+
+from ..agents import ExternalAgent, ContextChange, AgentType
+from ..blockchain import IBlock, CompactBlock, ITransaction, lookup_transaction
+from ..network.messages import ProposeBlockHeader, RequestBlock, BlockTransactions
+from ..events import RECEIVE_BLOCK_HEADER, REQUEST_BLOCK, RECEIVE_BLOCK_TRANSACTIONS
+from .role import Role, RoleType
+from ..common import on, export
+
+
+class CompactBlockRelayContextChange(ContextChange):
+    """
+        Context changes that need to be made to the Agent when
+        the associated Role (CompactBlockRelay) is either
+        mounted or unmounted.
+    """
+
+    def __init__(self, timeout: datetime.timedelta) -> None:
+        super().__init__()
+
+        self.compact_block_timeout = timeout
+
+        # CompactBlocks waiting for their missing transactions, indexed by hash
+        self.pending_compact_blocks = {}
+
+
+class _PendingCompactBlock:
+    """
+        A CompactBlock waiting for its missing transactions, along with
+        the peers that announced it and were not asked for them yet
+    """
+
+    __slots__ = ('header', 'transactions', 'announcers', 'deadline')
+
+    def __init__(self, header: CompactBlock, transactions: list[ITransaction], announcer: str) -> None:
+        self.header = header
+        self.transactions = transactions
+        self.announcers = [announcer]
+        self.deadline = None
+
+
+def _request_missing_transactions(agent: ExternalAgent, pending: _PendingCompactBlock) -> None:
+    """
+        Request the missing transactions of a pending block from the next
+        peer that announced it, or forget the block if there is none left
+    """
+    block_hash = pending.header.hash
+
+    if len(pending.announcers) == 0:
+        del agent.context['pending_compact_blocks'][block_hash]
+        return
+
+    peer = pending.announcers.pop(0)
+    timeout = agent.network.clock.duration(agent.context['compact_block_timeout'])
+    pending.deadline = agent.date + timeout
+
+    missing = [index for index, tx in enumerate(pending.transactions) if tx is None]
+    agent.send_message(RequestBlock(agent.name, block_hash, missing), peer, no_drop=True)
+
+
+class CompactBlockRelay(Role):
+    """
+        Implementation of the CompactBlockRelay Role, mounted alongside
+        a BlockchainMaintainer.
+
+        Blocks are announced to the peers with their header and the
+        identifiers of their transactions (ProposeBlockHeader). A receiver
+        rebuilds the block from its own tx_pool, requests the missing
+        transactions from the announcing peer (RequestBlock) and hands the
+        rebuilt block to receive_block once they arrive (BlockTransactions).
+
+        Requests and replies are not subject to drops. If a peer does not
+        reply within timeout, or replies without some of the transactions,
+        they are requested from the next peer announcing the block.
+
+        :param timeout: the delay after which an unanswered request is retried
+        :type timeout: datetime.timedelta
+    """
+
+    def __init__(self, timeout: datetime.timedelta = datetime.timedelta(seconds=1)) -> None:
+        dependencies = [RoleType.BLOCKCHAIN_MAINTAINER]
+        super().__init__(RoleType.COMPACT_BLOCK_RELAY, AgentType.EXTERNAL_AGENT, dependencies)
+        self._timeout = timeout
+
+    def context_change(self) -> ContextChange:
+        """
+            Returns the ContextChange required when mounting / unmounting the Role
+        """
+        return CompactBlockRelayContextChange(self._timeout)
+
+    @staticmethod
+    @export
+    def announce_block(agent: ExternalAgent, block: IBlock) -> ProposeBlockHeader:
+        """
+            Build the Message announcing a block to the peers
+        """
+        return ProposeBlockHeader(agent.name, block.compact())
+
+    @staticmethod
+    @export
+    def lookup_transaction(agent: ExternalAgent, origin: str, nonce: int, tx_hash: str) -> ITransaction:
+        """
+            Find a transaction in the tx_pool (None if unknown)
+        """
+        return lookup_transaction(agent.context['tx_pool'], origin, nonce, tx_hash)
+
+    @staticmethod
+    @export
+    @on(RECEIVE_BLOCK_HEADER)
+    def receive_block_header(agent: ExternalAgent, header: CompactBlock, sender: str):
+        """
+            Behavior called on RECEIVE_BLOCK_HEADER event.
+            Rebuild the announced block from the tx_pool, or request
+            the missing transactions from the sender.
+
+            The senders of a pending block are kept as fallbacks, and
+            asked once the pending request timed out. The header of a
+            pending block is rejected, so that later announcements of
+            the block are not dropped as duplicates.
+        """
+        if not isinstance(header, CompactBlock):
+            return
+
+        pending = agent.context['pending_compact_blocks'].get(header.hash)
+
+        if pending is not None:
+            if sender not in pending.announcers:
+                pending.announcers.append(sender)
+
+            if agent.date >= pending.deadline:
+                _request_missing_transactions(agent, pending)
+
+            return False
+
+        if agent.context['blockchain'].get_block(header.hash) is not None:
+            return
+
+        transactions = [agent.lookup_transaction(*tx_id) for tx_id in header.transaction_ids]
+
+        if None not in transactions:
+            return agent.receive_block(header.rebuild(transactions))
+
+        pending = _PendingCompactBlock(header, transactions, sender)
+        agent.context['pending_compact_blocks'][header.hash] = pending
+        _request_missing_transactions(agent, pending)
+
+        return False
+
+    @staticmethod
+    @export
+    @on(REQUEST_BLOCK)
+    def send_block_transactions(agent: ExternalAgent, block_hash: str, missing: list[int], requester: str):
+        """
+            Behavior called on REQUEST_BLOCK event.
+            Send the requested transactions of a block, or no
+            transaction if the block is unknown.
+        """
+        if missing is None:
+            return
+
+        block = agent.context['blockchain'].get_block(block_hash)
+        transactions = []
+
+        if block is not None:
+            transactions = [block.transactions[index] for index in missing]
+
+        agent.send_message(BlockTransactions(agent.name, block_hash, transactions), requester, no_drop=True)
+
+    @staticmethod
+    @export
+    @on(RECEIVE_BLOCK_TRANSACTIONS)
+    def receive_block_transactions(agent: ExternalAgent, block_hash: str, transactions: list[ITransaction]):
+        """
+            Behavior called on RECEIVE_BLOCK_TRANSACTIONS event.
+            Complete a pending block and hand it to receive_block, or
+            request the transactions still missing from the next peer.
+        """
+        pending = agent.context['pending_compact_blocks'].get(block_hash)
+
+        if pending is None:
+            return
+
+        # Transactions are matched by hash, a late reply to an earlier request being still usable
+        received = {tx.hash: tx for tx in transactions}
+        tx_ids = pending.header.transaction_ids
+        pending.transactions = [tx if tx is not None else received.get(tx_ids[index][2])
+                                for index, tx in enumerate(pending.transactions)]
+
+        if None in pending.transactions:
+            _request_missing_transactions(agent, pending)
+            return
+
+        del agent.context['pending_compact_blocks'][block_hash]
+        agent.receive_block(pending.header.rebuild(pending.transactions))
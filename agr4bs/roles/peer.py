@@ -14,7 +14,7 @@ The Peer implementation which MUST contain the following behaviors :
 
 """
 
-import random
+from ..network import PeerRegistry
 from ..network.messages import AcceptInboundPeer, DenyInboundPeer, DropInboundPeer, PeerDiscovery, RequestInboundPeer, RequestBootstrapPeers, RequestPeerDiscovery
 from ..events import INIT, CLEANUP, DROP_INBOUND_PEER, DROP_OUTBOUND_PEER
 from ..events import BOOTSTRAP_PEERS, REQUEST_PEER_DISCOVERY, PEER_DISCOVERY
@@ -34,14 +34,45 @@ class PeerContextChange(ContextChange):
         mounted or unmounted.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, bucket_size: int = 16, discovery_size: int = 16) -> None:
         super().__init__()
 
         self.inbound_peers = set()
         self.inbound_peers_activity = {}
         self.outbound_peers = set()
         self.outbound_peers_activity = {}
-        self.peer_registry = set()
+        self.peer_registry = PeerRegistry(bucket_size=bucket_size)
+        self.peer_discovery_size = discovery_size
+
+
+def _registry(agent: ExternalAgent) -> PeerRegistry:
+    """
+        Get the PeerRegistry of an agent, bound to it on first use
+    """
+    registry = agent.context['peer_registry']
+
+    if registry.owner is None:
+        registry.bind(agent.name)
+
+    return registry
+
+
+def _connect(agent: ExternalAgent, key: str, peer: str) -> None:
+    """
+        Add a peer to the inbound or outbound peers of an agent
+    """
+    agent.context[key].add(peer)
+    _registry(agent).connect(peer)
+
+
+def _disconnect(agent: ExternalAgent, key: str, peer: str) -> None:
+    """
+        Remove a peer from the inbound or outbound peers of an agent
+    """
+    agent.context[key].discard(peer)
+
+    if peer not in agent.context['inbound_peers'] and peer not in agent.context['outbound_peers']:
+        _registry(agent).disconnect(peer)
 
 
 class Peer(Role):
@@ -52,17 +83,27 @@ class Peer(Role):
 
         This class MUST be inherited from and expanded to implement
         the actual logic of it's behaviors.
+
+        Known peers are kept in a bounded PeerRegistry, which indexes the
+        candidates for new connections, and peer discovery responses hold
+        at most discovery_size peers drawn from the registry.
+
+        :param bucket_size: the maximum number of known peers per registry bucket
+        :type bucket_size: int
+        :param discovery_size: the maximum number of peers sent in a discovery response
+        :type discovery_size: int
     """
 
-    def __init__(self) -> None:
+    def __init__(self, bucket_size: int = 16, discovery_size: int = 16) -> None:
         super().__init__(RoleType.PEER, AgentType.EXTERNAL_AGENT)
+        self._bucket_size = bucket_size
+        self._discovery_size = discovery_size
 
-    @staticmethod
-    def context_change() -> ContextChange:
+    def context_change(self) -> ContextChange:
         """
             Returns the ContextChange required whent mounting / unmounting the Role
         """
-        return PeerContextChange()
+        return PeerContextChange(self._bucket_size, self._discovery_size)
 
     @staticmethod
     @export
@@ -121,23 +162,14 @@ class Peer(Role):
             and send a connection request to it.
         """
 
-        if len(agent.context['peer_registry']) == 0:
-            return
-
         if len(agent.context['outbound_peers']) == agent.max_outbound_peers:
             return
 
-        all_known_peers = list(agent.context['peer_registry'])
-        inbounds = agent.context['inbound_peers']
-        outbounds = agent.context['outbound_peers']
+        candidate = _registry(agent).choice()
 
-        valid_candidates = [
-            peer for peer in all_known_peers if peer not in inbounds.union(outbounds)]
-
-        if len(valid_candidates) == 0:
+        if candidate is None:
             return
 
-        candidate = random.choice(valid_candidates)
         agent.send_request_inbound_peer(candidate)
 
     @staticmethod
@@ -158,16 +190,10 @@ class Peer(Role):
         if n_outbound_peers == 0:
             agent.send_request_bootstrap_peers()
         else:
-            all_known_peers = list(agent.context['peer_registry'])
-            inbounds = agent.context['inbound_peers']
-            outbounds = agent.context['outbound_peers']
-
-            valid_candidates = [
-                peer for peer in all_known_peers if peer not in inbounds.union(outbounds)]
+            registry = _registry(agent)
 
-            if len(valid_candidates) > 1:
-                selected = random.choice(valid_candidates)
-                agent.send_request_peer_discovery(selected)
+            if registry.candidates > 1:
+                agent.send_request_peer_discovery(registry.choice())
 
     @staticmethod
     @export
@@ -186,9 +212,11 @@ class Peer(Role):
     @on(REQUEST_PEER_DISCOVERY)
     def receive_request_peer_discovery(agent: ExternalAgent, peer: str):
         """
-            Handle a REQUEST_PEER_DISCOVERY event
+            Handle a REQUEST_PEER_DISCOVERY event.
+            Answer with a random sample of the registry.
         """
-        agent.send_message(PeerDiscovery(agent.name, agent.context['peer_registry']), peer)
+        peers = _registry(agent).sample(agent.context['peer_discovery_size'])
+        agent.send_message(PeerDiscovery(agent.name, peers), peer)
 
     @staticmethod
     @export
@@ -198,14 +226,14 @@ class Peer(Role):
         """
             Behavior called on PEER_DISCOVERY event.
 
-            The peer answers a peer_discovery_request with a list of known peers (i.e., its registry)
-            which is then merged with the local registry to be used later on in order to establish new
-            connections.
+            The peer answers a peer_discovery_request with a list of known peers (i.e., a sample
+            of its registry) which is then merged with the local registry to be used later on in
+            order to establish new connections.
         """
+        registry = _registry(agent)
 
         for peer in new_peers:
-            if peer != agent.name:
-                agent.context['peer_registry'].add(peer)
+            registry.add(peer)
 
     @staticmethod
     @export
@@ -238,7 +266,7 @@ class Peer(Role):
             agent.send_message(DenyInboundPeer(agent.name), peer)
 
         else:
-            inbound_peers.add(peer)
+            _connect(agent, 'inbound_peers', peer)
             agent.send_message(AcceptInboundPeer(agent.name), peer)
 
     @staticmethod
@@ -254,7 +282,7 @@ class Peer(Role):
         """
 
         if len(agent.context['outbound_peers']) < agent.max_outbound_peers:
-            agent.context['outbound_peers'].add(peer)
+            _connect(agent, 'outbound_peers', peer)
 
     @staticmethod
     @export
@@ -268,8 +296,7 @@ class Peer(Role):
             :type peer: str
         """
 
-        if peer in agent.context['inbound_peers']:
-            agent.context['inbound_peers'].remove(peer)
+        _disconnect(agent, 'inbound_peers', peer)
 
     @staticmethod
     @export
@@ -281,8 +308,7 @@ class Peer(Role):
             :param peer: the address of the peer
             :type peer: str
         """
-        if peer in agent.context['inbound_peers']:
-            agent.context['inbound_peers'].remove(peer)
+        _disconnect(agent, 'inbound_peers', peer)
 
         agent.send_message(DropInboundPeer(agent.name), peer)
 
@@ -293,8 +319,7 @@ class Peer(Role):
         """
             Handles a DROP_INBOUND_PEER event.
         """
-        if peer in agent.context['outbound_peers']:
-            agent.context['outbound_peers'].remove(peer)
+        _disconnect(agent, 'outbound_peers', peer)
 
     @staticmethod
     @export
@@ -306,8 +331,7 @@ class Peer(Role):
             :param peer: the address of the peer
             :type peer: str
         """
-        if peer in agent.context['outbound_peers']:
-            agent.context['outbound_peers'].remove(peer)
+        _disconnect(agent, 'outbound_peers', peer)
 
     @staticmethod
     @export
@@ -316,5 +340,4 @@ class Peer(Role):
         """
             Handles a DROP_OUTBOUND_PEER event.
         """
-        if peer in agent.context['inbound_peers']:
-            agent.context['inbound_peers'].remove(peer)
+        _disconnect(agent, 'inbound_peers', peer)
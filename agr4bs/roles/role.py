@@ -46,6 +46,9 @@ class RoleType(Enum):
     BOOTSTRAP = "BOOTSTRAP"
     BLOCK_CREATOR_ELECTOR = "BLOCK_CREATOR_ELECTOR"
     TRANSACTION_CREATOR_ELECTOR = "TRANSACTION_CREATOR_ELECTOR"
+    CHURN = "CHURN"
+    COMPACT_BLOCK_RELAY = "COMPACT_BLOCK_RELAY"
+    TRANSACTION_ANNOUNCER = "TRANSACTION_ANNOUNCER"
 
 class Role:
 
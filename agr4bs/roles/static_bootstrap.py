@@ -16,10 +16,12 @@ The Peer implementation which MUST contain the following behaviors :
 
 import random
 from collections import defaultdict
+from typing import Callable, Union
 
 from ..environment import Environment
 from ..agents import AgentType, ContextChange
 from ..network.messages import BootStrapStaticPeers
+from ..network.topology import Topology
 from ..events import REQUEST_BOOTSTRAP_STATIC_PEERS, INIT
 from .role import Role, RoleType
 from ..common import on, export
@@ -32,9 +34,10 @@ class StaticBootstrapContextChange(ContextChange):
         mounted or unmounted.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, topology: Union[Topology, Callable[[Environment], Topology]] = None) -> None:
         self.inbound_table = defaultdict(lambda: [])
         self.outbound_table = defaultdict(lambda: [])
+        self.topology = topology
 
 
 class StaticBootstrap(Role):
@@ -45,17 +48,26 @@ class StaticBootstrap(Role):
 
         This class MUST be inherited from and expanded to implement
         the actual logic of it's behaviors.
+
+        By default, the topology is built greedily by matching every agent
+        with the least connected candidates, which is quadratic in the number
+        of agents. For large simulations, a Topology (e.g., loaded from an
+        edge list file) or a callable building one from the Environment
+        (e.g., with Topology.random_regular) can be given instead.
+
+        :param topology: the Topology, or a callable building it from the Environment
+        :type topology: Union[Topology, Callable[[Environment], Topology]]
     """
 
-    def __init__(self) -> None:
+    def __init__(self, topology: Union[Topology, Callable[[Environment], Topology]] = None) -> None:
         super().__init__(RoleType.BOOTSTRAP, AgentType.EXTERNAL_AGENT)
+        self._topology = topology
 
-    @staticmethod
-    def context_change() -> ContextChange:
+    def context_change(self) -> ContextChange:
         """
             Returns the ContextChange required when mounting / unmounting the Role
         """
-        return StaticBootstrapContextChange()
+        return StaticBootstrapContextChange(self._topology)
 
     @staticmethod
     @export
@@ -107,6 +119,17 @@ class StaticBootstrap(Role):
         """
             Precomputes the network topology with all inbound and outbound peers
         """
+        topology = agent.context['topology']
+
+        if topology is not None:
+
+            if not isinstance(topology, Topology):
+                topology = topology(agent)
+
+            agent.context['outbound_table'].update(topology.outbound_table)
+            agent.context['inbound_table'].update(topology.inbound_table)
+            agent.network.set_topology(agent.context['outbound_table'])
+            return
 
         while True:
 
@@ -124,6 +147,7 @@ class StaticBootstrap(Role):
                 agent.context['inbound_table'][candidate].append(agent_name)
 
             if filled == len(agent.agents_names):
+                agent.network.set_topology(agent.context['outbound_table'])
                 return
 
     @staticmethod
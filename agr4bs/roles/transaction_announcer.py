@@ -0,0 +1,194 @@
+"""
+Implementation of the TransactionAnnouncer role
+
+TransactionAnnouncerContextChange:
+
+The TransactionAnnouncerContextChange exposes changes that need to be made to the
+Agent context when the Role is mounted and unmounted.
+
+TransactionAnnouncer:
+
+Hash-announce transaction gossip : the identifiers of new transactions are
+announced in batches and peers only request the transactions they miss.
+"""
+
+import datetime
+from collections import deque
+
+from ..agents import ExternalAgent, ContextChange, AgentType
+from ..blockchain import ITransaction, lookup_transaction
+from ..network.messages import AnnounceTransactions, RequestTransactions, DiffuseTransactions
+from ..network.messages import FlushTransactionAnnouncements
+from ..events import RECEIVE_TRANSACTION_ANNOUNCEMENT, REQUEST_TRANSACTIONS, RECEIVE_TRANSACTIONS
+from ..events import FLUSH_TRANSACTION_ANNOUNCEMENTS
+from .role import Role, RoleType
+from ..common import on, export
+
+
+class TransactionAnnouncerContextChange(ContextChange):
+    """
+        Context changes that need to be made to the Agent when
+        the associated Role (TransactionAnnouncer) is either
+        mounted or unmounted.
+    """
+
+    def __init__(self, window: datetime.timedelta, timeout: datetime.timedelta) -> None:
+        super().__init__()
+
+        self.announcement_window = window
+        self.transaction_request_timeout = timeout
+        self.pending_announcements = []
+        self.announcement_scheduled = False
+
+        # Date at which the request of a transaction expires, indexed by hash
+        self.requested_transactions = {}
+        # (deadline, hash) of the requests, in the order they were made
+        self.request_deadlines = deque()
+
+
+class TransactionAnnouncer(Role):
+    """
+        Implementation of the TransactionAnnouncer Role, mounted alongside
+        a BlockchainMaintainer.
+
+        Instead of relaying every new transaction to every outbound peer,
+        the agent batches the identifiers of the transactions it accepts
+        over an announcement window and announces them at once. Peers
+        request the transactions they do not know yet, which are sent back
+        in a single batch.
+
+        A requested transaction is not requested again until the reply
+        arrives or timeout elapses, so that a lost request or reply is
+        retried with the next announcement. Expired requests are forgotten
+        even if the transaction is never announced again.
+
+        Transactions are still pushed to the peers by their creator, and
+        announcements are disabled in oracle gossip mode.
+
+        :param window: the duration over which announcements are batched
+        :type window: datetime.timedelta
+        :param timeout: the duration after which a pending request expires
+        :type timeout: datetime.timedelta
+    """
+
+    def __init__(self, window: datetime.timedelta = datetime.timedelta(milliseconds=500),
+                 timeout: datetime.timedelta = datetime.timedelta(seconds=1)) -> None:
+        dependencies = [RoleType.BLOCKCHAIN_MAINTAINER]
+        super().__init__(RoleType.TRANSACTION_ANNOUNCER, AgentType.EXTERNAL_AGENT, dependencies)
+        self._window = window
+        self._timeout = timeout
+
+    def context_change(self) -> ContextChange:
+        """
+            Returns the ContextChange required when mounting / unmounting the Role
+        """
+        return TransactionAnnouncerContextChange(self._window, self._timeout)
+
+    @staticmethod
+    @export
+    def announce_transaction(agent: ExternalAgent, tx: ITransaction):
+        """
+            Queue the announcement of a transaction to the outbound peers
+            until the end of the current announcement window
+        """
+        if agent.network.can_oracle_gossip():
+            return
+
+        agent.context['pending_announcements'].append((tx.origin, tx.nonce, tx.hash))
+
+        if agent.context['announcement_scheduled'] is False:
+            agent.context['announcement_scheduled'] = True
+            window = agent.context['announcement_window']
+            agent.send_system_message(FlushTransactionAnnouncements(agent.name), agent.name, delay=window)
+
+    @staticmethod
+    @export
+    @on(FLUSH_TRANSACTION_ANNOUNCEMENTS)
+    def flush_announcements(agent: ExternalAgent):
+        """
+            Behavior called on FLUSH_TRANSACTION_ANNOUNCEMENTS event.
+            Announce the queued transactions to the outbound peers.
+        """
+        tx_ids = agent.context['pending_announcements']
+        agent.context['pending_announcements'] = []
+        agent.context['announcement_scheduled'] = False
+
+        outbound_peers = list(agent.context['outbound_peers'])
+
+        if len(tx_ids) > 0 and len(outbound_peers) > 0:
+            agent.send_message(AnnounceTransactions(agent.name, tx_ids), outbound_peers)
+
+    @staticmethod
+    @export
+    @on(RECEIVE_TRANSACTION_ANNOUNCEMENT)
+    def receive_announcement(agent: ExternalAgent, tx_ids: list[tuple[str, int, str]], sender: str):
+        """
+            Behavior called on RECEIVE_TRANSACTION_ANNOUNCEMENT event.
+            Request the announced transactions that are neither known
+            nor requested by a pending request.
+        """
+        tx_pool = agent.context['tx_pool']
+        receipts = agent.context['receipts']
+        requested = agent.context['requested_transactions']
+        deadlines = agent.context['request_deadlines']
+        deadline = agent.date + agent.network.clock.duration(agent.context['transaction_request_timeout'])
+        unknown = []
+
+        # Deadlines are appended in increasing order, the expired ones come first
+        while len(deadlines) > 0 and deadlines[0][0] <= agent.date:
+            expired, tx_hash = deadlines.popleft()
+
+            if requested.get(tx_hash) == expired:
+                del requested[tx_hash]
+
+        for tx_id in tx_ids:
+            tx_hash = tx_id[2]
+
+            if tx_hash in receipts:
+                continue
+
+            if tx_hash in requested and requested[tx_hash] > agent.date:
+                continue
+
+            if lookup_transaction(tx_pool, *tx_id) is not None:
+                continue
+
+            requested[tx_hash] = deadline
+            deadlines.append((deadline, tx_hash))
+            unknown.append(tx_id)
+
+        if len(unknown) > 0:
+            agent.send_message(RequestTransactions(agent.name, unknown), sender)
+
+    @staticmethod
+    @export
+    @on(REQUEST_TRANSACTIONS)
+    def send_transactions(agent: ExternalAgent, tx_ids: list[tuple[str, int, str]], requester: str):
+        """
+            Behavior called on REQUEST_TRANSACTIONS event.
+            Send the requested transactions still in the tx_pool in a single
+            batch, along with the requested identifiers.
+        """
+        tx_pool = agent.context['tx_pool']
+        transactions = [lookup_transaction(tx_pool, *tx_id) for tx_id in tx_ids]
+        transactions = [tx for tx in transactions if tx is not None]
+
+        agent.send_message(DiffuseTransactions(agent.name, transactions, tx_ids), requester)
+
+    @staticmethod
+    @export
+    @on(RECEIVE_TRANSACTIONS)
+    def receive_requested_transactions(agent: ExternalAgent, transactions: list[ITransaction],
+                                       tx_ids: list[tuple[str, int, str]]):
+        """
+            Behavior called on RECEIVE_TRANSACTIONS event.
+            Hand every requested transaction to receive_transaction and
+            clear the requests, including the ones the peer did not answer.
+        """
+        requested = agent.context['requested_transactions']
+
+        for _, _, tx_hash in tx_ids:
+            requested.pop(tx_hash, None)
+
+        for tx in transactions:
+            agent.receive_transaction(tx)
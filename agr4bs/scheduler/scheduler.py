@@ -1,6 +1,7 @@
 
 import datetime
 import logging
+from collections import deque
 from alive_progress import alive_bar
 from ..agents import ExternalAgent
 
@@ -8,27 +9,51 @@ from ..agents import ExternalAgent
 class Scheduler(ExternalAgent):
     """
         The Scheduler orchestrate the simulation.
+
+        If batch is True, every message due at the current date is popped
+        and grouped by recipient and event, so that handlers bound with
+        on_batch process all the messages of a group in one call. Groups are
+        delivered in the order of their first message, and the messages of
+        a group keep their (date, nonce) order. The grouping stops on the
+        date of the next Network entry, so that no message of a later date
+        is popped ahead of the messages sent by the handlers of the batch.
     """
 
-    def __init__(self, environment, factory, current_time=None):
+    def __init__(self, environment, factory, current_time=None, batch: bool = False):
         super().__init__("Scheduler", None, factory)
 
         if current_time is None:
             current_time = datetime.datetime.now()
 
-        self._current_time = current_time
         self._environment = environment
         self._network = factory.build_network()
+        self._current_time = self._network.clock.start(current_time)
+        self._batch = batch
+        self._batches = deque()
 
         logging.basicConfig(level=logging.INFO)
 
     @property
     def current_time(self):
         """
-            Get the current simulation time
+            Get the current simulation time, expressed in the Network Clock
         """
         return self._current_time
 
+    @property
+    def current_datetime(self) -> datetime.datetime:
+        """
+            Get the current simulation time as a datetime
+        """
+        return self._network.clock.to_datetime(self._current_time)
+
+    @property
+    def batch(self) -> bool:
+        """
+            Get the indicator about same date messages batching
+        """
+        return self._batch
+
     @property
     def environment(self):
         """
@@ -49,19 +74,72 @@ class Scheduler(ExternalAgent):
         """
             Take one "step" in the environment
         """
+        if self._batch is True:
+            batch = self._next_batch()
+
+            if batch is not None:
+                self._deliver(batch[0], batch)
+
+            return
+
         message = self._network.get_next_message()
 
+        if message is not None:
+            self._deliver(message)
+
+    def _deliver(self, message, batch: list = None) -> None:
+        """
+            Deliver a message, or a batch of messages sharing its
+            recipient, date and event, to its recipient
+        """
         self._current_time = message.date
+        environment = self._environment
+        recipient = message.recipient
 
-        if message.recipient != self._environment.name:
-            agent = self._environment.get_agent_by_name(message.recipient)
+        if recipient != environment.name:
+            agent = environment.get_agent_by_name(recipient)
         else:
-            agent = self._environment
+            agent = environment
 
         if agent is not None:
             agent.date = message.date
-            self._environment.date = message.date
-            agent.handle_message(message)
+            environment.date = message.date
+
+            if batch is None:
+                agent.handle_message(message)
+            else:
+                agent.handle_messages(batch)
+
+    def has_message(self) -> bool:
+        """
+            Check if there is a message left to deliver
+        """
+        return len(self._batches) > 0 or self._network.has_message()
+
+    def _next_batch(self) -> list:
+        """
+            Pop the next batch to deliver. Once the batches of a date are
+            all delivered, every message due at the next date is popped and
+            grouped by recipient and event.
+        """
+        if len(self._batches) == 0:
+            network = self._network
+            date = None
+            groups = {}
+
+            while network.has_message() and (date is None or network.next_date() == date):
+                message = network.get_next_message()
+
+                if message is not None:
+                    date = message.date
+                    groups.setdefault((message.recipient, message.event), []).append(message)
+
+            if len(groups) == 0:
+                return None
+
+            self._batches.extend(groups.values())
+
+        return self._batches.popleft()
 
     def run(self, condition: callable, progress=None, init=False, cleanup=True):
         """
@@ -75,7 +153,7 @@ class Scheduler(ExternalAgent):
 
         with alive_bar(total=100, manual=True) as progress_bar:
 
-            while self._network.has_message() and condition(self._environment) is True:
+            while self.has_message() and condition(self._environment) is True:
                 self.step()
 
                 if progress is not None and last_update + update_delta < datetime.datetime.now():
@@ -3,10 +3,14 @@
 """
 
 from .state import State
+from .columnar_state import ColumnarState
+from .snapshot_state import SnapshotState
+from .persistent_map import PersistentMap
 from .state_change import StateChange
 from .state_change import CreateAccount, DeleteAccount
 from .state_change import IncrementAccountNonce, DecrementAccountNonce
 from .state_change import AddBalance, RemoveBalance
 from .state_change import UpdateAccountStorage
-from .account import Account
+from .account import Account, AccountView
+from .storage import TrackedStorage, MISSING
 from .receipt import Receipt
@@ -3,6 +3,7 @@
 """
 
 import pickle
+from types import MappingProxyType
 
 
 class Account:
@@ -17,6 +18,8 @@ class Account:
         - storage
     """
 
+    __slots__ = ('_name', '_balance', '_internal_agent', '_storage', '_nonce')
+
     # pylint: disable=too-many-arguments
     def __init__(self, account_name: str, balance: int = 0, nonce: int = 0, internal_agent=None, storage=None):
         self._name = account_name
@@ -117,3 +120,66 @@ class Account:
             Copy the current Account
         """
         return pickle.loads(pickle.dumps(self))
+
+
+class AccountView:
+
+    """
+        Read-only view of an Account, returned by the State without any copy.
+
+        The storage is exposed as a read-only mapping. The values it holds
+        are not copied and MUST NOT be mutated : copy() returns a mutable
+        Account when modifications are intended.
+    """
+
+    __slots__ = ('_account',)
+
+    def __init__(self, account: Account):
+        self._account = account
+
+    @property
+    def name(self) -> str:
+        """
+            Get the name (address) of the Account
+        """
+        return self._account.name
+
+    @property
+    def balance(self) -> int:
+        """
+            Get the balance of the Account
+        """
+        return self._account.balance
+
+    @property
+    def nonce(self) -> int:
+        """
+            Get the nonce of the Account
+        """
+        return self._account.nonce
+
+    @property
+    def internal_agent(self):
+        """
+            Get the handler of the Account
+        """
+        return self._account.internal_agent
+
+    @property
+    def storage(self) -> MappingProxyType:
+        """
+            Get a read-only mapping of the storage of the Account
+        """
+        return MappingProxyType(self._account.storage)
+
+    def get_storage_at(self, key: str):
+        """
+            Get storage[key]
+        """
+        return self._account.get_storage_at(key)
+
+    def copy(self) -> Account:
+        """
+            Copy the viewed Account
+        """
+        return self._account.copy()
@@ -0,0 +1,264 @@
+"""
+    ColumnarState file class implementation
+"""
+
+from .state import State
+from .state_change import StateChange, StateChangeType
+from .account import Account
+
+
+class _ColumnarAccount:
+
+    """
+        Handle on the columns of a single Account of a _ColumnarAccounts,
+        exposing the Account interface. A handle MUST NOT be kept once
+        its Account is deleted, as its identifier may be reused.
+    """
+
+    __slots__ = ('_columns', '_id')
+
+    def __init__(self, columns: '_ColumnarAccounts', account_id: int):
+        self._columns = columns
+        self._id = account_id
+
+    @property
+    def name(self) -> str:
+        """
+            Get the name (address) of the Account
+        """
+        return self._columns.names[self._id]
+
+    @property
+    def balance(self) -> int:
+        """
+            Get the balance of the Account
+        """
+        return self._columns.balances[self._id]
+
+    @property
+    def nonce(self) -> int:
+        """
+            Get the nonce of the Account
+        """
+        return self._columns.nonces[self._id]
+
+    @property
+    def internal_agent(self):
+        """
+            Get the handler of the Account
+        """
+        return self._columns.internal_agents[self._id]
+
+    @property
+    def storage(self) -> dict:
+        """
+            Get the storage of the Account
+        """
+        return self._columns.storages[self._id]
+
+    def add_balance(self, to_add: int):
+        """
+            Add to_add to the balance of the Account
+        """
+        self._columns.balances[self._id] += to_add
+
+    def remove_balance(self, to_remove: int):
+        """
+            Remove to_remove from the balance of the Account
+        """
+        self._columns.balances[self._id] -= to_remove
+
+    def increment_nonce(self):
+        """
+            Increment the nonce of the Account
+        """
+        self._columns.nonces[self._id] += 1
+
+    def decrement_nonce(self):
+        """
+            Decrement the nonce of the Account
+        """
+        self._columns.nonces[self._id] -= 1
+
+    def get_storage_at(self, key: str):
+        """
+            Get storage[key]
+        """
+        return self.storage.get(key)
+
+    def update_storage(self, new_storage: dict):
+        """
+            Update the storage of the Account with a new value
+        """
+        self._columns.storages[self._id] = new_storage
+
+    def copy(self) -> Account:
+        """
+            Copy the Account
+        """
+        return Account(self.name, self.balance, self.nonce, self.internal_agent, self.storage).copy()
+
+
+class _ColumnarAccounts:
+
+    """
+        Mapping of the Accounts of a ColumnarState : every Account gets an
+        identifier indexing the columns holding its fields. The identifiers
+        of deleted Accounts are reused.
+    """
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+        self.balances: list[int] = []
+        self.nonces: list[int] = []
+        self.internal_agents: list = []
+        self.storages: list[dict] = []
+        self._free: list[int] = []
+
+    def __contains__(self, account_name: str) -> bool:
+        return account_name in self.ids
+
+    def __getitem__(self, account_name: str) -> _ColumnarAccount:
+        return _ColumnarAccount(self, self.ids[account_name])
+
+    def get(self, account_name: str, default=None) -> _ColumnarAccount:
+        """
+            Get the handle of an Account (default if unknown)
+        """
+        account_id = self.ids.get(account_name)
+
+        if account_id is None:
+            return default
+
+        return _ColumnarAccount(self, account_id)
+
+    def __setitem__(self, account_name: str, account: Account):
+        account_id = self.ids.get(account_name)
+
+        if account_id is None:
+            if len(self._free) > 0:
+                account_id = self._free.pop()
+            else:
+                account_id = len(self.names)
+                self.names.append(None)
+                self.balances.append(0)
+                self.nonces.append(0)
+                self.internal_agents.append(None)
+                self.storages.append(None)
+
+            self.ids[account_name] = account_id
+
+        self.names[account_id] = account_name
+        self.balances[account_id] = account.balance
+        self.nonces[account_id] = account.nonce
+        self.internal_agents[account_id] = account.internal_agent
+        self.storages[account_id] = account.storage
+
+    def __delitem__(self, account_name: str):
+        account_id = self.ids.pop(account_name)
+
+        self.internal_agents[account_id] = None
+        self.storages[account_id] = None
+        self._free.append(account_id)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def keys(self):
+        """
+            Get the names of the Accounts
+        """
+        return self.ids.keys()
+
+
+class ColumnarState(State):
+
+    """
+        ColumnarState class implementation :
+
+        A State keeping the balances and nonces of its Accounts in columns
+        indexed by account identifier, their internal agents and storages
+        being kept apart.
+
+        Batches of StateChanges are applied by runs : consecutive balance
+        and nonce changes are summed per account and written once, the
+        other StateChanges being applied one by one between runs.
+
+        Its copies are regular copy-on-write State overlays.
+
+        The columns are plain lists rather than NumPy arrays : balances are
+        arbitrary precision numbers (wei amounts beyond 2**63, the infinite
+        genesis balance) that fixed width arrays cannot hold.
+    """
+
+    # StateChanges applied by runs, with their balance sign or nonce step
+    _BALANCE_SIGNS = {StateChangeType.ADD_BALANCE: 1, StateChangeType.REMOVE_BALANCE: -1}
+    _NONCE_STEPS = {StateChangeType.INCREMENT_ACCOUNT_NONCE: 1, StateChangeType.DECREMENT_ACCOUNT_NONCE: -1}
+
+    def _build_accounts(self) -> _ColumnarAccounts:
+        return _ColumnarAccounts()
+
+    def apply_batch_state_change(self, state_changes: list[StateChange]) -> None:
+        """
+            Apply all the changes described in state_changes
+
+            :param state_changes: the list of changes that need to be applied to the state
+            :type state_changes: list[StateChange]
+        """
+        ids = self._accounts.ids
+        balance_signs = self._BALANCE_SIGNS
+        nonce_steps = self._NONCE_STEPS
+        balance_deltas = {}
+        nonce_deltas = {}
+        run = []
+
+        for state_change in state_changes:
+            account_id = ids.get(state_change.account_name)
+            sign = balance_signs.get(state_change.type)
+
+            if sign is not None and account_id is not None:
+                balance_deltas[account_id] = balance_deltas.get(account_id, 0) + sign * state_change.value
+                run.append(state_change)
+                continue
+
+            step = nonce_steps.get(state_change.type)
+
+            if step is not None and account_id is not None:
+                nonce_deltas[account_id] = nonce_deltas.get(account_id, 0) + step
+                run.append(state_change)
+                continue
+
+            self._flush_run(run, balance_deltas, nonce_deltas)
+            self.apply_state_change(state_change)
+
+        self._flush_run(run, balance_deltas, nonce_deltas)
+
+    def _flush_run(self, run: list[StateChange], balance_deltas: dict[int, int], nonce_deltas: dict[int, int]) -> None:
+        """
+            Internal method: write the summed balance and nonce deltas
+            of a run to the columns, and record its StateChanges
+        """
+        if len(run) == 0:
+            return
+
+        balances = self._accounts.balances
+        nonces = self._accounts.nonces
+
+        for account_id, delta in balance_deltas.items():
+            balances[account_id] += delta
+
+        for account_id, delta in nonce_deltas.items():
+            nonces[account_id] += delta
+
+        self._version = self._version + len(run)
+
+        if self._changes is not None:
+            self._changes.extend(run)
+
+        run.clear()
+        balance_deltas.clear()
+        nonce_deltas.clear()
@@ -0,0 +1,278 @@
+"""
+    PersistentMap file class implementation
+"""
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+
+
+def _hash(key: any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+class _Leaf:
+
+    """
+        Single entry of a PersistentMap
+    """
+
+    __slots__ = ('hash', 'key', 'value')
+
+    def __init__(self, key_hash: int, key: any, value: any):
+        self.hash = key_hash
+        self.key = key
+        self.value = value
+
+
+class _Collision:
+
+    """
+        Entries of a PersistentMap whose keys share the same hash
+    """
+
+    __slots__ = ('hash', 'leaves')
+
+    def __init__(self, key_hash: int, leaves: tuple[_Leaf]):
+        self.hash = key_hash
+        self.leaves = leaves
+
+
+class _Node:
+
+    """
+        Internal node of a PersistentMap : the children are indexed by
+        the bits of the hashes at the depth of the node, only the present
+        ones being stored (bitmap indexed)
+    """
+
+    __slots__ = ('bitmap', 'children')
+
+    def __init__(self, bitmap: int, children: tuple):
+        self.bitmap = bitmap
+        self.children = children
+
+
+_EMPTY = _Node(0, ())
+
+
+def _merge(first, second, shift: int) -> _Node:
+    """
+        Build the node holding two leaves (or collisions) with different hashes
+    """
+    first_index = (first.hash >> shift) & _MASK
+    second_index = (second.hash >> shift) & _MASK
+
+    if first_index == second_index:
+        return _Node(1 << first_index, (_merge(first, second, shift + _BITS),))
+
+    if first_index < second_index:
+        return _Node((1 << first_index) | (1 << second_index), (first, second))
+
+    return _Node((1 << first_index) | (1 << second_index), (second, first))
+
+
+def _get(node: _Node, key: any, key_hash: int, default: any) -> any:
+    shift = 0
+
+    while True:
+        bit = 1 << ((key_hash >> shift) & _MASK)
+
+        if node.bitmap & bit == 0:
+            return default
+
+        child = node.children[(node.bitmap & (bit - 1)).bit_count()]
+
+        if isinstance(child, _Node):
+            node = child
+            shift = shift + _BITS
+            continue
+
+        if isinstance(child, _Leaf):
+            return child.value if child.key == key else default
+
+        for leaf in child.leaves:
+            if leaf.key == key:
+                return leaf.value
+
+        return default
+
+
+def _set(node: _Node, leaf: _Leaf, shift: int) -> tuple[_Node, bool]:
+    """
+        Get a copy of node holding leaf, and wether a new key was added
+    """
+    bit = 1 << ((leaf.hash >> shift) & _MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+
+    if node.bitmap & bit == 0:
+        children = node.children[:index] + (leaf,) + node.children[index:]
+        return _Node(node.bitmap | bit, children), True
+
+    child = node.children[index]
+    added = False
+
+    if isinstance(child, _Node):
+        child, added = _set(child, leaf, shift + _BITS)
+
+    elif isinstance(child, _Leaf):
+        if child.key == leaf.key:
+            child = leaf
+        elif child.hash == leaf.hash:
+            child, added = _Collision(leaf.hash, (child, leaf)), True
+        else:
+            child, added = _merge(child, leaf, shift + _BITS), True
+
+    elif child.hash == leaf.hash:
+        leaves = tuple(other for other in child.leaves if other.key != leaf.key)
+        added = len(leaves) == len(child.leaves)
+        child = _Collision(leaf.hash, leaves + (leaf,))
+
+    else:
+        child, added = _merge(child, leaf, shift + _BITS), True
+
+    children = node.children[:index] + (child,) + node.children[index + 1:]
+
+    return _Node(node.bitmap, children), added
+
+
+def _delete(node: _Node, key: any, key_hash: int, shift: int):
+    """
+        Get a copy of node without key (node itself if the key is missing).
+        A node left with a single leaf is replaced by this leaf.
+    """
+    bit = 1 << ((key_hash >> shift) & _MASK)
+
+    if node.bitmap & bit == 0:
+        return node
+
+    index = (node.bitmap & (bit - 1)).bit_count()
+    child = node.children[index]
+
+    if isinstance(child, _Node):
+        new_child = _delete(child, key, key_hash, shift + _BITS)
+
+    elif isinstance(child, _Leaf):
+        new_child = None if child.key == key else child
+
+    else:
+        leaves = tuple(leaf for leaf in child.leaves if leaf.key != key)
+        new_child = leaves[0] if len(leaves) == 1 else _Collision(child.hash, leaves)
+
+        if len(leaves) == len(child.leaves):
+            new_child = child
+
+    if new_child is child:
+        return node
+
+    if new_child is None:
+        children = node.children[:index] + node.children[index + 1:]
+        node = _Node(node.bitmap & ~bit, children)
+    else:
+        children = node.children[:index] + (new_child,) + node.children[index + 1:]
+        node = _Node(node.bitmap, children)
+
+    if shift > 0 and len(node.children) == 1 and not isinstance(node.children[0], _Node):
+        return node.children[0]
+
+    return node
+
+
+def _leaves(node):
+    """
+        Iterate over the leaves of a node
+    """
+    if isinstance(node, _Leaf):
+        yield node
+        return
+
+    if isinstance(node, _Collision):
+        yield from node.leaves
+        return
+
+    for child in node.children:
+        yield from _leaves(child)
+
+
+class PersistentMap:
+
+    """
+        PersistentMap class implementation :
+
+        Immutable mapping implemented as a hash array mapped trie (HAMT).
+        Updates return a new PersistentMap sharing all the nodes of the
+        original one but the O(log32(n)) nodes along the path of the key
+        (i.e., path copying), so that any version can be kept for free.
+    """
+
+    __slots__ = ('_root', '_size')
+
+    def __init__(self, items: dict = None):
+        self._root = _EMPTY
+        self._size = 0
+
+        for key, value in (items or {}).items():
+            self._root, added = _set(self._root, _Leaf(_hash(key), key, value), 0)
+            self._size = self._size + added
+
+    @classmethod
+    def _build(cls, root: _Node, size: int) -> 'PersistentMap':
+        persistent_map = cls.__new__(cls)
+        persistent_map._root = root
+        persistent_map._size = size
+
+        return persistent_map
+
+    def get(self, key: any, default: any = None) -> any:
+        """
+            Get the value of a key (default if missing)
+        """
+        return _get(self._root, key, _hash(key), default)
+
+    def set(self, key: any, value: any) -> 'PersistentMap':
+        """
+            Get a copy of the map where key is set to value
+        """
+        root, added = _set(self._root, _Leaf(_hash(key), key, value), 0)
+
+        return PersistentMap._build(root, self._size + added)
+
+    def delete(self, key: any) -> 'PersistentMap':
+        """
+            Get a copy of the map without key
+        """
+        root = _delete(self._root, key, _hash(key), 0)
+
+        if root is self._root:
+            return self
+
+        return PersistentMap._build(root, self._size - 1)
+
+    def __getitem__(self, key: any) -> any:
+        value = _get(self._root, key, _hash(key), _EMPTY)
+
+        if value is _EMPTY:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: any) -> bool:
+        return _get(self._root, key, _hash(key), _EMPTY) is not _EMPTY
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        for leaf in _leaves(self._root):
+            yield leaf.key
+
+    def items(self):
+        """
+            Iterate over the (key, value) pairs of the map
+        """
+        for leaf in _leaves(self._root):
+            yield leaf.key, leaf.value
+
+    def __reduce__(self):
+        # Hashes may differ between processes, the map is rebuilt from its items
+        return (PersistentMap, (dict(self.items()),))
@@ -0,0 +1,107 @@
+"""
+    SnapshotState file class implementation
+"""
+
+from .state import State
+from .account import Account
+from .persistent_map import PersistentMap
+
+
+class _PersistentAccounts:
+
+    """
+        Mapping of the Accounts of a SnapshotState, backed by a PersistentMap.
+        Every Account is stored along with the generation it was written in :
+        the Accounts of the current generation were written since the last
+        snapshot and are modified in place, the others are copied on their
+        first write. Taking or restoring a snapshot starts a new generation.
+    """
+
+    def __init__(self):
+        self.map = PersistentMap()
+        self.generation = object()
+
+    def __contains__(self, account_name: str) -> bool:
+        return account_name in self.map
+
+    def __getitem__(self, account_name: str) -> Account:
+        return self.map[account_name][1]
+
+    def get(self, account_name: str, default=None) -> Account:
+        """
+            Get an Account (default if unknown)
+        """
+        entry = self.map.get(account_name)
+
+        if entry is None:
+            return default
+
+        return entry[1]
+
+    def __setitem__(self, account_name: str, account: Account):
+        self.map = self.map.set(account_name, (self.generation, account))
+
+    def __delitem__(self, account_name: str):
+        self.map = self.map.delete(account_name)
+
+    def __iter__(self):
+        return iter(self.map)
+
+    def __len__(self) -> int:
+        return len(self.map)
+
+    def keys(self):
+        """
+            Get the names of the Accounts
+        """
+        return iter(self.map)
+
+
+class SnapshotState(State):
+
+    """
+        SnapshotState class implementation :
+
+        A State keeping its Accounts in a persistent map, so that a snapshot
+        of the State is taken in O(1) and shares all the Accounts that are
+        not modified afterwards. Restoring a snapshot is a pointer swap,
+        which lets the maintainers switch heads without reverting the
+        transactions of the abandoned branch.
+
+        The copies of the State made before restoring a snapshot are no
+        longer readable.
+    """
+
+    def _build_accounts(self) -> _PersistentAccounts:
+        return _PersistentAccounts()
+
+    def _writable(self, account_name: str) -> Account:
+        generation, account = self._accounts.map[account_name]
+
+        if generation is not self._accounts.generation:
+            account = Account(account.name, account.balance, account.nonce, account.internal_agent, account.storage)
+            self._accounts[account_name] = account
+
+        return account
+
+    def snapshot(self) -> PersistentMap:
+        """
+            Take a snapshot of the State
+
+            :returns: the snapshot, an immutable map of the Accounts
+            :rtype: PersistentMap
+        """
+        self._accounts.generation = object()
+
+        return self._accounts.map
+
+    def restore(self, snapshot: PersistentMap) -> None:
+        """
+            Restore a snapshot of the State
+
+            :param snapshot: the snapshot to restore
+            :type snapshot: PersistentMap
+        """
+        self._accounts.map = snapshot
+        self._accounts.generation = object()
+        self._version = self._version + 1
@@ -2,15 +2,16 @@
     State file class implementation
 """
 
-from math import inf
-import pickle
 import copy
+import pickle
+from math import inf
 from .state_change import StateChange, StateChangeType
 from .state_change import UpdateAccountStorage
 from .state_change import CreateAccount, DeleteAccount
 from .state_change import AddBalance, RemoveBalance
 from .state_change import IncrementAccountNonce, DecrementAccountNonce
-from .account import Account
+from .account import Account, AccountView
+from .storage import TrackedStorage
 
 
 class State:
@@ -24,26 +25,97 @@ class State:
         The State is meant to be updated on every new Block included in the Blockchain.
         It contains informations such as the balances, nonces and so on of every known
         participant whose actions were recorded on the Blockchain.
+
+        A copy of a State is a copy-on-write overlay : it only holds the Accounts
+        modified since the copy (deleted ones being None) and reads through to its
+        parent for the others. The StateChanges applied to an overlay are recorded,
+        so that they can be committed to the parent or discarded. The parent must
+        not be modified while an overlay is in use.
     """
 
-    def __init__(self) -> None:
+    # Name of the handler of every StateChangeType
+    _HANDLERS = {
+        StateChangeType.CREATE_ACCOUNT: '_create_account',
+        StateChangeType.DELETE_ACCOUNT: '_delete_account',
+        StateChangeType.ADD_BALANCE: '_add_balance',
+        StateChangeType.REMOVE_BALANCE: '_remove_balance',
+        StateChangeType.INCREMENT_ACCOUNT_NONCE: '_increment_account_nonce',
+        StateChangeType.DECREMENT_ACCOUNT_NONCE: '_decrement_account_nonce',
+        StateChangeType.UPDATE_ACCOUNT_STORAGE: '_update_account_storage',
+    }
+
+    def __init__(self, parent: 'State' = None) -> None:
         self._receipts: dict(Receipt) = {}
-        self._accounts: dict(Account) = {}
-        self._create_account(CreateAccount(Account('genesis', inf)))
+        self._accounts: dict(Account) = self._build_accounts() if parent is None else {}
+        self._parent = parent
+        self._version = 0
+        self._parent_version = None
+        self._changes: list[StateChange] = None
+
+        if parent is None:
+            self._create_account(CreateAccount(Account('genesis', inf)))
+        else:
+            self._parent_version = parent._version
+            self._changes = []
+
+    def _build_accounts(self) -> dict[str, Account]:
+        """
+            Internal method: build the mapping holding the Accounts of a root State
+        """
+        return {}
+
+    @property
+    def parent(self) -> 'State':
+        """
+            Get the State this State is an overlay of (None for a root State)
+        """
+        return self._parent
+
+    @property
+    def changes(self) -> list[StateChange]:
+        """
+            Get the StateChanges applied to this overlay and not committed yet
+        """
+        return self._changes
+
+    def _lookup(self, account_name: str) -> Account:
+        """
+            Internal method: get the Account visible from this State, without copy
+        """
+        state = self
+
+        while account_name not in state._accounts:
+            parent = state._parent
+
+            if parent is None:
+                return None
+
+            if parent._version != state._parent_version:
+                raise ValueError("Cannot read through a State modified after being copied")
+
+            state = parent
+
+        return state._accounts[account_name]
+
+    def _writable(self, account_name: str) -> Account:
+        """
+            Internal method: get an Account owned by this State, copying
+            it from the parent on first write
+        """
+        account = self._accounts.get(account_name)
+
+        if account is None:
+            account = self._lookup(account_name)
+            account = Account(account.name, account.balance, account.nonce, account.internal_agent, account.storage)
+            self._accounts[account_name] = account
+
+        return account
 
     def _apply_jump_table(self, state_change_type: StateChangeType) -> None:
         """
             Helper function to get the appropriate handler from a StateChangeType
         """
-        return {
-            StateChangeType.CREATE_ACCOUNT: self._create_account,
-            StateChangeType.DELETE_ACCOUNT: self._delete_account,
-            StateChangeType.ADD_BALANCE: self._add_balance,
-            StateChangeType.REMOVE_BALANCE: self._remove_balance,
-            StateChangeType.INCREMENT_ACCOUNT_NONCE: self._increment_account_nonce,
-            StateChangeType.DECREMENT_ACCOUNT_NONCE: self._decrement_account_nonce,
-            StateChangeType.UPDATE_ACCOUNT_STORAGE: self._update_account_storage,
-        }[state_change_type]
+        return getattr(self, self._HANDLERS[state_change_type])
 
     def apply_batch_state_change(self, state_changes: list[StateChange]) -> None:
         """
@@ -64,6 +136,42 @@ class State:
         """
         handler = self._apply_jump_table(state_change.type)
         handler(state_change)
+        self._record(state_change)
+
+    def _record(self, state_change: StateChange) -> None:
+        """
+            Internal method: record an applied StateChange in the
+            overlay changes
+        """
+        self._version = self._version + 1
+
+        if self._changes is not None:
+            self._changes.append(state_change)
+
+    def commit(self) -> None:
+        """
+            Apply the StateChanges recorded by this overlay to its parent,
+            the overlay then being an empty view of the updated parent
+        """
+        if self._parent is None:
+            raise ValueError("Cannot commit a State that is not a copy")
+
+        changes = self._changes
+        self.discard()
+        self._parent.apply_batch_state_change(changes)
+        self._parent_version = self._parent._version
+
+    def discard(self) -> None:
+        """
+            Forget the StateChanges recorded by this overlay, the overlay
+            then being an empty view of its parent
+        """
+        if self._parent is None:
+            raise ValueError("Cannot discard a State that is not a copy")
+
+        self._accounts = {}
+        self._changes = []
+        self._parent_version = self._parent._version
 
     def _add_balance(self, state_change: AddBalance):
         """
@@ -72,8 +180,7 @@ class State:
         if not self.has_account(state_change.account_name):
             raise ValueError("Cannot add balance to non existing Account")
 
-        self._accounts[state_change.account_name].add_balance(
-            state_change.value)
+        self._writable(state_change.account_name).add_balance(state_change.value)
 
     def _remove_balance(self, state_change: RemoveBalance):
         """
@@ -82,8 +189,7 @@ class State:
         if not self.has_account(state_change.account_name):
             raise ValueError("Cannot remove balance from non existing Account")
 
-        self._accounts[state_change.account_name].remove_balance(
-            state_change.value)
+        self._writable(state_change.account_name).remove_balance(state_change.value)
 
     def _create_account(self, state_change: CreateAccount):
         """
@@ -102,7 +208,10 @@ class State:
         if not self.has_account(state_change.account_name):
             raise ValueError("Cannot delete non existing Account")
 
-        del self._accounts[state_change.account_name]
+        if self._parent is None:
+            del self._accounts[state_change.account_name]
+        else:
+            self._accounts[state_change.account_name] = None
 
     def _increment_account_nonce(self, state_change: IncrementAccountNonce):
         """
@@ -112,7 +221,7 @@ class State:
         if not self.has_account(state_change.account_name):
             raise ValueError("Cannot increment nonce of non existing Account")
 
-        self._accounts[state_change.account_name].increment_nonce()
+        self._writable(state_change.account_name).increment_nonce()
 
     def _decrement_account_nonce(self, state_change: DecrementAccountNonce):
         """
@@ -122,7 +231,7 @@ class State:
         if not self.has_account(state_change.account_name):
             raise ValueError("Cannot decrement nonce of non existing Account")
 
-        self._accounts[state_change.account_name].decrement_nonce()
+        self._writable(state_change.account_name).decrement_nonce()
 
     def _update_account_storage(self, state_change: UpdateAccountStorage):
         """
@@ -132,32 +241,49 @@ class State:
         if not self.has_account(state_change.account_name):
             raise ValueError("Cannot update storage of non existing Account")
 
-        new_storage = self.get_account_storage(
-            state_change.account_name) + state_change.delta_apply
+        # The update builds a new storage, the current one is left untouched
+        new_storage = state_change.apply(self._lookup(state_change.account_name).storage)
 
-        self._accounts[state_change.account_name].update_storage(new_storage)
+        self._writable(state_change.account_name).update_storage(new_storage)
 
     def account_names(self) -> list[str]:
         """
             Get the list of known accounts names
         """
-        return list(self._accounts.keys())
+        if self._parent is None:
+            return list(self._accounts.keys())
+
+        names = [name for name in self._parent.account_names() if name not in self._accounts]
+
+        return names + [name for name, account in self._accounts.items() if account is not None]
 
     def has_account(self, account_name: str) -> bool:
         """
             Get a boolean indicator to know if the Account is
             present in the state or not
         """
-        return account_name in self._accounts
+        return self._lookup(account_name) is not None
 
     def get_account(self, account_name: str) -> Account:
         """
-            Get a specific Account from the State
+            Get a copy of a specific Account from the State, that
+            can be modified without affecting the State
         """
         if not self.has_account(account_name):
             return None
 
-        return self._accounts[account_name].copy()
+        return self._lookup(account_name).copy()
+
+    def view_account(self, account_name: str) -> AccountView:
+        """
+            Get a read-only view of a specific Account from the State, without copy
+        """
+        account = self._lookup(account_name)
+
+        if account is None:
+            return None
+
+        return AccountView(account)
 
     def get_account_nonce(self, account_name: str) -> int:
         """
@@ -166,7 +292,7 @@ class State:
         if not self.has_account(account_name):
             return 0
 
-        return self._accounts[account_name].nonce
+        return self._lookup(account_name).nonce
 
     def get_account_balance(self, account_name: str) -> int:
         """
@@ -175,44 +301,64 @@ class State:
         if not self.has_account(account_name):
             return 0
 
-        return self._accounts[account_name].balance
+        return self._lookup(account_name).balance
 
     def get_account_storage(self, account_name: str) -> dict:
         """
-            Get a specific Account storage from the state.
+            Get a copy of a specific Account storage from the state.
         """
-        account = self.get_account(account_name)
+        account = self._lookup(account_name)
 
         if account is None:
             return None
 
-        return account.storage
+        return copy.deepcopy(account.storage)
+
+    def get_tracked_storage(self, account_name: str) -> TrackedStorage:
+        """
+            Get a TrackedStorage over a specific Account storage, recording
+            the writes to apply to it without copying it upfront
+        """
+        account = self._lookup(account_name)
+
+        if account is None:
+            return None
+
+        return TrackedStorage(account.storage)
 
     def get_account_storage_at(self, account_name: str, key: any) -> any:
         """
-            Get the value at "key" from a specified account storage
+            Get a copy of the value at "key" from a specified account storage
         """
-        account = self.get_account(account_name)
+        account = self._lookup(account_name)
 
         if account is None:
             return None
 
-        return account.get_storage_at(key)
+        return copy.deepcopy(account.get_storage_at(key))
 
     def get_account_internal_agent(self, account_name: str) -> 'InternalAgent':
         """
-            Get a specific Account InternalAgent from the state
+            Get a copy of a specific Account InternalAgent from the state
         """
-        account = self.get_account(account_name)
+        account = self._lookup(account_name)
 
-        if account is None:
+        if account is None or account.internal_agent is None:
             return None
 
-        return account.internal_agent
+        return pickle.loads(pickle.dumps(account.internal_agent))
+
+    def has_account_internal_agent(self, account_name: str) -> bool:
+        """
+            Get a boolean indicator to know if the Account is
+            present in the state and holds an InternalAgent
+        """
+        account = self._lookup(account_name)
+
+        return account is not None and account.internal_agent is not None
 
     def copy(self) -> 'State':
         """
-            Copy the current State
+            Copy the current State as a copy-on-write overlay, in O(1)
         """
-        #return copy.deepcopy(self)
-        return pickle.loads(pickle.dumps(self))
\ No newline at end of file
+        return State(self)
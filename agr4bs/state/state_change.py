@@ -5,6 +5,7 @@
 from enum import Enum
 from deepdiff import Delta
 from .account import Account
+from .storage import apply_storage_writes, revert_storage_writes
 
 
 class StateChangeType(Enum):
@@ -185,16 +186,31 @@ class UpdateAccountStorage(StateChange):
 
     """
         StateChange to modify an Account Storage value
+
+        The update is either described by a write set, i.e., the (path, old, new)
+        writes recorded by a TrackedStorage, or by a pair of Deltas.
     """
 
-    def __init__(self, account_name: str, delta_apply: Delta, delta_revert: Delta):
+    def __init__(self, account_name: str, delta_apply: Delta = None, delta_revert: Delta = None,
+                 writes: list[tuple] = None):
         super().__init__(StateChangeType.UPDATE_ACCOUNT_STORAGE, account_name)
         self._delta_apply = delta_apply
         self._delta_revert = delta_revert
+        self._writes = writes
 
     def revert(self) -> 'UpdateAccountStorage':
+        if self._writes is not None:
+            return UpdateAccountStorage(self._account_name, writes=revert_storage_writes(self._writes))
+
         return UpdateAccountStorage(self._account_name, self._delta_revert, self._delta_apply)
 
+    @property
+    def writes(self) -> list[tuple]:
+        """
+            Get the (path, old, new) writes of the update (None if described by Deltas)
+        """
+        return self._writes
+
     @property
     def delta_apply(self):
         """
@@ -208,3 +224,12 @@ class UpdateAccountStorage(StateChange):
             Get the storage delta to revert the update
         """
         return self._delta_revert
+
+    def apply(self, storage: dict) -> dict:
+        """
+            Get the storage resulting from the update, without modifying the given one
+        """
+        if self._writes is not None:
+            return apply_storage_writes(storage, self._writes)
+
+        return storage + self._delta_apply
@@ -0,0 +1,245 @@
+"""
+    TrackedStorage file class implementation
+"""
+
+import copy
+from collections.abc import MutableMapping
+
+
+class _Missing:
+
+    """
+        Marker of a storage key that does not exist, kept unique when pickled
+    """
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+# Types whose values can be shared without being copied
+_IMMUTABLES = (int, float, complex, str, bytes, bool, tuple, frozenset, type(None))
+
+
+def apply_storage_writes(storage: dict, writes: list[tuple]) -> dict:
+    """
+        Apply a write set to a storage without modifying it : the dicts along
+        the path of every write are copied (once) and the others are shared
+        with the original storage.
+
+        :param storage: the storage to update
+        :type storage: dict
+        :param writes: the (path, old, new) writes, MISSING denoting a deleted key
+        :type writes: list[tuple]
+        :returns: the updated storage
+        :rtype: dict
+    """
+    root = copy.copy(storage)
+
+    # Copies made by this function, kept alive so that their ids stay unique
+    owned = {id(root): root}
+
+    for path, _, new in writes:
+        node = root
+
+        for key in path[:-1]:
+            child = node[key]
+
+            if id(child) not in owned:
+                child = copy.copy(child)
+                owned[id(child)] = child
+                node[key] = child
+
+            node = child
+
+        if new is MISSING:
+            node.pop(path[-1], None)
+        else:
+            node[path[-1]] = new
+
+    return root
+
+
+def revert_storage_writes(writes: list[tuple]) -> list[tuple]:
+    """
+        Get the write set reverting a given write set
+    """
+    return [(path, new, old) for path, old, new in reversed(writes)]
+
+
+class _TrackedDict(MutableMapping):
+
+    """
+        Mutable view of a dict of a TrackedStorage, recording every write.
+
+        The viewed dict is copied on its first write (and so are its parents),
+        the storage the TrackedStorage was built from is never modified.
+    """
+
+    def __init__(self, storage: 'TrackedStorage', parent: '_TrackedDict', key: any, data: dict):
+        self._storage = storage
+        self._parent = parent
+        self._key = key
+        self._data = data
+        self._epoch = None
+        self._children = {}
+
+    @property
+    def path(self) -> tuple:
+        """
+            Get the path of the viewed dict from the root of the storage
+        """
+        if self._parent is None:
+            return ()
+
+        return self._parent.path + (self._key,)
+
+    def _own(self) -> None:
+        """
+            Copy the viewed dict if it is shared with the original storage
+            or with an already emitted write set
+        """
+        if self._epoch == self._storage.epoch:
+            return
+
+        self._data = copy.copy(self._data)
+        self._epoch = self._storage.epoch
+
+        if self._parent is not None:
+            self._parent._own()
+            self._parent._data[self._key] = self._data
+
+    def _wrap(self, key: any, value: any) -> any:
+        """
+            Get a dict value as a tracked view, and copy other mutable values
+        """
+        if isinstance(value, dict):
+            child = self._children.get(key)
+
+            if child is None or child._data is not value:
+                child = _TrackedDict(self._storage, self, key, value)
+                self._children[key] = child
+
+            return child
+
+        if isinstance(value, _IMMUTABLES):
+            return value
+
+        return copy.deepcopy(value)
+
+    def __getitem__(self, key: any) -> any:
+        if key in self._data:
+            return self._wrap(key, self._data[key])
+
+        factory = getattr(self._data, 'default_factory', None)
+
+        if factory is None:
+            raise KeyError(key)
+
+        self[key] = factory()
+
+        return self._wrap(key, self._data[key])
+
+    def __setitem__(self, key: any, value: any) -> None:
+        if isinstance(value, _TrackedDict):
+            value = value._data
+
+        old = self._data.get(key, MISSING)
+
+        self._own()
+        self._data[key] = value
+        self._children.pop(key, None)
+        self._storage.writes.append((self.path + (key,), old, value))
+
+    def __delitem__(self, key: any) -> None:
+        old = self._data[key]
+
+        self._own()
+        del self._data[key]
+        self._children.pop(key, None)
+        self._storage.writes.append((self.path + (key,), old, MISSING))
+
+    def __contains__(self, key: any) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, _TrackedDict):
+            other = other._data
+
+        return self._data == other
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+    def get(self, key: any, default: any = None) -> any:
+        if key not in self._data:
+            return default
+
+        return self._wrap(key, self._data[key])
+
+    def pop(self, key: any, default: any = MISSING) -> any:
+        if key not in self._data:
+            if default is MISSING:
+                raise KeyError(key)
+
+            return default
+
+        value = self._wrap(key, self._data[key])
+        del self[key]
+
+        return value
+
+
+class TrackedStorage(_TrackedDict):
+
+    """
+        TrackedStorage class implementation :
+
+        Mutable view of the storage of an Account, recording the (path, old, new)
+        writes made to it and to the dicts it contains. MISSING stands for the old
+        value of a created key and the new value of a deleted one.
+
+        The original storage is never modified : the dicts are copied on their
+        first write (i.e., copy-on-write) and the other values are shared.
+
+        :param storage: the storage to track
+        :type storage: dict
+    """
+
+    def __init__(self, storage: dict = None):
+
+        if storage is None:
+            storage = {}
+
+        self.writes: list[tuple] = []
+        self.epoch = 0
+        super().__init__(self, None, None, storage)
+
+    @property
+    def value(self) -> dict:
+        """
+            Get the current storage
+        """
+        return self._data
+
+    def freeze(self) -> list[tuple]:
+        """
+            Get the writes recorded so far. The current dicts are no longer
+            modified in place, so that they can be shared with a State.
+
+            :returns: the (path, old, new) writes
+            :rtype: list[tuple]
+        """
+        self.epoch = self.epoch + 1
+
+        return list(self.writes)
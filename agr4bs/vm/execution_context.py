@@ -62,6 +62,11 @@ class ExecutionContext:
 
     def copy(self) -> 'ExecutionContext':
         """
-            Copy the current ExecutionContext
+            Copy the current ExecutionContext, its State being
+            copied as an overlay
         """
-        return copy.deepcopy(self)
+        ctx = copy.copy(self)
+        ctx._state = self._state.copy()
+        ctx._changes = list(self._changes)
+
+        return ctx
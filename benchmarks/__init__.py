@@ -0,0 +1,3 @@
+"""
+    agr4bs benchmarks
+"""
@@ -0,0 +1,79 @@
+"""
+    EventQueue backends benchmark
+
+    Runs the classic "hold" workload against every EventQueue backend :
+    the queue is pre-filled with --size messages, then each event pops
+    the earliest message and re-inserts it with a random delay, as the
+    Scheduler does when an agent answers a message.
+
+    Usage (from the repository root) :
+
+        python -m benchmarks.event_queue --size 100000 --events 1000000 --clock tick
+"""
+
+import argparse
+import datetime
+import random
+import time
+
+from agr4bs.common import Clock, TickClock
+from agr4bs.network import Network, Message
+from agr4bs.network import LockedEventQueue, HeapEventQueue, BucketHeapEventQueue
+
+
+def hold(network: Network, size: int, events: int, delay: int) -> float:
+    """
+        Run the hold workload on a Network and return the number
+        of events processed per second
+    """
+    clock = network.clock
+    epoch = clock.start(datetime.datetime.utcfromtimestamp(0))
+
+    for _ in range(size):
+        message = Message("origin", "event")
+        message.date = epoch + clock.milliseconds(random.randint(0, delay))
+        network.send_system_message(message)
+
+    start = time.perf_counter()
+
+    for _ in range(events):
+        message = network.get_next_message()
+        message.date = message.date + clock.milliseconds(random.randint(0, delay))
+        network.send_system_message(message)
+
+    return events / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=100000, help='Number of in-flight messages')
+    parser.add_argument('--events', type=int, default=500000, help='Number of events to process')
+    parser.add_argument('--delay', type=int, default=200, help='Maximum message delay in milliseconds')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--clock', choices=['datetime', 'tick'], default='datetime', help='Clock used to date the messages')
+    args = parser.parse_args()
+
+    clocks = {'datetime': Clock, 'tick': TickClock}
+    bucket_width = clocks[args.clock]().duration(datetime.timedelta(milliseconds=max(1, args.delay // 10)))
+
+    backends = {
+        'LockedEventQueue (queue.PriorityQueue)': LockedEventQueue,
+        'HeapEventQueue': HeapEventQueue,
+        'BucketHeapEventQueue': lambda: BucketHeapEventQueue(bucket_width),
+    }
+
+    reference = None
+
+    for name, backend in backends.items():
+        random.seed(args.seed)
+        network = Network(event_queue=backend, clock=clocks[args.clock]())
+        rate = hold(network, args.size, args.events, args.delay)
+
+        if reference is None:
+            reference = rate
+
+        print(f"{name:<40} {rate:>12,.0f} events/s  (x{rate / reference:.2f})")
+
+
+if __name__ == '__main__':
+    main()
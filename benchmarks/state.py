@@ -0,0 +1,109 @@
+"""
+    State backends benchmark
+
+    Applies batches of transfers to every State backend : each transfer
+    of a batch removes a random amount from a random sender, increments
+    its nonce and adds the amount to a random receiver, as the
+    transactions of a block do.
+
+    Every backend replays the same workload --repeat times, the garbage
+    collector being disabled while timing, and the best run is reported.
+
+    Usage (from the repository root) :
+
+        python -m benchmarks.state --accounts 1000 --batches 1000 --batch 500 --repeat 5
+"""
+
+import argparse
+import gc
+import random
+import time
+
+from agr4bs.state import State, ColumnarState, SnapshotState
+from agr4bs.state import Account, CreateAccount, AddBalance, RemoveBalance, IncrementAccountNonce
+
+
+def build_workload(names: list[str], batches: int, batch: int) -> list[list]:
+    """
+        Draw batches of transfers between the given accounts
+    """
+    workload = []
+
+    for _ in range(batches):
+        state_changes = []
+
+        for _ in range(batch):
+            sender, receiver = random.sample(names, 2)
+            value = random.randint(1, 100)
+            state_changes.append(RemoveBalance(sender, value))
+            state_changes.append(IncrementAccountNonce(sender))
+            state_changes.append(AddBalance(receiver, value))
+
+        workload.append(state_changes)
+
+    return workload
+
+
+def transfers(state: State, names: list[str], workload: list[list]) -> float:
+    """
+        Run the transfers workload on a State and return the number
+        of StateChanges applied per second
+    """
+    changes = sum(len(state_changes) for state_changes in workload)
+
+    for name in names:
+        state.apply_state_change(CreateAccount(Account(name, changes)))
+
+    gc.collect()
+    gc.disable()
+
+    try:
+        start = time.perf_counter()
+
+        for state_changes in workload:
+            state.apply_batch_state_change(state_changes)
+
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    return changes / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--accounts', type=int, default=1000, help='Number of accounts')
+    parser.add_argument('--batches', type=int, default=1000, help='Number of batches to apply')
+    parser.add_argument('--batch', type=int, default=500, help='Number of transfers per batch')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs per backend')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    backends = {
+        'State': State,
+        'SnapshotState': SnapshotState,
+        'ColumnarState': ColumnarState,
+    }
+
+    random.seed(args.seed)
+    names = [f"account_{i}" for i in range(args.accounts)]
+    workload = build_workload(names, args.batches, args.batch)
+    rates = {name: 0 for name in backends}
+
+    # Backends are interleaved so that they share the same machine noise
+    for _ in range(args.repeat):
+        for name, backend in backends.items():
+            rates[name] = max(rates[name], transfers(backend(), names, workload))
+
+    reference = None
+
+    for name, rate in rates.items():
+
+        if reference is None:
+            reference = rate
+
+        print(f"{name:<40} {rate:>12,.0f} changes/s  (x{rate / reference:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+"""
+    Test suite for the ExternalAgent class
+"""
+
+import datetime
+import agr4bs
+from agr4bs.network import Envelope, Message
+from agr4bs.common import export, on
+from agr4bs.network.messages import PeerDiscovery
+
+
+def test_send_message_shared_payload():
+    """
+        Test that a Message sent to several recipients is frozen once
+        and shared by every recipient Envelope
+    """
+    network = agr4bs.IFactory.build_network(reset=True)
+    agent = agr4bs.ExternalAgent("agent_0", None, agr4bs.IFactory)
+    agent.init(datetime.datetime(2020, 1, 1))
+
+    registry = ["agent_1", "agent_2"]
+    message = PeerDiscovery(agent.name, registry)
+    recipients = [f"agent_{i}" for i in range(1, 6)]
+
+    agent.send_message(message, recipients, no_drop=True)
+
+    envelopes = []
+
+    while network.has_message():
+        envelopes.append(network.get_next_message())
+
+    assert len(envelopes) == len(recipients)
+    assert sorted(envelope.recipient for envelope in envelopes) == recipients
+
+    payload = envelopes[0].message
+
+    for envelope in envelopes:
+        assert isinstance(envelope, Envelope)
+        assert envelope.message is payload
+        assert envelope.origin == agent.name
+        assert envelope.event == message.event
+
+    # The payload is detached from the sender's data
+    assert payload is not message
+    assert payload.data[0] == registry
+    assert payload.data[0] is not registry
+
+
+def test_dispatch_table_follows_roles():
+    """
+        Test that the dispatch table is recompiled when Roles are added
+        or removed and that observer events are only fired when subscribed
+    """
+    agr4bs.IFactory.build_network(reset=True)
+    agent = agr4bs.ExternalAgent("agent_0", None, agr4bs.IFactory)
+    agent.init(datetime.datetime(2020, 1, 1))
+
+    received = []
+
+    class Observer(agr4bs.Role):
+
+        """
+            Role recording the origin of every received message
+        """
+
+        def __init__(self):
+            super().__init__(agr4bs.RoleType.PEER, agr4bs.AgentType.EXTERNAL_AGENT)
+
+        @staticmethod
+        @export
+        @on(agr4bs.events.RECEIVE_MESSAGE)
+        def record(agent: agr4bs.ExternalAgent, origin: str):
+            received.append((agent.name, origin))
+
+    assert agr4bs.events.RECEIVE_MESSAGE not in agent._dispatch_table
+
+    message = PeerDiscovery("agent_1", [])
+    agent.handle_message(message)
+    assert not received
+
+    observer = Observer()
+    agent.add_role(observer)
+    agent.handle_message(message)
+    assert received == [("agent_0", "agent_1")]
+
+    agent.remove_role(observer)
+    assert agr4bs.events.RECEIVE_MESSAGE not in agent._dispatch_table
+
+    agent.handle_message(message)
+    assert received == [("agent_0", "agent_1")]
+
+
+def test_remove_role_cancels_timers():
+    """
+        Test that removing a Role cancels the pending timers of its
+        periodic behaviors
+    """
+    network = agr4bs.IFactory.build_network(reset=True)
+    agent = agr4bs.ExternalAgent("agent_0", None, agr4bs.IFactory)
+
+    peer = agr4bs.roles.Peer()
+    agent.add_role(peer)
+    agent.init(datetime.datetime(2020, 1, 1))
+
+    assert len(network.timers) == 2
+
+    agent.remove_role(peer)
+
+    assert len(network.timers) == 0
+
+
+def test_duplicate_suppression():
+    """
+        Test that duplicate gossip is dropped before the handlers of its
+        event run when the Network enables duplicate suppression, the
+        RECEIVE_MESSAGE observers still seeing every delivery
+    """
+    network = agr4bs.IFactory.build_network(reset=True, duplicate_capacity=16)
+    agent = agr4bs.ExternalAgent("agent_0", None, agr4bs.IFactory)
+    agent.init(datetime.datetime(2020, 1, 1))
+
+    received = []
+
+    class Gossip(Message):
+
+        """
+            Message carrying a gossiped content
+        """
+
+        def __init__(self, origin: str, content: str):
+            super().__init__(origin, "gossip", content)
+
+        @property
+        def content_id(self):
+            return ("gossip", self._data[0])
+
+    origins = []
+
+    agent._add_event_handler("gossip", lambda agent, content: received.append(content))
+    agent._add_event_handler(agr4bs.events.RECEIVE_MESSAGE, lambda agent, origin: origins.append(origin))
+
+    for origin, content in [("agent_1", "a"), ("agent_2", "a"), ("agent_1", "b"), ("agent_3", "a")]:
+        agent.handle_message(Gossip(origin, content))
+
+    assert received == ["a", "b"]
+    assert origins == ["agent_1", "agent_2", "agent_1", "agent_3"]
+    assert agent.duplicates_suppressed == 2
+    assert network.duplicates_suppressed == 2
+
+
+def test_rejected_gossip_is_handled_again():
+    """
+        Test that a gossiped content rejected by a handler (returning False)
+        is not recorded, so that a later delivery is handled again, in
+        single and batched deliveries
+    """
+    agr4bs.IFactory.build_network(reset=True, duplicate_capacity=16)
+    agent = agr4bs.ExternalAgent("agent_0", None, agr4bs.IFactory)
+    agent.init(datetime.datetime(2020, 1, 1))
+
+    class Gossip(Message):
+
+        """
+            Message carrying a gossiped content
+        """
+
+        def __init__(self, origin: str, content: str):
+            super().__init__(origin, "gossip", content)
+
+        @property
+        def content_id(self):
+            return ("gossip", self._data[0])
+
+    accepted = set()
+    received = []
+
+    def receive_batch(agent, batch):
+        received.append([content for (content,) in batch])
+        return [content in accepted for (content,) in batch]
+
+    receive_batch.on_batch = True
+    agent._add_event_handler("gossip", receive_batch)
+
+    agent.handle_message(Gossip("agent_1", "a"))
+    accepted.add("a")
+    agent.handle_message(Gossip("agent_2", "a"))
+    agent.handle_message(Gossip("agent_3", "a"))
+
+    assert received == [["a"], ["a"]]
+    assert agent.duplicates_suppressed == 1
+
+    agent.handle_messages([Gossip("agent_1", "b"), Gossip("agent_2", "b"), Gossip("agent_1", "c")])
+    accepted.add("b")
+    agent.handle_messages([Gossip("agent_3", "b"), Gossip("agent_3", "c")])
+
+    assert received[2:] == [["b", "c"], ["b", "c"]]
+    assert agent.duplicates_suppressed == 2
+
+    agent.handle_message(Gossip("agent_4", "b"))
+
+    assert agent.duplicates_suppressed == 3
+
+
+def test_outbound_coalescing():
+    """
+        Test that messages sent to the same recipient within the coalescing
+        window are delivered as a single Bundle, unpacked in order
+    """
+    network = agr4bs.IFactory.build_network(reset=True)
+    sender = agr4bs.ExternalAgent("agent_0", None, agr4bs.IFactory)
+    receiver = agr4bs.ExternalAgent("agent_1", None, agr4bs.IFactory)
+    sender.coalescing_window = datetime.timedelta(0)
+    sender.init(datetime.datetime(2020, 1, 1))
+    receiver.init(datetime.datetime(2020, 1, 1))
+
+    received = []
+
+    class Recorder(agr4bs.Role):
+
+        """
+            Role recording the registries of the received PeerDiscovery messages
+        """
+
+        def __init__(self):
+            super().__init__(agr4bs.RoleType.PEER, agr4bs.AgentType.EXTERNAL_AGENT)
+
+        @staticmethod
+        @export
+        @on(agr4bs.events.PEER_DISCOVERY)
+        def record(agent: agr4bs.ExternalAgent, registry: list[str]):
+            received.append(registry)
+
+    receiver.add_role(Recorder())
+
+    for i in range(3):
+        sender.send_message(PeerDiscovery(sender.name, [i]), receiver.name, no_drop=True)
+
+    sender.send_message(PeerDiscovery(sender.name, [3]), "agent_2", no_drop=True)
+
+    # Only the flush of the outbound buffer is queued
+    assert len(network.event_queue) == 1
+    sender.handle_message(network.get_next_message())
+
+    envelopes = []
+
+    while network.has_message():
+        envelopes.append(network.get_next_message())
+
+    assert len(envelopes) == 2
+
+    for envelope in envelopes:
+        if envelope.recipient == receiver.name:
+            assert envelope.event == agr4bs.events.RECEIVE_BUNDLE
+            receiver.handle_message(envelope)
+        else:
+            assert envelope.event == agr4bs.events.PEER_DISCOVERY
+
+    assert received == [[0], [1], [2]]
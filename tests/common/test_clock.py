@@ -0,0 +1,54 @@
+"""
+    Test suite for the Clock classes
+"""
+
+import datetime
+
+from agr4bs.common import Clock, TickClock
+
+
+def test_clock_identity():
+    """
+        Test that the default Clock keeps datetime dates and timedelta durations
+    """
+    clock = Clock()
+    origin = datetime.datetime.utcfromtimestamp(0)
+
+    assert clock.start(origin) == origin
+    assert clock.milliseconds(150) == datetime.timedelta(milliseconds=150)
+    assert clock.duration(datetime.timedelta(seconds=4)) == datetime.timedelta(seconds=4)
+    assert clock.to_seconds(datetime.timedelta(seconds=12)) == 12
+    assert clock.to_datetime(origin) == origin
+
+
+def test_tick_clock_conversions():
+    """
+        Test that the TickClock converts dates and durations to integer ticks and back
+    """
+    clock = TickClock()
+    origin = datetime.datetime.utcfromtimestamp(0)
+
+    assert clock.start(origin) == 0
+    assert clock.origin == origin
+    assert clock.milliseconds(150) == 150_000
+    assert clock.duration(datetime.timedelta(seconds=4)) == 4_000_000
+    assert clock.duration(4_000_000) == 4_000_000
+    assert clock.to_seconds(12_000_000) == 12
+    assert clock.to_timedelta(1_500) == datetime.timedelta(milliseconds=1.5)
+
+    date = origin + datetime.timedelta(minutes=3, microseconds=7)
+
+    assert clock.from_datetime(date) == 180_000_007
+    assert clock.to_datetime(clock.from_datetime(date)) == date
+
+
+def test_tick_clock_resolution():
+    """
+        Test that the TickClock honors a custom resolution
+    """
+    clock = TickClock(resolution=datetime.timedelta(milliseconds=1))
+    clock.start(datetime.datetime.utcfromtimestamp(0))
+
+    assert clock.milliseconds(150) == 150
+    assert clock.duration(datetime.timedelta(seconds=4)) == 4_000
+    assert clock.to_seconds(12_000) == 12
@@ -59,3 +59,29 @@ def test_agent_retrieval_by_name():
     assert env.get_agent_by_name(agent1.name) == agent1
     assert env.get_agent_by_name(agent2.name) == agent2
     assert env.get_agent_by_name(agent3.name) is None
+
+
+def test_agents_names_cache():
+    """
+        Test that the cached agent names follow the additions
+        and removals of agents
+    """
+    agr4bs.IFactory.build_network(reset=True)
+
+    agents = [agr4bs.ExternalAgent(f"agent{i}", None, agr4bs.IFactory) for i in range(4)]
+
+    env = agr4bs.Environment(agr4bs.IFactory)
+
+    for agent in agents[:3]:
+        env.add_agent(agent)
+
+    assert env.agents_names == ["agent0", "agent1", "agent2"]
+
+    env.remove_agent(agents[1])
+
+    assert env.agents_names == ["agent0", "agent2"]
+
+    env.add_agent(agents[3])
+
+    assert env.agents_names == ["agent0", "agent2", "agent3"]
+    assert env.agents_count == 3
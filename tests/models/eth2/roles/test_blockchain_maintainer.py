@@ -328,4 +328,64 @@ def test_malicious_fork_with_skip_attestation():
     agent.receive_block(fork)
 
     # Using the attestation, the head should be updated to the fork block
-    assert agent.get_head() == fork.hash
\ No newline at end of file
+    assert agent.get_head() == fork.hash
+
+def run_reorg(use_snapshots: bool) -> agr4bs.ExternalAgent:
+    """
+        Make an agent reorg from a block to a timely fork, restoring the
+        state snapshot of their common ancestor (SnapshotFactory) or
+        reverting the block (default Factory)
+    """
+    account_transactions = [Transaction("genesis", f"agent_{i}", i, 0, 33 * 10 ** 18) for i in range(2)]
+    deposit_transactions = [Transaction(f"agent_{i}", "deposit_contract", 0, 0, 32 * 10 ** 18) for i in range(2)]
+
+    genesis = Block(None, "genesis", 0, account_transactions + deposit_transactions)
+
+    factory = agr4bs.models.eth2.SnapshotFactory if use_snapshots else agr4bs.models.eth2.Factory
+    agent = agr4bs.ExternalAgent("agent_0", genesis, factory)
+
+    agent.add_role(agr4bs.roles.StaticPeer())
+    agent.add_role(agr4bs.models.eth2.roles.BlockchainMaintainer())
+
+    date = datetime.datetime.utcfromtimestamp(0)
+    agent.init(date)
+    agent.next_epoch(0)
+    agent.next_slot(1, ["agent_0"])
+
+    block = Block(genesis.hash, "agent_0", 1, [Transaction("agent_0", "agent_1", 1, 0, 10 ** 17)])
+    fork = Block(genesis.hash, "agent_1", 2, [Transaction("agent_1", "agent_0", 1, 0, 3 * 10 ** 17)])
+
+    agent.receive_block(block)
+    assert agent.get_head() == block.hash
+
+    assert (genesis.hash in agent.context['state_snapshots']) is use_snapshots
+
+    agent.date = date + datetime.timedelta(seconds=12)
+    agent.next_slot(2, ["agent_0"])
+    agent.receive_block(fork)
+
+    assert agent.get_head() == fork.hash
+
+    return agent
+
+
+def test_reorg_restores_state_snapshot():
+    """
+        Ensures that a reorg restoring the state snapshot of the common
+        ancestor yields the same state as reverting the reorged blocks
+    """
+    restored = run_reorg(use_snapshots=True).context['state']
+    reverted = run_reorg(use_snapshots=False).context['state']
+
+    assert isinstance(restored, agr4bs.SnapshotState)
+    assert not isinstance(reverted, agr4bs.SnapshotState)
+
+    assert sorted(restored.account_names()) == sorted(reverted.account_names())
+
+    for name in reverted.account_names():
+        assert restored.get_account_balance(name) == reverted.get_account_balance(name)
+        assert restored.get_account_nonce(name) == reverted.get_account_nonce(name)
+        assert restored.get_account_storage(name) == reverted.get_account_storage(name)
+
+    assert reverted.get_account_nonce("agent_0") == 1
+    assert reverted.get_account_nonce("agent_1") == 2
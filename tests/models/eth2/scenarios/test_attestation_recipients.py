@@ -0,0 +1,82 @@
+"""
+    Test suite for the recipients of Ethereum 2.0 attestations
+"""
+
+import datetime
+import random
+import agr4bs
+
+from agr4bs.common import export, on
+from agr4bs.events import RECEIVE_BLOCK_ENDORSEMENT
+from agr4bs.models.eth2.blockchain import Transaction, Block
+
+N_SLOTS = 4
+
+
+class AttestationCounter(agr4bs.Role):
+
+    """
+        Role counting the attestations received by an agent
+    """
+
+    def __init__(self):
+        super().__init__(agr4bs.RoleType.ORACLE, agr4bs.AgentType.EXTERNAL_AGENT)
+
+    @staticmethod
+    @export
+    @on(RECEIVE_BLOCK_ENDORSEMENT)
+    def count_attestation(agent: agr4bs.ExternalAgent, attestation):
+        """
+            Count a received attestation
+        """
+        agent.context['received_attestations'] += 1
+
+
+def test_attestations_reach_validators_only():
+    """
+        Test that attestations are published to the validators, an agent
+        without deposit receiving none of them
+    """
+    random.seed(0)
+
+    nb_validators = 32
+    model = agr4bs.models.eth2
+    model.Factory.build_network(reset=True)
+
+    account_transactions = [Transaction("genesis", f"agent_{i}", i, 0, 32 * 10 ** 18) for i in range(nb_validators)]
+    deposit_transactions = [Transaction(f"agent_{i}", "deposit_contract", 0, 0, 32 * 10 ** 18) for i in range(nb_validators)]
+
+    genesis = Block(None, "genesis", 0, account_transactions + deposit_transactions)
+
+    agents = []
+
+    for i in range(nb_validators + 1):
+        agent = agr4bs.ExternalAgent(f"agent_{i}", genesis, model.Factory)
+        agent.add_role(agr4bs.roles.StaticPeer())
+        agent.add_role(model.roles.BlockchainMaintainer())
+        agent.add_role(model.roles.BlockProposer())
+        agent.add_role(model.roles.BlockEndorser())
+        agent.add_role(AttestationCounter())
+        agent.context['received_attestations'] = 0
+        agents.append(agent)
+
+    env = agr4bs.Environment(model.Factory)
+    env.add_role(agr4bs.roles.StaticBootstrap())
+    env.add_role(model.roles.BlockCreatorElector())
+
+    for agent in agents:
+        env.add_agent(agent)
+
+    epoch = datetime.datetime.utcfromtimestamp(0)
+    scheduler = agr4bs.Scheduler(env, model.Factory, current_time=epoch)
+
+    def condition(environment: agr4bs.Environment) -> bool:
+        return environment.date < epoch + datetime.timedelta(seconds=N_SLOTS * 12)
+
+    scheduler.init()
+    scheduler.run(condition)
+
+    validators, outsider = agents[:-1], agents[-1]
+
+    assert all(agent.context['received_attestations'] > 0 for agent in validators)
+    assert outsider.context['received_attestations'] == 0
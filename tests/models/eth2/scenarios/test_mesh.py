@@ -0,0 +1,59 @@
+"""
+    Test suite for Ethereum 2.0 simulations gossiping through a bounded mesh
+"""
+
+import datetime
+import random
+import agr4bs
+
+from agr4bs.models.eth2.blockchain import Transaction, Block
+
+N_SLOTS = 8
+TIME = N_SLOTS * 12 + 6
+
+
+def test_block_creation_with_mesh():
+    """
+        Test that block proposers see the slot notifications before being
+        asked to create a block when publications go through a mesh
+    """
+    random.seed(0)
+
+    nb_agents = 32
+    model = agr4bs.models.eth2
+    model.Factory.build_network(reset=True, mesh_degree=4)
+
+    account_transactions = [Transaction("genesis", f"agent_{i}", i, 0, 32 * 10 ** 18) for i in range(nb_agents)]
+    deposit_transactions = [Transaction(f"agent_{i}", "deposit_contract", 0, 0, 32 * 10 ** 18) for i in range(nb_agents)]
+
+    genesis = Block(None, "genesis", 0, account_transactions + deposit_transactions)
+
+    agents = []
+
+    for i in range(nb_agents):
+        agent = agr4bs.ExternalAgent(f"agent_{i}", genesis, model.Factory)
+        agent.add_role(agr4bs.roles.StaticPeer())
+        agent.add_role(model.roles.BlockchainMaintainer())
+        agent.add_role(model.roles.BlockProposer())
+        agent.add_role(model.roles.BlockEndorser())
+        agents.append(agent)
+
+    env = agr4bs.Environment(model.Factory)
+    env.add_role(agr4bs.roles.StaticBootstrap())
+    env.add_role(model.roles.BlockCreatorElector())
+
+    for agent in agents:
+        env.add_agent(agent)
+
+    epoch = datetime.datetime.utcfromtimestamp(0)
+    scheduler = agr4bs.Scheduler(env, model.Factory, current_time=epoch)
+
+    def condition(environment: agr4bs.Environment) -> bool:
+        return environment.date < epoch + datetime.timedelta(seconds=TIME)
+
+    scheduler.init()
+    scheduler.run(condition)
+
+    assert all(agent.context['slot'] == N_SLOTS for agent in agents)
+    assert len({agent.context['blockchain'].head.hash for agent in agents}) == 1
+    assert agents[0].context['blockchain'].head.height > 0
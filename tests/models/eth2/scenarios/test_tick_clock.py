@@ -0,0 +1,75 @@
+"""
+    Test suite for Ethereum 2.0 simulations running on a TickClock
+"""
+
+import datetime
+import random
+import agr4bs
+
+from agr4bs.common import Clock, TickClock
+from agr4bs.models.eth2.blockchain import Transaction, Block
+
+N_SLOTS = 8
+TIME = N_SLOTS * 12 + 6
+
+
+def run_block_creation(clock: Clock) -> list[agr4bs.ExternalAgent]:
+    """
+        Run a small static Ethereum 2.0 simulation with the given Clock
+    """
+    random.seed(0)
+
+    nb_agents = 32
+    model = agr4bs.models.eth2
+    model.Factory.build_network(reset=True, clock=clock)
+
+    account_transactions = [Transaction("genesis", f"agent_{i}", i, 0, 32 * 10 ** 18) for i in range(nb_agents)]
+    deposit_transactions = [Transaction(f"agent_{i}", "deposit_contract", 0, 0, 32 * 10 ** 18) for i in range(nb_agents)]
+
+    genesis = Block(None, "genesis", 0, account_transactions + deposit_transactions)
+
+    agents = []
+
+    for i in range(nb_agents):
+        agent = agr4bs.ExternalAgent(f"agent_{i}", genesis, model.Factory)
+        agent.add_role(agr4bs.roles.StaticPeer())
+        agent.add_role(model.roles.BlockchainMaintainer())
+        agent.add_role(model.roles.BlockProposer())
+        agent.add_role(model.roles.BlockEndorser())
+        agents.append(agent)
+
+    env = agr4bs.Environment(model.Factory)
+    env.add_role(agr4bs.roles.StaticBootstrap())
+    env.add_role(agr4bs.models.eth2.roles.BlockCreatorElector())
+
+    for agent in agents:
+        env.add_agent(agent)
+
+    epoch = datetime.datetime.utcfromtimestamp(0)
+    scheduler = agr4bs.Scheduler(env, model.Factory, current_time=epoch)
+
+    def condition(environment: agr4bs.Environment) -> bool:
+        return environment.current_datetime < epoch + datetime.timedelta(seconds=TIME)
+
+    scheduler.init()
+    scheduler.run(condition)
+
+    return agents
+
+
+def test_tick_clock_matches_datetime_clock():
+    """
+        Test that a simulation driven by integer ticks yields the same
+        outcome as the datetime based one for the same seed
+    """
+    reference = run_block_creation(Clock())
+    agents = run_block_creation(TickClock())
+
+    assert len({agent.context['blockchain'].head.hash for agent in agents}) == 1
+
+    for ref, agent in zip(reference, agents):
+        assert isinstance(agent.date, int)
+        assert agent.current_datetime == ref.date
+        assert agent.context['slot'] == ref.context['slot'] == N_SLOTS
+        assert agent.context['blockchain'].head.height == ref.context['blockchain'].head.height
+        assert agent.context['state'].get_account_nonce(agent.name) == ref.context['state'].get_account_nonce(ref.name)
@@ -0,0 +1,85 @@
+"""
+    Test suite for the EventQueue backends
+"""
+
+import datetime
+import random
+import pytest
+
+from agr4bs.network import Network, Message
+from agr4bs.network import LockedEventQueue, HeapEventQueue, BucketHeapEventQueue
+
+
+BACKENDS = [
+    LockedEventQueue,
+    HeapEventQueue,
+    lambda: BucketHeapEventQueue(datetime.timedelta(milliseconds=50))
+]
+
+
+def build_message(date: datetime.datetime, nonce: int) -> Message:
+    """
+        Build a dated Message with a given nonce
+    """
+    message = Message("origin", "event", nonce)
+    message.date = date
+    message.nonce = nonce
+
+    return message
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_event_queue_ordering(backend):
+    """
+        Test that every backend delivers Messages by (date, nonce) order
+    """
+    random.seed(0)
+
+    event_queue = backend()
+    epoch = datetime.datetime.utcfromtimestamp(0)
+    messages = []
+
+    for nonce in range(1000):
+        date = epoch + datetime.timedelta(milliseconds=random.randint(0, 2000))
+        messages.append(build_message(date, nonce))
+
+    random.shuffle(messages)
+
+    for message in messages:
+        event_queue.put(message)
+
+    assert len(event_queue) == len(messages)
+
+    delivered = []
+
+    while not event_queue.empty():
+        head = event_queue.peek()
+        delivered.append(event_queue.get())
+        assert delivered[-1] is head
+
+    expected = sorted(messages, key=lambda message: (message.date, message.nonce))
+
+    assert delivered == expected
+    assert len(event_queue) == 0
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_network_event_queue_backend(backend):
+    """
+        Test that the Network delivers messages in the same order
+        regardless of its EventQueue backend
+    """
+    network = Network(event_queue=backend)
+    reference = Network(event_queue=LockedEventQueue)
+    epoch = datetime.datetime.utcfromtimestamp(0)
+
+    for index in range(100):
+        for target in (network, reference):
+            message = Message("origin", "event", index)
+            message.date = epoch + datetime.timedelta(seconds=index % 7)
+            target.send_system_message(message)
+
+    while reference.has_message():
+        assert network.get_next_message().data == reference.get_next_message().data
+
+    assert network.has_message() is False
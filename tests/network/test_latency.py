@@ -0,0 +1,81 @@
+"""
+    Test suite for the latency models
+"""
+
+import datetime
+
+from agr4bs.network import Network, Message, Envelope
+from agr4bs.network import LatencyModel, RegionalLatencyModel
+from agr4bs.network import UniformDistribution, LogNormalDistribution, EmpiricalDistribution
+
+
+def test_distributions_bounds():
+    """
+        Test that every distribution draws delays above its minimum,
+        across several pre-sampled blocks
+    """
+    uniform = UniformDistribution(10, 20, block_size=16, seed=0)
+    lognormal = LogNormalDistribution(3, 0.5, shift=5, block_size=16, seed=0)
+    empirical = EmpiricalDistribution([40, 10, 30, 20], block_size=16, seed=0)
+
+    for _ in range(100):
+        assert 10 <= uniform.sample() < 20
+        assert lognormal.sample() >= 5
+        assert 10 <= empirical.sample() <= 40
+
+    assert empirical.minimum == 10
+
+
+def test_empirical_distribution_from_file(tmp_path):
+    """
+        Test that an empirical distribution can be loaded from a file
+    """
+    path = tmp_path / "delays.txt"
+    path.write_text("# observed delays\n50\n\n70\n60\n", encoding="utf-8")
+
+    distribution = EmpiricalDistribution.from_file(str(path), seed=0)
+
+    assert distribution.minimum == 50
+
+    for _ in range(100):
+        assert 50 <= distribution.sample() <= 70
+
+
+def test_regional_latency_model():
+    """
+        Test that links draw their delays from the distribution of
+        their pair of regions, in both directions
+    """
+    model = RegionalLatencyModel(
+        regions={"agent_0": "eu", "agent_1": "us", "agent_2": "eu"},
+        latencies={("eu", "us"): UniformDistribution(80, 90)},
+        default=UniformDistribution(5, 10),
+    )
+
+    assert model.min_delay == 5
+
+    for _ in range(10):
+        assert 80 <= model.delay("agent_0", "agent_1") < 90
+        assert 80 <= model.delay("agent_1", "agent_2") < 90
+        assert 5 <= model.delay("agent_0", "agent_2") < 10
+
+
+def test_link_bandwidth():
+    """
+        Test that messages sharing a link with a limited bandwidth are
+        held for the transmission time of their size
+    """
+    model = LatencyModel(UniformDistribution(10, 10), bandwidth=1000)
+    network = Network(latency_model=model)
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    assert network.min_delay == 10
+
+    for _ in range(2):
+        network.send_message(Envelope(Message("agent_0", "event"), "agent_1", date), no_drop=True, size=100)
+
+    network.send_message(Envelope(Message("agent_0", "event"), "agent_2", date), no_drop=True, size=100)
+
+    arrivals = sorted((network.get_next_message().date - date for _ in range(3)))
+
+    assert arrivals == [datetime.timedelta(milliseconds=110)] * 2 + [datetime.timedelta(milliseconds=210)]
@@ -0,0 +1,186 @@
+"""
+    Test suite for the Network class
+"""
+
+import datetime
+import pytest
+
+from agr4bs import ExternalAgent, IFactory
+from agr4bs.network import Network, Message, Broadcast
+
+
+def build_broadcast(date: datetime.datetime, recipients: list[str]) -> Broadcast:
+    """
+        Build a dated Broadcast towards the given recipients
+    """
+    return Broadcast(Message("origin", "event"), recipients, date)
+
+
+def test_broadcast_single_entry():
+    """
+        Test that a Broadcast takes a single slot in the queue and is
+        expanded to every recipient, in order, when dequeued
+    """
+    network = Network()
+    date = datetime.datetime.utcfromtimestamp(0)
+    recipients = [f"agent_{i}" for i in range(10)]
+
+    network.send_system_broadcast(build_broadcast(date, recipients))
+
+    assert len(network.event_queue) == 1
+
+    delivered = []
+
+    while network.has_message():
+        message = network.get_next_message()
+        assert message.date == date
+        delivered.append(message.recipient)
+
+    assert delivered == recipients
+
+
+def test_broadcast_ordering():
+    """
+        Test that a Broadcast is fully delivered before any message that
+        was sent after it, even at the same date
+    """
+    network = Network()
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    network.send_system_broadcast(build_broadcast(date, ["agent_0", "agent_1"]))
+
+    first = network.get_next_message()
+
+    message = Message("origin", "other")
+    message.recipient = "agent_2"
+    message.date = date
+    network.send_system_message(message)
+
+    assert first.recipient == "agent_0"
+    assert network.get_next_message().recipient == "agent_1"
+    assert network.get_next_message().recipient == "agent_2"
+    assert network.has_message() is False
+
+
+def test_broadcast_seeded_order():
+    """
+        Test that a seeded Network shuffles the Broadcast recipients
+        in a reproducible way
+    """
+    date = datetime.datetime.utcfromtimestamp(0)
+    recipients = [f"agent_{i}" for i in range(20)]
+    orders = []
+
+    for _ in range(2):
+        network = Network(broadcast_seed=42)
+        network.send_system_broadcast(build_broadcast(date, recipients))
+        orders.append([network.get_next_message().recipient for _ in recipients])
+
+    assert orders[0] == orders[1]
+    assert sorted(orders[0]) == sorted(recipients)
+    assert orders[0] != recipients
+
+
+def test_min_delay():
+    """
+        Test that no message is delivered sooner than the Network min_delay
+    """
+    network = Network(delay=200, min_delay=50)
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    assert network.min_delay == 50
+
+    for _ in range(100):
+        message = Message("origin", "event")
+        message.date = date
+        network.send_message(message, no_drop=True)
+
+    while network.has_message():
+        delay = network.get_next_message().date - date
+        assert datetime.timedelta(milliseconds=50) <= delay < datetime.timedelta(milliseconds=200)
+
+
+def test_min_delay_bounds():
+    """
+        Test that the minimum delay cannot exceed the maximum delay
+    """
+    with pytest.raises(ValueError) as excinfo:
+        Network(delay=10, min_delay=20)
+
+    assert "Network min_delay must be positive and lower than delay" in str(excinfo.value)
+
+
+def test_oracle_gossip():
+    """
+        Test that an oracle gossip delivers a single Envelope to every agent
+        reachable through the topology, along the shortest path
+    """
+    network = Network(delay=100, min_delay=10, oracle_gossip=True)
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    assert network.can_oracle_gossip() is False
+
+    network.set_topology({
+        "agent_0": ["agent_1", "agent_2"],
+        "agent_1": ["agent_2", "agent_3"],
+        "agent_2": ["agent_0", "agent_3"],
+        "agent_4": ["agent_0"],
+    })
+
+    assert network.can_oracle_gossip() is True
+    assert network.send_gossip(Message("agent_0", "event"), "agent_0", date, no_drop=True) == 3
+
+    arrivals = {}
+    origins = {}
+
+    while network.has_message():
+        envelope = network.get_next_message()
+        arrivals[envelope.recipient] = envelope.date
+        origins[envelope.recipient] = envelope.origin
+
+    assert sorted(arrivals) == ["agent_1", "agent_2", "agent_3"]
+
+    min_delay = datetime.timedelta(milliseconds=network.min_delay)
+
+    for recipient, origin in origins.items():
+        assert recipient in network.topology[origin]
+
+        if origin == "agent_0":
+            assert arrivals[recipient] >= date + min_delay
+        else:
+            assert arrivals[recipient] >= arrivals[origin] + min_delay
+
+
+def test_flushed_agent_tombstones():
+    """
+        Test that messages towards a flushed agent are discarded, lazily
+        for the queued ones, and that a re-registered agent only receives
+        the messages sent after its registration
+    """
+    network = Network()
+    agent = ExternalAgent("agent_0", None, IFactory)
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    def send(data: int):
+        message = Message("origin", "event", data)
+        message.recipient = agent.name
+        message.date = date
+        network.send_system_message(message)
+
+    network.register_agent(agent)
+    assert network.generation(agent.name) == 0
+
+    send(0)
+    network.schedule_timer(agent.name, "behavior", date)
+    network.flush_agent(agent)
+    send(1)
+
+    assert network.generation(agent.name) < 0
+    assert network.tombstoned_messages == 1
+
+    network.register_agent(agent)
+    send(2)
+
+    assert network.get_next_message().data == (2,)
+    assert network.get_next_message() is None
+    assert network.tombstoned_messages == 3
@@ -0,0 +1,63 @@
+"""
+    Test suite for the PeerRegistry class
+"""
+
+import random
+
+import pytest
+
+from agr4bs.network import PeerRegistry
+
+
+def test_peer_registry_buckets():
+    """
+        Test that the registry ignores its owner and the newcomers
+        of full buckets
+    """
+    registry = PeerRegistry("agent_0", bucket_size=2)
+
+    assert registry.add("agent_0") is False
+
+    for i in range(1, 1000):
+        registry.add(f"agent_{i}")
+
+    buckets = {}
+
+    for peer in registry:
+        buckets.setdefault(registry.bucket(peer), []).append(peer)
+
+    assert len(registry) == sum(len(peers) for peers in buckets.values())
+    assert all(len(peers) <= 2 for peers in buckets.values())
+    assert len(registry) < 2 * 64
+
+    with pytest.raises(ValueError):
+        PeerRegistry(bucket_size=0)
+
+
+def test_peer_registry_candidates():
+    """
+        Test that the candidates are the registered peers the
+        owner is not connected to
+    """
+    registry = PeerRegistry("agent_0")
+    rng = random.Random(1)
+
+    registry.connect("agent_1")
+
+    for i in range(1, 5):
+        registry.add(f"agent_{i}")
+
+    assert registry.candidates == 3
+
+    registry.connect("agent_2")
+    registry.connect("agent_3")
+    assert registry.choice(rng) == "agent_4"
+
+    registry.disconnect("agent_2")
+    registry.disconnect("agent_5")
+    registry.remove("agent_4")
+
+    assert registry.candidates == 1
+    assert registry.choice(rng) == "agent_2"
+    assert sorted(registry.sample(10, rng)) == ["agent_1", "agent_2", "agent_3"]
+    assert len(registry.sample(2, rng)) == 2
@@ -0,0 +1,132 @@
+"""
+    Test suite for the PubSubRouter class and topic publications
+"""
+
+import datetime
+import random
+
+import pytest
+
+from agr4bs.network import Network, Message, Publication, PubSubRouter
+
+
+def test_router_subscriptions():
+    """
+        Test that a PubSubRouter tracks the subscribers of every topic
+        in subscription order
+    """
+    router = PubSubRouter()
+
+    assert router.subscribe("topic", "agent_1") is True
+    assert router.subscribe("topic", "agent_0") is True
+    assert router.subscribe("topic", "agent_0") is False
+    assert router.subscribe("other", "agent_0") is True
+
+    assert router.subscribers("topic") == ("agent_1", "agent_0")
+    assert router.is_subscribed("other", "agent_0")
+
+    assert router.unsubscribe("topic", "agent_1") is True
+    assert router.unsubscribe("topic", "agent_1") is False
+    assert router.subscribers("topic") == ("agent_0",)
+
+    assert router.unsubscribe_agent("agent_0") == 2
+    assert router.subscribers("topic") == ()
+    assert router.topics == []
+
+
+def test_router_mesh_hops():
+    """
+        Test that the mesh degree bounds the fan-out of each hop
+    """
+    recipients = [f"agent_{i}" for i in range(10)]
+
+    assert PubSubRouter().hops(recipients) == [recipients]
+    assert PubSubRouter(2).hops(recipients) == [recipients[:2], recipients[2:6], recipients[6:]]
+
+    with pytest.raises(ValueError) as excinfo:
+        PubSubRouter(0)
+
+    assert "PubSubRouter mesh_degree must be strictly positive" in str(excinfo.value)
+
+
+def test_publication():
+    """
+        Test that a Publication takes a single queue entry and reaches
+        every agent subscribed to the topic when it is dequeued
+    """
+    network = Network(delay=100, min_delay=50, mesh_degree=2)
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    network.publish(Publication(Message("origin", "event"), "topic", date))
+
+    for i in range(7):
+        network.router.subscribe("topic", f"agent_{i}")
+
+    assert len(network.event_queue) == 1
+
+    deliveries = {}
+
+    while network.has_message():
+        message = network.get_next_message()
+        deliveries[message.recipient] = message.date
+
+    assert set(deliveries) == {f"agent_{i}" for i in range(7)}
+
+    # 2 agents are reached directly, 4 after one hop and the last one after two hops
+    dates = sorted(deliveries.values())
+    assert dates[0] == dates[1] == date
+    assert dates[2] == dates[5] >= date + datetime.timedelta(milliseconds=50)
+    assert dates[6] >= dates[5] + datetime.timedelta(milliseconds=50)
+
+
+def test_publication_mesh_seed():
+    """
+        Test that the mesh hops of a Publication only depend on the
+        broadcast seed of the Network
+    """
+    first_hops = []
+
+    for seed in range(2):
+        random.seed(seed)
+        network = Network(delay=100, min_delay=50, broadcast_seed=3, mesh_degree=2)
+        date = datetime.datetime.utcfromtimestamp(0)
+
+        for i in range(7):
+            network.router.subscribe("topic", f"agent_{i}")
+
+        network.publish(Publication(Message("origin", "event"), "topic", date))
+
+        first_hop = set()
+
+        while network.has_message():
+            message = network.get_next_message()
+
+            if message.date == date:
+                first_hop.add(message.recipient)
+
+        first_hops.append(first_hop)
+
+    assert len(first_hops[0]) == 2
+    assert first_hops[0] == first_hops[1]
+
+
+def test_direct_publication():
+    """
+        Test that a direct Publication reaches every subscriber at its
+        date, outside of the mesh
+    """
+    network = Network(delay=100, min_delay=50, mesh_degree=2)
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    for i in range(7):
+        network.router.subscribe("topic", f"agent_{i}")
+
+    network.publish(Publication(Message("origin", "event"), "topic", date, direct=True))
+
+    deliveries = {}
+
+    while network.has_message():
+        message = network.get_next_message()
+        deliveries[message.recipient] = message.date
+
+    assert deliveries == {f"agent_{i}": date for i in range(7)}
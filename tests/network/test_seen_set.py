@@ -0,0 +1,37 @@
+"""
+    Test suite for the SeenSet class
+"""
+
+import pytest
+
+from agr4bs.network import SeenSet
+
+
+def test_seen_set_duplicates():
+    """
+        Test that a SeenSet reports duplicates and evicts the least
+        recently seen identifier once full
+    """
+    seen = SeenSet(2)
+
+    assert seen.add("a") is True
+    assert seen.add("b") is True
+    assert seen.add("a") is False
+
+    # "b" is the least recently seen identifier
+    assert seen.add("c") is True
+    assert "b" not in seen
+    assert "a" in seen
+    assert len(seen) == 2
+
+    assert seen.add("b") is True
+
+
+def test_seen_set_capacity():
+    """
+        Test that a SeenSet requires a strictly positive capacity
+    """
+    with pytest.raises(ValueError) as excinfo:
+        SeenSet(0)
+
+    assert "SeenSet capacity must be strictly positive" in str(excinfo.value)
@@ -0,0 +1,118 @@
+"""
+    Test suite for the TimerWheel class
+"""
+
+import datetime
+
+from agr4bs.network import Network, Message
+from agr4bs.network.messages import RunSchedulable
+
+
+def test_timers_share_a_slot():
+    """
+        Test that timers due at the same date take a single queue entry
+        and are fired in scheduling order, interleaved with other messages
+        by nonce
+    """
+    network = Network()
+    date = datetime.datetime.utcfromtimestamp(0)
+    recipients = [f"agent_{i}" for i in range(10)]
+
+    for recipient in recipients:
+        network.schedule_timer(recipient, "behavior", date)
+
+    message = Message("origin", "event")
+    message.recipient = "agent_0"
+    message.date = date
+    network.send_system_message(message)
+
+    network.schedule_timer("agent_0", "behavior", date + datetime.timedelta(seconds=1))
+
+    assert len(network.event_queue) == 3
+    assert len(network.timers) == 11
+
+    fired = [network.get_next_message() for _ in recipients]
+
+    for timer, recipient in zip(fired, recipients):
+        assert isinstance(timer, RunSchedulable)
+        assert timer.recipient == recipient
+        assert timer.data[0] == "behavior"
+        assert timer.date == date
+
+    assert network.get_next_message() is message
+    assert network.get_next_message().date == date + datetime.timedelta(seconds=1)
+    assert network.has_message() is False
+
+
+def test_timers_interleaved_with_messages():
+    """
+        Test that a timer scheduled after another message of the same
+        date opens a new slot, so that scheduling order is preserved
+    """
+    network = Network()
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    first = network.schedule_timer("agent_0", "behavior", date)
+
+    message = Message("origin", "event")
+    message.recipient = "agent_0"
+    message.date = date
+    network.send_system_message(message)
+
+    second = network.schedule_timer("agent_0", "behavior", date)
+    third = network.schedule_timer("agent_1", "behavior", date)
+
+    assert len(network.event_queue) == 3
+
+    delivered = [network.get_next_message() for _ in range(4)]
+
+    assert [message.nonce for message in delivered] == [first, message.nonce, second, third]
+    assert delivered[1] is message
+    assert network.has_message() is False
+
+
+def test_cancelled_slot_is_dropped():
+    """
+        Test that a slot whose timers were all cancelled is dropped
+        and that later timers of its date open a new slot
+    """
+    network = Network()
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    first = network.schedule_timer("agent_0", "behavior", date)
+    network.cancel_timer(first)
+
+    second = network.schedule_timer("agent_1", "behavior", date)
+
+    assert len(network.event_queue) == 2
+    assert len(network.timers) == 1
+
+    timer = network.get_next_message()
+
+    assert timer.nonce == second
+    assert network.get_next_message() is None
+    assert network.has_message() is False
+
+
+def test_timer_cancellation():
+    """
+        Test that cancelled timers are never delivered
+    """
+    network = Network()
+    date = datetime.datetime.utcfromtimestamp(0)
+
+    first = network.schedule_timer("agent_0", "behavior", date)
+    second = network.schedule_timer("agent_1", "behavior", date)
+    third = network.schedule_timer("agent_2", "behavior", date + datetime.timedelta(seconds=1))
+
+    assert network.cancel_timer(first) is True
+    assert network.cancel_timer(first) is False
+    assert network.cancel_timer(third) is True
+    assert len(network.timers) == 1
+
+    assert network.get_next_message().recipient == "agent_1"
+    assert network.cancel_timer(second) is False
+
+    # Only the slots of cancelled timers are left in the queue
+    assert network.get_next_message() is None
+    assert network.has_message() is False
@@ -0,0 +1,69 @@
+"""
+    Test suite for the Topology generators
+"""
+
+import pytest
+
+from agr4bs.network import Topology
+
+
+NAMES = [f"agent_{i}" for i in range(500)]
+
+
+def _check_limits(topology: Topology, max_outbound: int, max_inbound: int):
+    """
+        Check that a topology is consistent and respects the peer limits
+    """
+    for origin, targets in topology.outbound_table.items():
+        assert len(targets) == max_outbound
+        assert len(set(targets)) == len(targets)
+        assert origin not in targets
+
+        for target in targets:
+            assert origin in topology.inbound_table[target]
+
+    for inbounds in topology.inbound_table.values():
+        assert len(inbounds) <= max_inbound
+
+
+@pytest.mark.parametrize("generator", [
+    lambda seed: Topology.random_regular(NAMES, 5, 20, seed=seed),
+    lambda seed: Topology.small_world(NAMES, 5, 20, rewiring=0.2, seed=seed),
+    lambda seed: Topology.scale_free(NAMES, 5, 20, seed=seed),
+    lambda seed: Topology.region_clustered(NAMES, {name: i % 4 for i, name in enumerate(NAMES)}, 5, 20, seed=seed),
+])
+def test_topology_generators(generator):
+    """
+        Test that the generators respect the peer limits and are seeded
+    """
+    topology = generator(1)
+
+    _check_limits(topology, 5, 20)
+    assert topology.edges == generator(1).edges
+
+
+def test_topology_region_clustered():
+    """
+        Test that a region clustered topology keeps links inside the regions
+        when no inter region link is allowed
+    """
+    regions = {name: i % 4 for i, name in enumerate(NAMES)}
+    topology = Topology.region_clustered(NAMES, regions, 5, 20, inter_region=0, seed=1)
+
+    for origin, target in topology.edges:
+        assert regions[origin] == regions[target]
+
+
+def test_topology_save_load(tmp_path):
+    """
+        Test that a topology saved as an edge list is loaded unchanged
+    """
+    path = tmp_path / "topology.txt"
+    topology = Topology.random_regular(NAMES, 5, 20, seed=1)
+
+    topology.save(path)
+    loaded = Topology.load(path)
+
+    assert loaded.outbound_table == topology.outbound_table
+    assert {name: sorted(peers) for name, peers in loaded.inbound_table.items()} == \
+        {name: sorted(peers) for name, peers in topology.inbound_table.items()}
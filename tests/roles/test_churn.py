@@ -0,0 +1,61 @@
+"""
+    Test suite for the Churn Role
+"""
+
+import datetime
+import agr4bs
+
+
+def test_churn_type():
+    """
+    Ensures that a Churn has the appropriate RoleType
+    """
+    role = agr4bs.roles.Churn()
+    assert role.type == agr4bs.RoleType.CHURN
+
+
+def test_churn_workload():
+    """
+    Ensures that agents join and leave the Environment at run time
+    and that no message is delivered to a removed agent
+    """
+    agr4bs.IFactory.build_network(reset=True)
+
+    delivered = []
+
+    class Recorder(agr4bs.ExternalAgent):
+
+        """
+            ExternalAgent recording the deliveries it receives
+        """
+
+        def handle_message(self, message):
+            delivered.append((self.name, env.has_agent(self)))
+            super().handle_message(message)
+
+    def build_agent(index: int) -> agr4bs.ExternalAgent:
+        agent = Recorder(f"joined_{index}", None, agr4bs.IFactory)
+        agent.add_role(agr4bs.roles.Peer())
+        return agent
+
+    env = agr4bs.Environment(agr4bs.IFactory)
+    env.add_role(agr4bs.roles.Bootstrap())
+    env.add_role(agr4bs.roles.Churn(join_rate=2, leave_rate=1, agent_builder=build_agent, seed=0))
+    env.add_agents([build_agent(-i) for i in range(1, 11)])
+
+    epoch = datetime.datetime.utcfromtimestamp(0)
+    scheduler = agr4bs.Scheduler(env, agr4bs.IFactory, current_time=epoch)
+
+    def condition(environment: agr4bs.Environment) -> bool:
+        return environment.date < epoch + datetime.timedelta(seconds=60)
+
+    scheduler.init()
+    scheduler.run(condition)
+
+    assert env.context['churn_joined'] > 0
+    assert env.context['churn_left'] > 0
+    assert env.agents_count == 10 + env.context['churn_joined'] - env.context['churn_left']
+
+    # Removed agents never receive a message
+    assert all(registered for _, registered in delivered)
+    assert scheduler.network.tombstoned_messages > 0
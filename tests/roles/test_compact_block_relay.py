@@ -0,0 +1,145 @@
+"""
+    Test suite for the CompactBlockRelay Role
+"""
+
+import datetime
+import random
+from collections import Counter
+import agr4bs
+
+from agr4bs.network import Network
+from agr4bs.models.eth1.blockchain import Transaction, Block
+
+
+class LossyFactory(agr4bs.models.eth1.Factory):
+
+    """
+        Ethereum 1.0 Factory building a Network dropping one message out of twenty
+    """
+
+    network = None
+
+    @staticmethod
+    def build_network(reset=False, **kwargs) -> Network:
+        """
+            Builds a Network dropping one message out of twenty
+        """
+        if LossyFactory.network is None or reset is True:
+            LossyFactory.network = Network(delay=200, drop_rate=0.05, **kwargs)
+
+        return LossyFactory.network
+
+
+def test_compact_block_relay_type():
+    """
+    Ensures that a CompactBlockRelay has the appropriate RoleType
+    """
+    role = agr4bs.roles.CompactBlockRelay()
+    assert role.type == agr4bs.RoleType.COMPACT_BLOCK_RELAY
+
+
+def test_compact_block_relay_behaviors():
+    """
+    Ensures that the CompactBlockRelay handles the compact block protocol
+    and that the `context_change` static method is NOT exported.
+    """
+    role = agr4bs.roles.CompactBlockRelay()
+
+    assert 'context_change' not in role.behaviors
+    assert role.behaviors['receive_block_header'].on == agr4bs.events.RECEIVE_BLOCK_HEADER
+    assert role.behaviors['send_block_transactions'].on == agr4bs.events.REQUEST_BLOCK
+    assert role.behaviors['receive_block_transactions'].on == agr4bs.events.RECEIVE_BLOCK_TRANSACTIONS
+
+
+def run_compact_block_relay(factory) -> list[agr4bs.ExternalAgent]:
+    """
+        Run an Ethereum 1.0 simulation where agents relay compact blocks
+    """
+    random.seed(1)
+
+    nb_agents = 50
+    model = agr4bs.models.eth1
+    factory.build_network(reset=True)
+    genesis = Block(None, "genesis", [Transaction(
+        "genesis", f"agent_{i}", 0) for i in range(nb_agents)])
+
+    agents = []
+
+    for i in range(nb_agents):
+        agent = agr4bs.ExternalAgent(
+            f"agent_{i}", genesis, factory)
+        agent.add_role(agr4bs.roles.StaticPeer())
+        agent.add_role(model.roles.BlockchainMaintainer())
+        agent.add_role(model.roles.BlockProposer())
+        agent.add_role(model.roles.TransactionProposer())
+        agent.add_role(agr4bs.roles.CompactBlockRelay())
+        agents.append(agent)
+
+    env = agr4bs.Environment(factory)
+    env.add_role(agr4bs.roles.StaticBootstrap())
+    env.add_role(agr4bs.models.eth1.roles.BlockCreatorElector())
+    env.add_role(agr4bs.models.eth1.roles.TransactionCreatorElector())
+
+    for agent in agents:
+        env.add_agent(agent)
+
+    epoch = datetime.datetime.utcfromtimestamp(0)
+    scheduler = agr4bs.Scheduler(env, factory, current_time=epoch)
+
+    def condition(environment: agr4bs.Environment) -> bool:
+        return environment.date < epoch + datetime.timedelta(seconds=3840)
+
+    def progress(environment: agr4bs.Environment) -> bool:
+        delta: datetime.timedelta = environment.date - epoch
+        return min(1, delta.total_seconds() / datetime.timedelta(seconds=3840).total_seconds())
+
+    scheduler.init()
+    scheduler.run(condition, progress=progress)
+
+    return agents
+
+
+def test_compact_block_relay_scenario():
+    """
+        Test that agents relaying compact blocks reach consensus, rebuilding
+        blocks from their own tx_pool and fetching missing transactions
+    """
+    agents = run_compact_block_relay(agr4bs.models.eth1.Factory)
+    heads = [agent.context['blockchain'].head for agent in agents]
+    heads_heights = {head.hash: head.height for head in heads}
+    heads_hashes = [head.hash for head in heads]
+    heads_counts = Counter(heads_hashes)
+
+    for ref in agents:
+        ref_nonce = ref.context['state'].get_account_nonce(ref.name)
+
+        for agent in agents:
+            assert agent.context['state'].get_account_nonce(
+                ref.name) == ref_nonce
+
+    # Ensure that one head is shared by all agents
+    # i.e., state is consensual
+    for head_hash, head_count in heads_counts.items():
+        shared_percentage = 100 * head_count / len(agents)
+        print("Head : " + head_hash + " shared by " + str(shared_percentage) +
+              "% of the agents (height: " + str(heads_heights[head_hash]) + ")")
+        assert head_count / len(agents) == 1
+
+    for head_hash, head_height in heads_heights.items():
+        assert head_height > 1
+
+
+def test_compact_block_relay_dropped_messages():
+    """
+        Test that agents relaying compact blocks over a lossy Network
+        fetch the transactions of every block they are announced
+    """
+    agents = run_compact_block_relay(LossyFactory)
+
+    heads = {agent.context['blockchain'].head.hash for agent in agents}
+
+    assert len(heads) == 1
+    assert agents[0].context['blockchain'].head.height > 1
+
+    for agent in agents:
+        assert len(agent.context['pending_compact_blocks']) == 0
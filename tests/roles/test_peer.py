@@ -2,6 +2,7 @@
     Test suite for the Peer Role
 """
 
+import datetime
 import agr4bs
 
 
@@ -68,3 +69,43 @@ def test_peer_removal():
 
     for context_change in role.context_change().mount():
         assert context_change not in agent.context
+
+
+def test_peer_discovery():
+    """
+        Ensures that peer discovery responses are capped and that the
+        candidates exclude the inbound and outbound peers
+    """
+    network = agr4bs.IFactory.build_network(reset=True)
+    agent = agr4bs.ExternalAgent("agent_0", None, agr4bs.IFactory)
+    agent.add_role(agr4bs.roles.Peer(discovery_size=4))
+    agent.init(datetime.datetime(2020, 1, 1))
+
+    agent.receive_peer_discovery([f"agent_{i}" for i in range(10)])
+    registry = agent.context['peer_registry']
+
+    assert "agent_0" not in registry
+    assert registry.candidates == len(registry)
+
+    agent.receive_request_inbound_peer("agent_1")
+    agent.accept_inbound_peer("agent_1")
+    agent.receive_request_inbound_peer("agent_2")
+
+    assert registry.candidates == len(registry) - 2
+
+    agent.receive_drop_inbound_peer("agent_1")
+    assert registry.candidates == len(registry) - 2
+
+    agent.receive_drop_outbound_peer("agent_1")
+    assert registry.candidates == len(registry) - 1
+
+    while network.has_message():
+        network.get_next_message()
+
+    agent.receive_request_peer_discovery("agent_3")
+    envelope = network.get_next_message()
+
+    peers, = envelope.message.data
+
+    assert len(peers) == 4
+    assert set(peers) <= set(registry)
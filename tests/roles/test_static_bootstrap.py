@@ -68,3 +68,28 @@ def test_static_bootstrap_removal():
 
     for context_change in role.context_change().mount():
         assert context_change not in agent.context
+
+
+def test_static_bootstrap_topology():
+    """
+    Ensures that a StaticBootstrap built with a Topology generator
+    uses the generated topology instead of the greedy matching
+    """
+    agr4bs.IFactory.build_network(reset=True)
+    env = agr4bs.Environment(agr4bs.IFactory)
+
+    def generator(environment: agr4bs.Environment) -> agr4bs.network.Topology:
+        return agr4bs.network.Topology.random_regular(environment.agents_names, 5, 20, seed=1)
+
+    env.add_role(agr4bs.roles.StaticBootstrap(generator))
+
+    for i in range(50):
+        env.add_agent(agr4bs.ExternalAgent(f"agent_{i}", None, agr4bs.IFactory))
+
+    env.init_bootstrap_peers()
+
+    expected = generator(env)
+
+    for name in env.agents_names:
+        assert env.context['outbound_table'][name] == expected.outbound_table[name]
+        assert env.network.topology[name] == tuple(expected.outbound_table[name])
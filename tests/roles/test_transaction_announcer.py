@@ -0,0 +1,166 @@
+"""
+    Test suite for the TransactionAnnouncer Role
+"""
+
+import datetime
+import random
+from collections import Counter
+import agr4bs
+
+from agr4bs.models.eth1.blockchain import Transaction, Block
+
+
+def test_transaction_announcer_type():
+    """
+    Ensures that a TransactionAnnouncer has the appropriate RoleType
+    """
+    role = agr4bs.roles.TransactionAnnouncer()
+    assert role.type == agr4bs.RoleType.TRANSACTION_ANNOUNCER
+
+
+def test_transaction_announcer_behaviors():
+    """
+    Ensures that the TransactionAnnouncer handles the announcement protocol
+    and that the `context_change` method is NOT exported.
+    """
+    role = agr4bs.roles.TransactionAnnouncer()
+
+    assert 'context_change' not in role.behaviors
+    assert role.behaviors['receive_announcement'].on == agr4bs.events.RECEIVE_TRANSACTION_ANNOUNCEMENT
+    assert role.behaviors['send_transactions'].on == agr4bs.events.REQUEST_TRANSACTIONS
+    assert role.behaviors['receive_requested_transactions'].on == agr4bs.events.RECEIVE_TRANSACTIONS
+
+
+def test_transaction_announcer_scenario():
+    """
+        Test that agents announcing transactions reach consensus, every
+        transaction being fetched by the agents missing it
+    """
+    random.seed(1)
+
+    nb_agents = 50
+    model = agr4bs.models.eth1
+    model.Factory.build_network(reset=True)
+    genesis = Block(None, "genesis", [Transaction(
+        "genesis", f"agent_{i}", 0) for i in range(nb_agents)])
+
+    agents = []
+
+    for i in range(nb_agents):
+        agent = agr4bs.ExternalAgent(
+            f"agent_{i}", genesis, model.Factory)
+        agent.add_role(agr4bs.roles.StaticPeer())
+        agent.add_role(model.roles.BlockchainMaintainer())
+        agent.add_role(model.roles.BlockProposer())
+        agent.add_role(model.roles.TransactionProposer())
+        agent.add_role(agr4bs.roles.TransactionAnnouncer())
+        agents.append(agent)
+
+    env = agr4bs.Environment(model.Factory)
+    env.add_role(agr4bs.roles.StaticBootstrap())
+    env.add_role(agr4bs.models.eth1.roles.BlockCreatorElector())
+    env.add_role(agr4bs.models.eth1.roles.TransactionCreatorElector())
+
+    for agent in agents:
+        env.add_agent(agent)
+
+    epoch = datetime.datetime.utcfromtimestamp(0)
+    scheduler = agr4bs.Scheduler(env, model.Factory, current_time=epoch)
+
+    def condition(environment: agr4bs.Environment) -> bool:
+        return environment.date < epoch + datetime.timedelta(seconds=3840)
+
+    def progress(environment: agr4bs.Environment) -> bool:
+        delta: datetime.timedelta = environment.date - epoch
+        return min(1, delta.total_seconds() / datetime.timedelta(seconds=3840).total_seconds())
+
+    scheduler.init()
+    scheduler.run(condition, progress=progress)
+
+    heads = [agent.context['blockchain'].head for agent in agents]
+    heads_heights = {head.hash: head.height for head in heads}
+    heads_hashes = [head.hash for head in heads]
+    heads_counts = Counter(heads_hashes)
+
+    for ref in agents:
+        ref_nonce = ref.context['state'].get_account_nonce(ref.name)
+
+        for agent in agents:
+            assert agent.context['state'].get_account_nonce(
+                ref.name) == ref_nonce
+
+    # Ensure that one head is shared by all agents
+    # i.e., state is consensual
+    for head_hash, head_count in heads_counts.items():
+        shared_percentage = 100 * head_count / len(agents)
+        print("Head : " + head_hash + " shared by " + str(shared_percentage) +
+              "% of the agents (height: " + str(heads_heights[head_hash]) + ")")
+        assert head_count / len(agents) == 1
+
+    for head_hash, head_height in heads_heights.items():
+        assert head_height > 1
+
+
+def test_transaction_requests_expire():
+    """
+        Test that a requested transaction is requested again once the
+        request expired, or once a reply came back without it
+    """
+    model = agr4bs.models.eth1
+    model.Factory.build_network(reset=True)
+    genesis = Block(None, "genesis", [Transaction("genesis", "agent_0", 0)])
+
+    agent = agr4bs.ExternalAgent("agent_0", genesis, model.Factory)
+    agent.add_role(agr4bs.roles.StaticPeer())
+    agent.add_role(model.roles.BlockchainMaintainer())
+    agent.add_role(agr4bs.roles.TransactionAnnouncer(timeout=datetime.timedelta(seconds=1)))
+    agent.date = datetime.datetime.utcfromtimestamp(0)
+
+    tx = Transaction("agent_1", "agent_0", 0)
+    tx_id = (tx.origin, tx.nonce, tx.hash)
+    requested = agent.context['requested_transactions']
+
+    agent.receive_announcement([tx_id], "agent_1")
+    deadline = requested[tx.hash]
+
+    # A pending request is not duplicated
+    agent.receive_announcement([tx_id], "agent_2")
+    assert requested[tx.hash] == deadline
+
+    # An expired request is sent again
+    agent.date = agent.date + datetime.timedelta(seconds=1)
+    agent.receive_announcement([tx_id], "agent_2")
+    assert requested[tx.hash] == deadline + datetime.timedelta(seconds=1)
+
+    # A reply without the transaction clears the request
+    agent.receive_requested_transactions([], [tx_id])
+    assert tx.hash not in requested
+
+    agent.receive_announcement([tx_id], "agent_3")
+    assert tx.hash in requested
+
+
+def test_expired_transaction_requests_are_purged():
+    """
+        Test that expired requests are forgotten even if the transactions
+        are never announced again, e.g. when the peer left
+    """
+    model = agr4bs.models.eth1
+    model.Factory.build_network(reset=True)
+    genesis = Block(None, "genesis", [Transaction("genesis", "agent_0", 0)])
+
+    agent = agr4bs.ExternalAgent("agent_0", genesis, model.Factory)
+    agent.add_role(agr4bs.roles.StaticPeer())
+    agent.add_role(model.roles.BlockchainMaintainer())
+    agent.add_role(agr4bs.roles.TransactionAnnouncer(timeout=datetime.timedelta(seconds=1)))
+    agent.date = datetime.datetime.utcfromtimestamp(0)
+
+    lost = Transaction("agent_1", "agent_0", 0)
+    agent.receive_announcement([(lost.origin, lost.nonce, lost.hash)], "agent_1")
+
+    agent.date = agent.date + datetime.timedelta(seconds=1)
+    tx = Transaction("agent_2", "agent_0", 0)
+    agent.receive_announcement([(tx.origin, tx.nonce, tx.hash)], "agent_2")
+
+    assert list(agent.context['requested_transactions']) == [tx.hash]
+    assert len(agent.context['request_deadlines']) == 1
@@ -0,0 +1,214 @@
+"""
+    Test suite for the Scheduler class
+"""
+
+import datetime
+import random
+import agr4bs
+from agr4bs.common import TickClock, export, on_batch
+from agr4bs.events import RECEIVE_BLOCK_ENDORSEMENT
+from agr4bs.network import Message, Broadcast
+from agr4bs.models.eth2.blockchain import Transaction, Block
+
+
+class BatchRecorder(agr4bs.Role):
+
+    """
+        Role recording the batches of "record" events it receives
+    """
+
+    def __init__(self):
+        super().__init__(agr4bs.RoleType.PEER, agr4bs.AgentType.EXTERNAL_AGENT)
+
+    @staticmethod
+    @export
+    @on_batch("record")
+    def record(agent: agr4bs.ExternalAgent, batch: list[tuple]):
+        """
+            Record a batch of "record" events
+        """
+        agent.context['batches'].append([data[0] for data in batch])
+
+
+class Relay(agr4bs.Role):
+
+    """
+        Role sending a "record" event to itself one second after
+        each batch of "relay" events it receives
+    """
+
+    def __init__(self):
+        super().__init__(agr4bs.RoleType.ORACLE, agr4bs.AgentType.EXTERNAL_AGENT)
+
+    @staticmethod
+    @export
+    @on_batch("relay")
+    def relay(agent: agr4bs.ExternalAgent, batch: list[tuple]):
+        """
+            Send a "record" event one second later
+        """
+        message = Message("origin", "record", "relayed")
+        agent.send_system_message(message, agent.name, delay=datetime.timedelta(seconds=1))
+
+
+class EndorsementRecorder(agr4bs.Role):
+
+    """
+        Role recording the size of the batches of endorsements it receives
+    """
+
+    def __init__(self):
+        super().__init__(agr4bs.RoleType.ORACLE, agr4bs.AgentType.EXTERNAL_AGENT)
+
+    @staticmethod
+    @export
+    @on_batch(RECEIVE_BLOCK_ENDORSEMENT)
+    def record_endorsements(agent: agr4bs.ExternalAgent, batch: list[tuple]):
+        """
+            Record the size of a batch of endorsements
+        """
+        agent.context['endorsement_batches'].append(len(batch))
+
+
+def run_recorder(batch: bool, messages: list[tuple[str, str, int]]) -> dict[str, list[list[int]]]:
+    """
+        Deliver (recipient, event, delay) messages to agents holding the
+        BatchRecorder role and return the batches recorded by each agent
+    """
+    network = agr4bs.IFactory.build_network(reset=True)
+    environment = agr4bs.Environment(agr4bs.IFactory)
+    agents = {}
+
+    for name in sorted({recipient for recipient, _, _ in messages}):
+        agent = agr4bs.ExternalAgent(name, None, agr4bs.IFactory)
+        agent.add_role(BatchRecorder())
+        agent.context['batches'] = []
+        environment.add_agent(agent)
+        agents[name] = agent
+
+    scheduler = agr4bs.Scheduler(environment, agr4bs.IFactory, datetime.datetime(2020, 1, 1), batch=batch)
+    date = scheduler.current_time
+
+    for i, (recipient, event, delay) in enumerate(messages):
+        message = Message("origin", event, i)
+        message.recipient = recipient
+        message.date = date + datetime.timedelta(seconds=delay)
+        network.send_system_message(message)
+
+    while scheduler.has_message():
+        scheduler.step()
+
+    return {name: agent.context['batches'] for name, agent in agents.items()}
+
+
+def test_scheduler_batches_same_date_messages():
+    """
+        Test that the Scheduler delivers same date messages in a single
+        batch if batching is enabled, and one by one otherwise
+    """
+    messages = [("agent_0", "record", 0)] * 3 + [("agent_0", "record", 1)]
+
+    assert run_recorder(True, messages) == {"agent_0": [[0, 1, 2], [3]]}
+    assert run_recorder(False, messages) == {"agent_0": [[0], [1], [2], [3]]}
+
+
+def test_scheduler_batches_interleaved_messages():
+    """
+        Test that the Scheduler groups the same date messages by recipient
+        and event even if they are interleaved in the queue, keeping their
+        order within each group
+    """
+    messages = [
+        ("agent_0", "record", 0),
+        ("agent_1", "record", 0),
+        ("agent_0", "other", 0),
+        ("agent_0", "record", 0),
+        ("agent_1", "record", 0),
+        ("agent_0", "record", 1),
+    ]
+
+    assert run_recorder(True, messages) == {"agent_0": [[0, 3], [5]], "agent_1": [[1, 4]]}
+
+
+def test_scheduler_batches_before_later_broadcast():
+    """
+        Test that a message sent while a batch is handled is delivered
+        before the Broadcast of a later date that follows the batch
+    """
+    network = agr4bs.IFactory.build_network(reset=True)
+    environment = agr4bs.Environment(agr4bs.IFactory)
+
+    for name in ("agent_0", "agent_1"):
+        agent = agr4bs.ExternalAgent(name, None, agr4bs.IFactory)
+        agent.add_role(BatchRecorder())
+        agent.add_role(Relay())
+        agent.context['batches'] = []
+        environment.add_agent(agent)
+
+    scheduler = agr4bs.Scheduler(environment, agr4bs.IFactory, datetime.datetime(2020, 1, 1), batch=True)
+    date = scheduler.current_time
+
+    message = Message("origin", "relay", None)
+    message.recipient = "agent_0"
+    message.date = date
+    network.send_system_message(message)
+
+    later = date + datetime.timedelta(seconds=2)
+    network.send_system_broadcast(Broadcast(Message("origin", "record", "broadcast"), ["agent_0", "agent_1"], later))
+
+    while scheduler.has_message():
+        scheduler.step()
+
+    agent = environment.get_agent_by_name("agent_0")
+
+    assert agent.context['batches'] == [["relayed"], ["broadcast"]]
+    assert scheduler.current_time == later
+
+
+def test_scheduler_batches_eth2_endorsements():
+    """
+        Test that the endorsements of an Ethereum 2.0 simulation reach each
+        agent in batches : with 200 milliseconds ticks, the attesters of a
+        slot receive its block and endorse it at the same date
+    """
+    random.seed(0)
+
+    nb_agents = 64
+    model = agr4bs.models.eth2
+    model.Factory.build_network(reset=True, clock=TickClock(datetime.timedelta(milliseconds=200)))
+
+    account_transactions = [Transaction("genesis", f"agent_{i}", i, 0, 32 * 10 ** 18) for i in range(nb_agents)]
+    deposit_transactions = [Transaction(f"agent_{i}", "deposit_contract", 0, 0, 32 * 10 ** 18) for i in range(nb_agents)]
+
+    genesis = Block(None, "genesis", 0, account_transactions + deposit_transactions)
+
+    agents = []
+
+    for i in range(nb_agents):
+        agent = agr4bs.ExternalAgent(f"agent_{i}", genesis, model.Factory)
+        agent.add_role(agr4bs.roles.StaticPeer())
+        agent.add_role(model.roles.BlockchainMaintainer())
+        agent.add_role(model.roles.BlockProposer())
+        agent.add_role(model.roles.BlockEndorser())
+        agent.add_role(EndorsementRecorder())
+        agent.context['endorsement_batches'] = []
+        agents.append(agent)
+
+    env = agr4bs.Environment(model.Factory)
+    env.add_role(agr4bs.roles.StaticBootstrap())
+    env.add_role(model.roles.BlockCreatorElector())
+
+    for agent in agents:
+        env.add_agent(agent)
+
+    epoch = datetime.datetime.utcfromtimestamp(0)
+    scheduler = agr4bs.Scheduler(env, model.Factory, current_time=epoch, batch=True)
+
+    def condition(environment: agr4bs.Environment) -> bool:
+        return environment.current_datetime < epoch + datetime.timedelta(seconds=8 * 12)
+
+    scheduler.init()
+    scheduler.run(condition)
+
+    for agent in agents:
+        assert max(agent.context['endorsement_batches']) > 1
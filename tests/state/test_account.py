@@ -3,6 +3,7 @@
     Test suite for the Account class
 """
 
+import pytest
 import agr4bs
 
 
@@ -58,3 +59,41 @@ def test_account_storage():
     account = agr4bs.Account("name", storage=storage)
 
     assert account.get_storage_at("key") == "value"
+
+
+def test_account_slots():
+    """
+        Test that an Account does not accept arbitrary attributes
+    """
+    account = agr4bs.Account("account")
+
+    with pytest.raises(AttributeError):
+        account.unknown = 0
+
+
+def test_account_view():
+    """
+        Test that an AccountView exposes the Account without allowing
+        modifications, and copies it on demand
+    """
+    account = agr4bs.Account("account", 10, 1, storage={"key": "value"})
+    view = agr4bs.AccountView(account)
+
+    assert view.name == "account"
+    assert view.balance == 10
+    assert view.nonce == 1
+    assert view.get_storage_at("key") == "value"
+
+    with pytest.raises(TypeError):
+        view.storage["key"] = "other"
+
+    with pytest.raises(AttributeError):
+        view.balance = 0
+
+    account.add_balance(5)
+    assert view.balance == 15
+
+    copied = view.copy()
+    copied.set_storage_at("key", "other")
+
+    assert view.get_storage_at("key") == "value"
@@ -0,0 +1,88 @@
+"""
+    Test suite for the ColumnarState class
+"""
+
+import random
+
+import pytest
+import agr4bs
+from agr4bs.state import Account
+from agr4bs.state.state_change import CreateAccount, DeleteAccount
+from agr4bs.state.state_change import AddBalance, RemoveBalance
+from agr4bs.state.state_change import IncrementAccountNonce, DecrementAccountNonce
+
+
+def _random_changes(count: int, seed: int) -> list:
+    """
+        Build a valid random batch of StateChanges
+    """
+    rng = random.Random(seed)
+    names = [f"account_{i}" for i in range(20)]
+    changes = [CreateAccount(Account(name, 32 * 10**18)) for name in names]
+
+    for _ in range(count):
+        name = rng.choice(names)
+        change = rng.choice([AddBalance, RemoveBalance, IncrementAccountNonce, DecrementAccountNonce])
+
+        if change in [AddBalance, RemoveBalance]:
+            changes.append(change(name, rng.randint(1, 10**18)))
+        else:
+            changes.append(change(name))
+
+    changes.append(DeleteAccount(Account(names[0])))
+    changes.append(CreateAccount(Account(names[0], 1)))
+    changes.append(AddBalance(names[0], 1))
+
+    return changes
+
+
+def test_columnar_state_batch():
+    """
+        Test that a ColumnarState applies batches like a State
+    """
+    changes = _random_changes(1000, 1)
+    state = agr4bs.State()
+    columnar = agr4bs.ColumnarState()
+
+    state.apply_batch_state_change(changes)
+    columnar.apply_batch_state_change(changes)
+
+    assert sorted(columnar.account_names()) == sorted(state.account_names())
+
+    for name in state.account_names():
+        assert columnar.get_account_balance(name) == state.get_account_balance(name)
+        assert columnar.get_account_nonce(name) == state.get_account_nonce(name)
+
+    assert columnar.get_account_balance("account_0") == 2
+
+
+def test_columnar_state_unknown_account():
+    """
+        Test that a ColumnarState batch fails on an unknown account
+    """
+    columnar = agr4bs.ColumnarState()
+
+    with pytest.raises(ValueError):
+        columnar.apply_batch_state_change([AddBalance("unknown", 5)])
+
+
+def test_columnar_state_copy():
+    """
+        Test that the copies of a ColumnarState are overlays that
+        can be committed
+    """
+    columnar = agr4bs.ColumnarState()
+    columnar.apply_state_change(CreateAccount(Account("account", 10, storage={"key": "value"})))
+
+    overlay = columnar.copy()
+    overlay.apply_batch_state_change([RemoveBalance("account", 5), IncrementAccountNonce("account")])
+
+    assert columnar.get_account_balance("account") == 10
+    assert overlay.get_account_balance("account") == 5
+    assert overlay.get_account_storage_at("account", "key") == "value"
+
+    overlay.commit()
+
+    assert columnar.get_account_balance("account") == 5
+    assert columnar.get_account_nonce("account") == 1
+    assert columnar.view_account("account").get_storage_at("key") == "value"
@@ -0,0 +1,71 @@
+"""
+    Test suite for the PersistentMap class
+"""
+
+import pickle
+import random
+
+from agr4bs.state import PersistentMap
+
+
+class CollidingKey:
+
+    """
+        Key whose hash collides with the other keys of the same group
+    """
+
+    def __init__(self, name: str, group: int):
+        self.name = name
+        self.group = group
+
+    def __hash__(self) -> int:
+        return self.group
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CollidingKey) and self.name == other.name
+
+
+def test_persistent_map_operations():
+    """
+        Test that a PersistentMap behaves like a dict under random updates,
+        including colliding keys, and that its versions are left untouched
+    """
+    rng = random.Random(1)
+    keys = [f"key_{i}" for i in range(300)] + [CollidingKey(str(i), i % 3) for i in range(30)]
+    reference = {}
+    persistent_map = PersistentMap()
+    versions = []
+
+    for step in range(3000):
+        key = rng.choice(keys)
+
+        if rng.random() < 0.3:
+            reference.pop(key, None)
+            persistent_map = persistent_map.delete(key)
+        else:
+            reference[key] = step
+            persistent_map = persistent_map.set(key, step)
+
+        if step % 500 == 0:
+            versions.append((dict(reference), persistent_map))
+
+    assert len(persistent_map) == len(reference)
+    assert dict(persistent_map.items()) == reference
+
+    for key in keys:
+        assert (key in persistent_map) == (key in reference)
+        assert persistent_map.get(key) == reference.get(key)
+
+    for expected, version in versions:
+        assert dict(version.items()) == expected
+
+
+def test_persistent_map_pickle():
+    """
+        Test that a pickled PersistentMap is rebuilt with the same items
+    """
+    persistent_map = PersistentMap({f"key_{i}": i for i in range(100)})
+    loaded = pickle.loads(pickle.dumps(persistent_map))
+
+    assert dict(loaded.items()) == dict(persistent_map.items())
+    assert loaded["key_42"] == 42
@@ -0,0 +1,78 @@
+"""
+    Test suite for the SnapshotState class
+"""
+
+import pytest
+import agr4bs
+from agr4bs.state import Account, UpdateAccountStorage, MISSING
+from agr4bs.state.state_change import CreateAccount, AddBalance, IncrementAccountNonce
+
+
+def test_snapshot_state_restore():
+    """
+        Test that a SnapshotState is restored to its snapshots, which
+        are not affected by the later changes
+    """
+    state = agr4bs.SnapshotState()
+    state.apply_state_change(CreateAccount(Account("account", 10)))
+
+    first = state.snapshot()
+    state.apply_batch_state_change([AddBalance("account", 5), IncrementAccountNonce("account"),
+                                    CreateAccount(Account("other")),
+                                    UpdateAccountStorage("account", writes=[(("key",), MISSING, "value")])])
+
+    second = state.snapshot()
+    state.apply_state_change(AddBalance("account", 5))
+
+    state.restore(first)
+
+    assert state.get_account_balance("account") == 10
+    assert state.get_account_nonce("account") == 0
+    assert state.get_account_storage("account") == {}
+    assert state.has_account("other") is False
+    assert sorted(state.account_names()) == ["account", "genesis"]
+
+    state.restore(second)
+
+    assert state.get_account_balance("account") == 15
+    assert state.get_account_storage_at("account", "key") == "value"
+    assert state.has_account("other") is True
+
+
+def test_snapshot_state_restore_copies():
+    """
+        Test that restoring a snapshot invalidates the copies of the State
+    """
+    state = agr4bs.SnapshotState()
+    snapshot = state.snapshot()
+
+    overlay = state.copy()
+    state.apply_state_change(AddBalance("genesis", 1))
+    state.restore(snapshot)
+
+    with pytest.raises(ValueError):
+        overlay.get_account_balance("genesis")
+
+
+def test_snapshot_state_restored_accounts_are_copied():
+    """
+        Test that the Accounts of a restored snapshot are copied on
+        their first write, leaving the other snapshots untouched
+    """
+    state = agr4bs.SnapshotState()
+    state.apply_state_change(CreateAccount(Account("account", 10)))
+
+    first = state.snapshot()
+    state.apply_state_change(AddBalance("account", 5))
+    second = state.snapshot()
+
+    state.restore(first)
+    state.apply_state_change(AddBalance("account", 1))
+    state.restore(second)
+    state.apply_state_change(AddBalance("account", 2))
+
+    state.restore(first)
+    assert state.get_account_balance("account") == 10
+
+    state.restore(second)
+    assert state.get_account_balance("account") == 15
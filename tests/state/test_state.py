@@ -322,3 +322,78 @@ def test_state_get_account_internal_agent_no_account():
     state = agr4bs.State()
 
     assert state.get_account_internal_agent("new_account") is None
+
+
+def test_state_copy_overlay():
+    """
+        Test that a copied State records its changes without
+        modifying its parent until they are committed
+    """
+    state = agr4bs.State()
+    state.apply_state_change(CreateAccount(Account("account", 100)))
+    state.apply_state_change(CreateAccount(Account("deleted")))
+
+    overlay = state.copy()
+    overlay.apply_batch_state_change([RemoveBalance("account", 40), AddBalance("genesis", 40),
+                                      DeleteAccount(Account("deleted")), CreateAccount(Account("new"))])
+
+    assert overlay.get_account_balance("account") == 60
+    assert overlay.has_account("deleted") is False
+    assert sorted(overlay.account_names()) == ["account", "genesis", "new"]
+
+    assert state.get_account_balance("account") == 100
+    assert state.has_account("deleted") is True
+    assert state.has_account("new") is False
+
+    nested = overlay.copy()
+    nested.apply_state_change(RemoveBalance("account", 60))
+    nested.discard()
+
+    assert nested.get_account_balance("account") == 60
+
+    overlay.commit()
+
+    assert len(overlay.changes) == 0
+    assert state.get_account_balance("account") == 60
+    assert sorted(state.account_names()) == ["account", "genesis", "new"]
+    assert overlay.get_account_balance("account") == 60
+
+
+def test_state_copy_overlay_stale_parent():
+    """
+        Test that an overlay cannot be read once its parent was modified
+    """
+    state = agr4bs.State()
+    state.apply_state_change(CreateAccount(Account("account", 100)))
+
+    overlay = state.copy()
+    state.apply_state_change(AddBalance("account", 1))
+
+    with pytest.raises(ValueError):
+        overlay.get_account_balance("account")
+
+    with pytest.raises(ValueError):
+        state.commit()
+
+
+def test_state_view_account():
+    """
+        Test that a State returns read-only views of its Accounts
+        and copies of the values meant to be modified
+    """
+    state = agr4bs.State()
+    state.apply_state_change(CreateAccount(Account("account", 100, storage={"balances": {"a": 1}})))
+
+    view = state.view_account("account")
+
+    assert view.balance == 100
+    assert state.view_account("unknown") is None
+    assert state.has_account_internal_agent("account") is False
+
+    balances = state.get_account_storage_at("account", "balances")
+    balances["a"] = 2
+
+    assert view.get_storage_at("balances") == {"a": 1}
+
+    state.apply_state_change(AddBalance("account", 1))
+    assert view.balance == 101
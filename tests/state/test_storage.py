@@ -0,0 +1,93 @@
+"""
+    Test suite for the TrackedStorage class
+"""
+
+import pickle
+from collections import defaultdict
+
+import agr4bs
+from agr4bs.state import TrackedStorage, MISSING, UpdateAccountStorage
+from agr4bs.state.state_change import CreateAccount
+
+
+def _zero() -> int:
+    """
+        Default balance of the ledger
+    """
+    return 0
+
+
+def _allowance() -> defaultdict:
+    """
+        Default allowances of the ledger
+    """
+    return defaultdict(_zero)
+
+
+def _ledger() -> dict:
+    """
+        Build an ERC20 like storage
+    """
+    balances = defaultdict(_zero, {"alice": 10, "bob": 5})
+    allowances = defaultdict(_allowance)
+
+    return {"name": "token", "balances": balances, "allowances": allowances}
+
+
+def test_tracked_storage_writes():
+    """
+        Test that a TrackedStorage records the writes made to the nested
+        dicts without modifying the tracked storage
+    """
+    storage = _ledger()
+    tracked = TrackedStorage(storage)
+
+    balances = tracked["balances"]
+    balances["alice"] -= 3
+    balances["carol"] += 3
+    tracked["allowances"]["alice"]["bob"] += 2
+    del tracked["name"]
+
+    assert tracked.writes == [
+        (("balances", "alice"), 10, 7),
+        (("balances", "carol"), MISSING, 0),
+        (("balances", "carol"), 0, 3),
+        (("allowances", "alice"), MISSING, {}),
+        (("allowances", "alice", "bob"), MISSING, 0),
+        (("allowances", "alice", "bob"), 0, 2),
+        (("name",), "token", MISSING),
+    ]
+
+    assert storage == _ledger()
+    assert tracked.value["balances"] == {"alice": 7, "bob": 5, "carol": 3}
+    assert tracked.get("name") is None
+
+
+def test_tracked_storage_update():
+    """
+        Test that an UpdateAccountStorage built from a write set is applied
+        and reverted exactly, and survives pickling
+    """
+    state = agr4bs.State()
+    state.apply_state_change(CreateAccount(agr4bs.Account("token")))
+    state.apply_state_change(UpdateAccountStorage("token", writes=[((key,), MISSING, value)
+                                                                  for key, value in _ledger().items()]))
+
+    storage = state.get_tracked_storage("token")
+    storage["balances"]["alice"] -= 4
+    storage["balances"]["dave"] = 4
+    storage["allowances"]["alice"]["bob"] = 1
+
+    change = pickle.loads(pickle.dumps(UpdateAccountStorage("token", writes=storage.freeze())))
+    before = state.view_account("token").storage["balances"]
+
+    state.apply_state_change(change)
+
+    assert state.get_account_storage_at("token", "balances") == {"alice": 6, "bob": 5, "dave": 4}
+    assert state.get_account_storage_at("token", "allowances") == {"alice": {"bob": 1}}
+    assert before == {"alice": 10, "bob": 5}
+
+    state.apply_state_change(change.revert())
+
+    assert state.get_account_storage_at("token", "balances") == {"alice": 10, "bob": 5}
+    assert state.get_account_storage_at("token", "allowances") == {}